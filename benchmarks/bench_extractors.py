@@ -0,0 +1,207 @@
+# Built-in Packages
+import argparse
+from functools import partial
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Get the current script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(script_dir))
+sys.path.append(os.path.join(os.path.dirname(script_dir), "src"))
+
+# Local Packages
+from utilities.constants import constants as const
+from navigation_menu import get_ford_dealer_nav_prices, get_ford_mfg_nav_prices
+from vehicle_extraction import (
+    SITE_ERROR_LABELS,
+    VEHICLE_SPECS,
+    get_hero_image,
+    get_prices,
+)
+from classes.http_fetcher import HttpFetcher
+from classes.page_readiness import PageReadiness
+from classes.snapshot_store import SnapshotStore
+from classes.web_driver_pool import WebDriverPool
+
+DEFAULT_FIXTURES = os.path.join(script_dir, "fixtures")
+DEFAULT_BASELINE = os.path.join(script_dir, "baseline.json")
+
+
+# ------------------------------------------------------------
+# Extractors to benchmark, as (name, url, extractor) - the same
+# functions and URL's main.py scrapes
+# ------------------------------------------------------------
+def get_extractors() -> List[Tuple[str, str, Callable[[str], list]]]:
+    extractors = [
+        ("NAVIGATION manufacturer prices", const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"], get_ford_mfg_nav_prices),
+        ("NAVIGATION dealer prices", const["MAIN_NAVIGATION_MENU_DEALER_URL"], get_ford_dealer_nav_prices),
+    ]
+
+    for spec in VEHICLE_SPECS:
+        key = spec["key"]
+        for site, url_prefix in (("manufacturer", "MANUFACTURER"), ("dealer", "DEALER")):
+            extractors.append(
+                (f"{key} {site} prices", const[f"{key}_{url_prefix}_URL"], partial(get_prices, spec, site))
+            )
+            extractors.append(
+                (f"{key} {site} hero image", const[f"{key}_{url_prefix}_IMAGE_URL"], partial(get_hero_image, spec, site))
+            )
+
+    return extractors
+
+
+# ------------------------------------------------------------
+# Run one extractor from a cold page: every call loads the
+# snapshot and parses it again, like a page load in a live run
+# ------------------------------------------------------------
+def run_cold(extractor: Callable[[str], list], url: str):
+    HttpFetcher.clear()
+    PageReadiness.clear()
+    WebDriverPool.get_driver().loaded_url = None
+    return extractor(url)
+
+
+def is_error(result) -> bool:
+    labels = set(SITE_ERROR_LABELS.values()) | {"No image filename found"}
+    if isinstance(result, str):
+        return result in labels or result.startswith("Message:")
+    return any(row and row[0] in labels for row in result)
+
+
+def measure(
+    extractor: Callable[[str], list], url: str, iterations: int, warmup: int
+) -> Dict[str, float]:
+    for _ in range(warmup):
+        result = run_cold(extractor, url)
+
+    durations = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        result = run_cold(extractor, url)
+        durations.append(time.perf_counter() - start_time)
+
+    percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+    return {
+        "iterations": iterations,
+        "mean_ms": statistics.fmean(durations) * 1000,
+        "p50_ms": percentiles[49] * 1000,
+        "p90_ms": percentiles[89] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "per_second": iterations / sum(durations),
+        "error": is_error(result),
+    }
+
+
+# ------------------------------------------------------------
+# Compare with the baseline - a regression is a p50 slower than
+# the baseline p50 by more than the baseline tolerance
+# ------------------------------------------------------------
+def find_regressions(results: Dict[str, dict], baseline: dict) -> List[str]:
+    tolerance = baseline.get("tolerance", 0.25)
+    regressions = []
+    for name, baseline_result in baseline.get("extractors", {}).items():
+        result = results.get(name)
+        if result is None:
+            continue
+        limit_ms = baseline_result["p50_ms"] * (1 + tolerance)
+        if result["p50_ms"] > limit_ms:
+            regressions.append(
+                f"{name}: p50 {result['p50_ms']:.2f} ms > {limit_ms:.2f} ms "
+                f"(baseline {baseline_result['p50_ms']:.2f} ms + {tolerance:.0%})"
+            )
+    return regressions
+
+
+def print_table(results: Dict[str, dict], baseline: dict) -> None:
+    baseline_extractors = baseline.get("extractors", {})
+    print(
+        f"{'Extractor':<46}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+        f"{'calls/s':>10}{'base p50':>10}"
+    )
+    for name, result in results.items():
+        base_p50 = baseline_extractors.get(name, {}).get("p50_ms")
+        print(
+            f"{name:<46}{result['p50_ms']:>10.2f}{result['p90_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['per_second']:>10.1f}"
+            f"{(f'{base_p50:.2f}' if base_p50 is not None else '-'):>10}"
+            f"{'  ERROR' if result['error'] else ''}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the price and hero image extractors on recorded pages."
+    )
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="A recorded run directory (RUN_MODE = record)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file to compare with")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--filter", default="", help="Only extractors whose name contains this text")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Save the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    # The extractors log every page at INFO, which would drown the results
+    logging.getLogger().setLevel(logging.WARNING)
+
+    # Replay the fixtures: no browser, no network, no rate limits
+    fixtures = os.path.abspath(args.fixtures)
+    if not os.path.isfile(os.path.join(fixtures, "index.json")):
+        print(
+            f"No recorded run in {fixtures}. Record one with RUN_MODE = \"record\" "
+            "and copy its directory from SNAPSHOT_DIR."
+        )
+        return 2
+
+    const["RUN_MODE"] = "replay"
+    const["SNAPSHOT_DIR"] = os.path.dirname(fixtures)
+    const["REPLAY_RUN"] = os.path.basename(fixtures)
+    SnapshotStore.start()
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    results = {}
+    try:
+        for name, url, extractor in get_extractors():
+            if args.filter.lower() not in name.lower():
+                continue
+            if not SnapshotStore.has_snapshot(url):
+                print(f"No fixture for {name}: {url}")
+                continue
+            results[name] = measure(extractor, url, args.iterations, args.warmup)
+    finally:
+        WebDriverPool.close_all()
+
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        baseline["extractors"] = {
+            name: {"p50_ms": round(result["p50_ms"], 3), "p90_ms": round(result["p90_ms"], 3)}
+            for name, result in results.items()
+        }
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+            file.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+# Built-in Packages
+import argparse
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Get the current script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(script_dir))
+sys.path.append(os.path.join(os.path.dirname(script_dir), "src"))
+
+# Local Packages
+from utilities.constants import constants as const
+from utilities.vehicle_specs import (
+    DEALER_LI_MODEL,
+    DEALER_LIST_MODEL,
+    DEALER_OWL_MODEL,
+    DEALER_ROW_IMAGE,
+    MFG_BILLBOARD_IMAGE,
+    MFG_BRI_MODEL,
+    MFG_CHECKBOX_MODEL,
+    MFG_COMPONENT_IMAGE,
+    MFG_DIV_IMAGE,
+    MFG_MODEL_NAME,
+    MFG_TITLE_ONE_MODEL,
+    MFG_TITLE_THREE_MODEL,
+    VEHICLE_SPECS,
+)
+
+SITE_ORIGINS = {
+    "manufacturer": "https://www.ford.ca",
+    "dealer": "https://fordtodealers.ca",
+}
+
+TRIMS = [
+    "BASE", "XL", "XLT", "STX", "LARIAT", "KING RANCH", "PLATINUM",
+    "LIMITED", "TREMOR", "RAPTOR", "SPORT", "ACTIVE", "ST-LINE", "TIMBERLINE",
+]
+
+NAV_CATEGORIES = {
+    "SUVs": ["BRONCO", "BRONCO SPORT", "ESCAPE", "EXPLORER", "EXPEDITION"],
+    "Trucks": ["F-150", "MAVERICK", "RANGER", "SUPER DUTY"],
+    "Electrified": ["MUSTANG MACH-E", "F-150 LIGHTNING", "E-TRANSIT"],
+    "Cars": ["MUSTANG"],
+}
+
+# ----------------------------------------------------------------------
+# Page behaviour, like the real sites
+# - bds carousels and owl dots show one slide at a time; the others are
+#   display: none, so their text reads as empty
+# - The next button pages through the cards and is disabled on the last
+# - Navigation flyouts only show their vehicles once opened (PAGE_STYLE)
+# - [data-nested-price] elements are built by script, since a <p> inside
+#   a <p> can't be written in HTML
+# ----------------------------------------------------------------------
+PAGE_STYLE = """
+div[data-segment-panel]:not(.open) { display: none; }
+li[data-segment-panel]:not(.mega-toggle-on) > ul { display: none; }
+"""
+
+PAGE_SCRIPT = """
+function showSlide(carousel, index) {
+  carousel.querySelectorAll("[data-slide]").forEach((slide, i) => {
+    slide.style.display = i === index ? "" : "none";
+  });
+  carousel.querySelectorAll("[data-indicator]").forEach((indicator, i) => {
+    indicator.classList.toggle("active", i === index);
+  });
+}
+
+document.querySelectorAll("[data-carousel]").forEach((carousel) => {
+  carousel.querySelectorAll("[data-indicator]").forEach((indicator, i) => {
+    indicator.addEventListener("click", () => setTimeout(() => showSlide(carousel, i), 50));
+  });
+  const next = carousel.querySelector("[data-next]");
+  if (next) {
+    let page = 0;
+    const pages = carousel.querySelectorAll("[data-slide]").length;
+    next.addEventListener("click", () => {
+      page = Math.min(page + 1, pages - 1);
+      showSlide(carousel, page);
+      next.classList.toggle("disabled", page === pages - 1);
+    });
+  }
+  showSlide(carousel, 0);
+});
+
+document.querySelectorAll("[data-nested-price]").forEach((holder) => {
+  const price = document.createElement("p");
+  price.textContent = holder.dataset.nestedPrice;
+  holder.appendChild(price);
+});
+
+document.querySelectorAll("[data-flyout-toggle]").forEach((toggle) => {
+  toggle.addEventListener("click", () => {
+    document.getElementById(toggle.dataset.flyoutToggle).style.display = "";
+  });
+});
+
+document.querySelectorAll("[data-segment]").forEach((button) => {
+  button.addEventListener("click", () => setTimeout(() => {
+    document.querySelectorAll("[data-segment-panel]").forEach((panel) => {
+      const open = panel.dataset.segmentPanel === button.dataset.segment;
+      panel.className = panel.dataset.baseClass + (open ? " " + panel.dataset.openClass : "");
+    });
+  }, 100));
+});
+"""
+
+
+# ------------------------------------------------------------
+# Vehicle data - the same for every run of a given seed
+# ------------------------------------------------------------
+def get_vehicle_rows(page_url: str, seed: int, mismatch_rate: float) -> List[Tuple[str, str, str]]:
+    """(trim, manufacturer price, dealer price) rows of a vehicle."""
+    rng = random.Random(f"{seed}-{page_url}")
+    rows = []
+    price = rng.randrange(30000, 70000, 500)
+    for trim in rng.sample(TRIMS, rng.randint(3, 6)):
+        dealer_price = price
+        if rng.random() < mismatch_rate:
+            dealer_price = price + rng.choice([-1000, -500, 500, 1000])
+        rows.append((trim, f"${price - 5:,}", f"${dealer_price - 5:,}"))
+        price += rng.randrange(2500, 12000, 500)
+    return rows
+
+
+def get_nav_rows(seed: int, mismatch_rate: float) -> Dict[str, List[Tuple[str, str, str]]]:
+    rng = random.Random(f"{seed}-navigation")
+    categories = {}
+    for category, models in NAV_CATEGORIES.items():
+        rows = []
+        for model in models:
+            price = rng.randrange(30000, 90000, 500)
+            dealer_price = price + (500 if rng.random() < mismatch_rate else 0)
+            rows.append((model, f"${price - 5:,}", f"${dealer_price - 5:,}"))
+        categories[category] = rows
+    return categories
+
+
+# ------------------------------------------------------------
+# Markup per locator shape of vehicle_specs.py
+# ------------------------------------------------------------
+def carousel(slides: List[str], indicators: str) -> str:
+    return (
+        "<section data-carousel>"
+        + "".join(f"<div data-slide>{slide}</div>" for slide in slides)
+        + indicators
+        + "</section>"
+    )
+
+
+def chunk(items: List[str], size: int) -> List[str]:
+    return ["".join(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def render_prices(spec: dict, site: str, rows: List[Tuple[str, str, str]]) -> str:
+    prices_spec = spec[site]["prices"]
+    model_xpath = prices_spec.get("card_xpath") or prices_spec["model_xpath"]
+    strategy = prices_spec["strategy"]
+    items = []
+
+    for trim, mfg_price, dealer_price in rows:
+        price = escape(mfg_price if site == "manufacturer" else dealer_price)
+        model = escape(trim)
+
+        if model_xpath == MFG_MODEL_NAME:
+            # The spec strips a name prefix, the price parser a "Starting at " label and a footnote
+            prefix = escape(next(iter(prices_spec.get("model_replace", {})), ""))
+            label = "Starting at "
+            footnote = " 1"
+            items.append(
+                f'<div class="modelDetails matchItem"><h3 class="modelName">{prefix}{model}</h3>'
+                f'<p class="modelPrice"><span data-pricing-trimmsrp="1" '
+                f'data-nested-price="{label}{price}{footnote}"></span></p></div>'
+            )
+        elif model_xpath == MFG_CHECKBOX_MODEL:
+            items.append(
+                f"<div><a class='to-checkbox fgx-lnc-btm-brdr-hover'>{model}</a>"
+                f'<span class="make-info price bri-txt body-three ff-b">'
+                f'<span data-pricing-template="{{price}}">{price}</span></span></div>'
+            )
+        elif model_xpath == MFG_BRI_MODEL:
+            items.append(
+                f"<div><div class='bri-txt generic-title-one ff-b'>{model}</div>"
+                f'<div class="bri-txt body-one ff-b">{price}</div></div>'
+            )
+        elif model_xpath in (MFG_TITLE_ONE_MODEL, MFG_TITLE_THREE_MODEL):
+            title_class = (
+                "fgx-brand-ds to-fade-in generic-title-one ff-d"
+                if model_xpath == MFG_TITLE_ONE_MODEL
+                else "fgx-brand-ds to-fade-in title-three ff-d"
+            )
+            items.append(
+                f"<div><h2 class='{title_class}'>{model}</h2>"
+                f'<span class="price">{price}</span></div>'
+            )
+        elif model_xpath == DEALER_OWL_MODEL:
+            items.append(
+                f"<div class='item'><h3 class='modelChecker'>{model}</h3>"
+                f"<span class='priceChecker'>{price}</span></div>"
+            )
+        elif model_xpath == DEALER_LIST_MODEL:
+            items.append(f"<li><a><span>{model}<br><label>{price}</label></span></a></li>")
+        elif model_xpath == DEALER_LI_MODEL:
+            items.append(f"<p><span class='modelCheckerLi'>{model}<br><label>{price}</label></span></p>")
+        else:
+            raise ValueError(f"No stand-in markup for {spec['key']} {site}: {model_xpath}")
+
+    if model_xpath == DEALER_LIST_MODEL:
+        return f"<div class='modelChecker'><div><ul>{''.join(items)}</ul></div></div>"
+
+    if strategy == "bds_carousel":
+        slides = chunk(items, 2)
+        indicators = "".join(f"<li data-indicator>{i + 1}</li>" for i in range(len(slides)))
+        return carousel(
+            slides,
+            f"<ol class='bds-carousel-indicators global-indicators to-fade-in  scrollable'>{indicators}</ol>",
+        )
+
+    if strategy == "owl_dots":
+        slides = chunk(items, 2)
+        dots = "".join(
+            f"<button class='owl-dot' data-indicator><span></span></button>" for _ in slides
+        )
+        return carousel(slides, f"<div class='owl-dots'>{dots}</div>")
+
+    if strategy == "next_button":
+        return (
+            '<div id="component04">'
+            + carousel(
+                chunk(items, 3),
+                '<button class="fgx-btn to-fade-in carousel-btn carousel-arrow carousel-next scrollable" data-next>Next</button>',
+            )
+            + "</div>"
+        )
+
+    return "".join(items)
+
+
+def render_hero_image(spec: dict, site: str) -> str:
+    image_spec = spec[site]["hero_image"]
+    file_name = f"{spec['key'].lower().replace('_', '-')}-hero"
+
+    if image_spec["xpath"] == MFG_COMPONENT_IMAGE:
+        return f'<div id="component01"><picture><img src="/content/dam/{file_name}.jpg"></picture></div>'
+    if image_spec["xpath"] in (MFG_BILLBOARD_IMAGE, '//div[contains(@class,"billboard-img")]//picture/img'):
+        return f'<div class="billboard-img"><picture><img src="/content/dam/{file_name}.jpg"></picture></div>'
+    if image_spec["xpath"] == MFG_DIV_IMAGE:
+        return f'<div class="image "><picture><img src="/content/dam/{file_name}.jpg"></picture></div>'
+    if image_spec["xpath"] == DEALER_ROW_IMAGE:
+        return (
+            f'<div class="row-bg using-image" '
+            f'style="background-image: url(/wp-content/uploads/{file_name}.jpg);"></div>'
+        )
+    if "nectar-video-bg" in image_spec["xpath"]:
+        return f'<video class="nectar-video-bg"><source src="/wp-content/uploads/{file_name}.mp4"></video>'
+
+    raise ValueError(f"No stand-in markup for the {spec['key']} {site} hero image")
+
+
+# ------------------------------------------------------------
+# Navigation menus
+# ------------------------------------------------------------
+def render_mfg_nav(categories: Dict[str, List[Tuple[str, str, str]]]) -> str:
+    buttons, panels = [], []
+    for index, (category, rows) in enumerate(categories.items()):
+        buttons.append(
+            f'<button class="bri-nav__list-link segment-anchor-trigger fgx-btn" data-segment="{index}">'
+            f"<span class='link-text'>{escape(category)}</span></button>"
+        )
+        vehicles = "".join(
+            f"<div><a class='veh-item-inline'>{escape(model.title())}®</a>"
+            f"<span data-pricing-template='price'>{escape(mfg_price)}</span></div>"
+            for model, mfg_price, _ in rows
+        )
+        panels.append(
+            f'<div class="vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container" '
+            f'data-segment-panel="{index}" '
+            f'data-base-class="vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container" '
+            f'data-open-class="open">{vehicles}</div>'
+        )
+
+    return (
+        "<nav><ul><li class='main-nav-item no-float-md flyout-item-wrap'>"
+        "<button data-flyout-toggle='flyout'>Vehicles</button></li></ul>"
+        f"<div id='flyout' style='display: none'>{''.join(buttons)}{''.join(panels)}</div></nav>"
+    )
+
+
+def render_dealer_nav(categories: Dict[str, List[Tuple[str, str, str]]]) -> str:
+    menu_class = (
+        "mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom "
+        "mega-menu-item-has-children mega-menu-megamenu mega-menu-grid"
+    )
+    items = []
+    for index, (category, rows) in enumerate(categories.items()):
+        vehicles = "".join(
+            f"<li class='mega-menu-column'><p class='vehicle-top'><span class='vehicle-name'>"
+            f"<a>{escape(model)}</a></span></p><p class='vehicle-bottom'><span class='vprice'>"
+            f"<span>{escape(dealer_price)}</span></span></p></li>"
+            for model, _, dealer_price in rows
+        )
+        items.append(
+            f'<li class="{menu_class}" data-segment-panel="{index}" data-base-class="{menu_class}" '
+            f'data-open-class="mega-toggle-on"><a class="mega-menu-link sf-with-ul" data-segment="{index}">'
+            f"{escape(category)}</a><ul>{vehicles}</ul></li>"
+        )
+
+    return (
+        "<nav><ul><li class='mega-menu-item mega-menu-flyout'>"
+        "<a class='mega-menu-link sf-with-ul' data-flyout-toggle='flyout'>Vehicles</a></li></ul>"
+        f"<ul id='flyout' style='display: none'>{''.join(items)}</ul></nav>"
+    )
+
+
+# ------------------------------------------------------------
+# Pages by site URL - a URL shared by several specs holds the
+# sections of all of them, like the real shared pages
+# ------------------------------------------------------------
+def build_pages(seed: int, mismatch_rate: float) -> Dict[str, str]:
+    sections: Dict[str, List[str]] = {}
+    rendered = set()
+
+    def add(url: str, part: str, render) -> None:
+        # Vehicles sharing a URL read the same page section
+        if (url, part) not in rendered:
+            rendered.add((url, part))
+            sections.setdefault(url, []).append(render())
+
+    nav_rows = get_nav_rows(seed, mismatch_rate)
+    add(const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"], "nav", lambda: render_mfg_nav(nav_rows))
+    add(const["MAIN_NAVIGATION_MENU_DEALER_URL"], "nav", lambda: render_dealer_nav(nav_rows))
+
+    for spec in VEHICLE_SPECS:
+        key = spec["key"]
+        # Seeded by the dealer page, so vehicles sharing it get the same models
+        rows = get_vehicle_rows(const[f"{key}_DEALER_URL"], seed, mismatch_rate)
+        for site, url_prefix in (("manufacturer", "MANUFACTURER"), ("dealer", "DEALER")):
+            add(
+                const[f"{key}_{url_prefix}_URL"],
+                "prices",
+                lambda: render_prices(spec, site, rows),
+            )
+            add(
+                const[f"{key}_{url_prefix}_IMAGE_URL"],
+                "hero_image",
+                lambda: render_hero_image(spec, site),
+            )
+
+    return {
+        normalize_url(url): (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Stand-in</title>"
+            f"<style>{PAGE_STYLE}</style></head>"
+            f"<body>{''.join(page_sections)}<script>{PAGE_SCRIPT}</script></body></html>"
+        )
+        for url, page_sections in sections.items()
+    }
+
+
+def normalize_url(url: str) -> str:
+    path, _, query = url.partition("?")
+    return path.rstrip("/") + (f"?{query}" if query else "")
+
+
+def get_overrides(port: int) -> Dict[str, str]:
+    return {
+        origin: f"http://localhost:{port}/{origin.split('://', 1)[1]}"
+        for origin in SITE_ORIGINS.values()
+    }
+
+
+# ------------------------------------------------------------
+# HTTP server - requests are /<site host>/<site path>
+# ------------------------------------------------------------
+class StandInHandler(BaseHTTPRequestHandler):
+    pages: Dict[str, str] = {}
+    latency = 0.0
+    jitter = 0.0
+
+    def do_GET(self) -> None:
+        host, _, path = self.path.lstrip("/").partition("/")
+        page = self.pages.get(normalize_url(f"https://{host}/{path}"))
+
+        if page is None:
+            self.send_error(404)
+            return
+
+        # Simulated server time, like a real page load
+        time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        body = page.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logging.info(f"{self.address_string()} {format % args}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve stand-in ford.ca and fordtodealers.ca pages for the URL's in constants.py."
+    )
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds added to every page response")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Random +/- seconds around the latency")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the models and prices")
+    parser.add_argument("--mismatch-rate", type=float, default=0.1, help="Share of dealer prices that differ")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+    StandInHandler.pages = build_pages(args.seed, args.mismatch_rate)
+    StandInHandler.latency = args.latency
+    StandInHandler.jitter = args.jitter
+
+    print(f"Serving {len(StandInHandler.pages)} pages on http://localhost:{args.port}")
+    print("Set SITE_URL_OVERRIDES in constants.py to:")
+    print(json.dumps(get_overrides(args.port), indent=4))
+
+    server = ThreadingHTTPServer(("", args.port), StandInHandler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
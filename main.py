@@ -6,43 +6,44 @@ from pandas.io.formats.style import Styler
 
 # Built-in Packages
 import datetime
+from functools import partial
 import logging
 from logging.handlers import RotatingFileHandler
 import time
-from typing import Callable
+from typing import Callable, List, Optional, Tuple
 import sys
 import os
 
+# Add the src directory to sys.path, for the classes and utilities packages
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
 # Local Packages
-from src.bronco_vehicles import *
-from src.bronco_sport_vehicles import *
-from src.chassis_cab_vehicles import *
 from src.utilities.constants import constants as const
-from src.e_series_cutaway_vehicles import *
-from src.e_series_stripped_chassis_vehicles import *
-from src.e_transit_vehicles import *
-from src.edge_vehicles import *
-from src.escape_vehicles import *
-from src.explorer_vehicles import *
-from src.expedition_vehicles import *
-from src.f_series_stripped_chassis_vehicles import *
-from src.f150_vehicles import *
-from src.f150_commercial_vehicles import *
-from src.f150_lightening_vehicles import *
-from src.f650_f750_vehicles import *
-from src.maverick_vehicles import *
-from src.mustang_vehicles import *
-from src.mustang_mach_e_vehicles import *
-from src.ranger_vehicles import *
-from src.super_duty_vehicles import *
-from src.super_duty_commercial_vehicles import *
-from src.transit_vehicles import *
-from src.transit_cc_ca_vehicles import *
-from src.transit_commercial_vehicles import *
-from src.transit_connect_vehicles import *
-from src.transit_connect_commercial_vehicles import *
 from src.navigation_menu import *
+from src.vehicle_extraction import (
+    SITE_ERROR_LABELS,
+    VEHICLE_SPECS,
+    compile_locators,
+    get_hero_image_url,
+    get_prices,
+)
 from src.utilities.utilities import *
+from src.utilities.price_comparison import compare_vehicle_prices, get_vehicle_report_frames
+# Same module objects the extractors use, so the run state is shared
+from classes.fingerprint_store import FingerprintStore
+from classes.host_scheduler import HostScheduler
+from classes.http_fetcher import HttpFetcher
+from classes.image_comparator import ImageComparator
+from classes.metrics import Metrics
+from classes.page_cache import PageCache
+from classes.page_readiness import PageReadiness
+from classes.price_history import PriceHistory
+from classes.report_renderer import ReportRenderer
+from classes.result_collector import ResultCollector
+from classes.site_health import SiteHealth
+from classes.snapshot_store import SnapshotStore
+from classes.tracer import Tracer
+from classes.web_driver_pool import WebDriverPool
 
 # Load environment variables from the .env file
 load_dotenv(override=True)
@@ -63,7 +64,6 @@ receiver_email = EMAIL_RECIEVER
 bcc_email = EMAIL_BCC
 password = EMAIL_PASSWORD
 vehicles_list_html = []
-all_model_images_df = pd.DataFrame()
 
 
 # Configure logging
@@ -78,7 +78,49 @@ logging.basicConfig(
 )
 
 
+# Run a scraping function with a browser checked out of the pool
+# - The browser is only started if the function actually scrapes a page
+def run_with_driver(func: Callable, *args):
+    with WebDriverPool.checkout():
+        return func(*args)
+
+
+# Process Navigation data
+def get_navigation_data() -> Optional[pd.DataFrame]:
+
+    if const["NAVIGATION_SKIP_FLAG"] == False:
+
+        logging.info("Navigation pricing started...")
+
+        func_start_time = start_timer()
+
+        # Capture Prices - a site that is down leaves the section out of the report
+        try:
+            nav_prices_df = create_navigation_prices_df(
+                const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"],
+                const["MAIN_NAVIGATION_MENU_DEALER_URL"],
+            )
+        except Exception as e:
+            SiteHealth.record_skip("NAVIGATION MENU", "navigation prices", str(e))
+            return None
+
+        logging.info("Navigation pricing completed.")
+        logging.info(f"Navigation data shape: {nav_prices_df.shape}")
+
+        print_elapsed_time(func_start_time, "Navigation pricing completed time")
+        print_elapsed_time(start_time, "Elapased Time")
+
+        return nav_prices_df
+
+    logging.info("NAVIGATION SKIP FLAG is set to 'true'. Skipping NAVIGATION pricing.")
+    return None
+
+
 # Process Vehicle data
+# - Runs on a browser worker thread, so it returns its results instead of
+#   appending to the shared report lists. main() rebuilds them in task order.
+# - Returns the scraped pairs; main() compares every vehicle at once.
+# - The hero image record goes to ResultCollector.
 def get_vehicle_data(
     vehicle_name: str,
     vehicle_skip_flag: str,
@@ -91,8 +133,7 @@ def get_vehicle_data(
     dealer_price_url: str,
     mfg_image_url: str,
     dealer_image_url: str,
-) -> None:
-    global all_model_images_df
+) -> Optional[Tuple[str, list, list, str, str, str]]:
 
     if vehicle_skip_flag == False:
         logging.info(f"{vehicle_name} pricing scraping started...")
@@ -101,11 +142,13 @@ def get_vehicle_data(
 
         try:
           # Capture Prices
-          vehicle_prices_df = create_vehicle_prices_df(
+          vehicle_mfr_prices, vehicle_dealer_prices = get_vehicle_prices(
               mfg_prices_func, dealer_prices_func, mfg_price_url, dealer_price_url
           )
-          logging.info(f"{vehicle_name} pricing data shape: {vehicle_prices_df.shape}")
-          logging.debug(f"{vehicle_name} pricing data preview:\n{vehicle_prices_df.head()}")
+          logging.info(
+              f"{vehicle_name} pricing rows: {len(vehicle_mfr_prices)} manufacturer, "
+              f"{len(vehicle_dealer_prices)} dealer"
+          )
 
           logging.info(f"{vehicle_name} pricing scraping completed.")
 
@@ -114,28 +157,17 @@ def get_vehicle_data(
               logging.info(f"{vehicle_name} image scraping started...")
 
               # Capture Hero Images
-              vehicle_image_df = create_vehicle_image_df(
+              vehicle_image_record = add_vehicle_image_record(
                   mfg_image_func,
                   dealer_image_func,
                   vehicle_name,
                   mfg_image_url,
                   dealer_image_url,
               )
-              logging.info(f"{vehicle_name} image data shape: {vehicle_image_df.shape}")
-              logging.debug(f"{vehicle_name} image data preview:\n{vehicle_image_df.head()}")
-
-              # Append Images to single data frame
-              all_model_images_df = pd.concat(
-                  [all_model_images_df, vehicle_image_df], ignore_index=True
-              )
+              logging.info(f"{vehicle_name} image comparison: {vehicle_image_record['Image Comparison']}")
 
               logging.info(f"{vehicle_name} image scraping completed.")
 
-          # Append Prices to single list
-          vehicles_list_html.append(
-              (vehicle_name, vehicle_prices_df, mfg_image_url, dealer_image_url)
-          )
-
           print_elapsed_time(
               func_start_time,
               f"{vehicle_name} pricing {'and image ' if not vehicle_image_skip_flag else ''}scraping completed time",
@@ -143,414 +175,244 @@ def get_vehicle_data(
           print_elapsed_time(start_time, "Elapased Time")
           logging.info(f"{vehicle_name} processing completed successfully.")
 
+          return (
+              vehicle_name,
+              vehicle_mfr_prices,
+              vehicle_dealer_prices,
+              mfg_image_url,
+              dealer_image_url,
+              get_unchanged_note(mfg_price_url, dealer_price_url),
+          )
+
         except Exception as e:
           logging.error(f"Error processing {vehicle_name}: {e}", exc_info=True)
+          SiteHealth.record_skip(vehicle_name, "report", str(e))
 
     else:
         logging.info(
             f"{vehicle_name} SKIP FLAG is set to 'true'. Skipping {vehicle_name} pricing."
         )
 
+    return None
+
+
+# Vehicle tasks in report order - each entry holds the arguments of get_vehicle_data
+# - Built from VEHICLE_SPECS; the URL's and skip flags come from constants.py
+VEHICLE_TASKS = [
+    (
+        spec["name"],
+        const[f"{spec['key']}_SKIP_FLAG"],
+        const["EMAIL_IMG_COMPARISON_SKIP"],
+        partial(get_prices, spec, "manufacturer"),
+        partial(get_prices, spec, "dealer"),
+        partial(get_hero_image_url, spec, "manufacturer"),
+        partial(get_hero_image_url, spec, "dealer"),
+        const[f"{spec['key']}_MANUFACTURER_URL"],
+        const[f"{spec['key']}_DEALER_URL"],
+        const[f"{spec['key']}_MANUFACTURER_IMAGE_URL"],
+        const[f"{spec['key']}_DEALER_IMAGE_URL"],
+    )
+    for spec in VEHICLE_SPECS
+]
+
+
+# Process one vehicle on a browser checked out of the pool
+def run_vehicle_task(task: tuple) -> Optional[Tuple[str, list, list, str, str, str]]:
+    with Tracer.span(task[0], "vehicle"):
+        return run_with_driver(get_vehicle_data, *task)
+
+
+# Scrape every page of one site for one vehicle on the same browser
+# - The results land in PageCache, so the report steps below reuse them and
+#   the hero image extractor reuses the page the price extractor loaded
+def prefetch_site(
+    name: str, extractions: List[Tuple[str, str, Callable]]
+) -> None:
+    with Tracer.span(name, "site"), WebDriverPool.checkout():
+        for kind, url, func in extractions:
+            PageCache.extract(kind, url, func)
+
+
+# Site-level jobs for HostScheduler, as (url, job) pairs
+def get_site_jobs() -> List[Tuple[str, Callable[[], None]]]:
+    site_jobs = []
+
+    if const["NAVIGATION_SKIP_FLAG"] == False:
+        for name, url, func in (
+            ("NAVIGATION manufacturer", const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"], get_ford_mfg_nav_prices),
+            ("NAVIGATION dealer", const["MAIN_NAVIGATION_MENU_DEALER_URL"], get_ford_dealer_nav_prices),
+        ):
+            site_jobs.append(
+                (url, partial(prefetch_site, name, [("nav_prices", url, func)]))
+            )
+
+    for (
+        vehicle_name,
+        vehicle_skip_flag,
+        vehicle_image_skip_flag,
+        mfg_prices_func,
+        dealer_prices_func,
+        mfg_image_func,
+        dealer_image_func,
+        mfg_price_url,
+        dealer_price_url,
+        mfg_image_url,
+        dealer_image_url,
+    ) in VEHICLE_TASKS:
+        if vehicle_skip_flag:
+            continue
+
+        for site, price_url, price_func, image_url, image_func in (
+            ("manufacturer", mfg_price_url, mfg_prices_func, mfg_image_url, mfg_image_func),
+            ("dealer", dealer_price_url, dealer_prices_func, dealer_image_url, dealer_image_func),
+        ):
+            extractions = [("prices", price_url, price_func)]
+            if vehicle_image_skip_flag == False:
+                extractions.append(("hero_img", image_url, image_func))
+            site_jobs.append(
+                (price_url, partial(prefetch_site, f"{vehicle_name} {site}", extractions))
+            )
+
+    return site_jobs
+
 
 def main():
     try:
         logging.info("Application started.")
-        
-        # ---------------------------------
-        # Get Navigation Data
-        # ---------------------------------
-
-        if const["NAVIGATION_SKIP_FLAG"] == False:
-            
-            logging.info("Navigation pricing started...")
-            
-            func_start_time = start_timer()
 
-            # Capture Prices
-            nav_prices_df = create_navigation_prices_df(
-                const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"],
-                const["MAIN_NAVIGATION_MENU_DEALER_URL"],
-            )
+        logging.info(f"Compiled {compile_locators()} vehicle locators.")
 
-            logging.info("Navigation pricing completed.")
-            logging.info(f"Navigation data shape: {nav_prices_df.shape}")
+        # Start the run with empty page caches, wait log and rate limits
+        HostScheduler.clear()
+        HttpFetcher.clear()
+        PageCache.clear()
+        PageReadiness.clear()
+        ResultCollector.clear()
+        SiteHealth.clear()
+        Tracer.clear()
+        Metrics.clear()
 
-            print_elapsed_time(func_start_time, "Navigation pricing completed time")
-            print_elapsed_time(start_time, "Elapased Time")
-        else:
-            logging.info("NAVIGATION SKIP FLAG is set to 'true'. Skipping NAVIGATION pricing.")
+        # Live run, or record/replay page snapshots (RUN_MODE)
+        SnapshotStore.start()
 
+        # Fingerprints of the last run, to reuse the prices of unchanged pages
+        FingerprintStore.start()
+        
         # ---------------------------------
-        # Get vehicle data
+        # Get Navigation and Vehicle data
+        # - HostScheduler scrapes the pages site by site, within the
+        #   HOST_LIMITS of each host and sharing the WebDriverPool browsers.
+        # - The vehicles are then processed on the same scheduler, mostly
+        #   from the cache, and their data frames built in report order.
         # ---------------------------------
 
         logging.info("Vehicle data processing started.")
 
-        get_vehicle_data(
-            "BRONCO®",
-            const["BRONCO_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_bronco_prices,
-            get_ford_dealer_bronco_prices,
-            get_ford_mfg_bronco_hero_img,
-            get_ford_dealer_bronco_hero_img,
-            const["BRONCO_MANUFACTURER_URL"],
-            const["BRONCO_DEALER_URL"],
-            const["BRONCO_MANUFACTURER_IMAGE_URL"],
-            const["BRONCO_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "BRONCO® SPORT",
-            const["BRONCO_SPORT_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_bronco_sport_prices,
-            get_ford_dealer_bronco_sport_prices,
-            get_ford_mfg_bronco_sport_hero_img,
-            get_ford_dealer_bronco_sport_hero_img,
-            const["BRONCO_SPORT_MANUFACTURER_URL"],
-            const["BRONCO_SPORT_DEALER_URL"],
-            const["BRONCO_SPORT_MANUFACTURER_IMAGE_URL"],
-            const["BRONCO_SPORT_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "CHASSIS CAB",
-            const["CHASSIS_CAB_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_chassis_cab_prices,
-            get_ford_dealer_chassis_cab_prices,
-            get_ford_mfg_chassis_cab_hero_img,
-            get_ford_dealer_chassis_cab_hero_img,
-            const["CHASSIS_CAB_MANUFACTURER_URL"],
-            const["CHASSIS_CAB_DEALER_URL"],
-            const["CHASSIS_CAB_MANUFACTURER_IMAGE_URL"],
-            const["CHASSIS_CAB_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "E-SERIES CUTAWAY",
-            const["E_SERIES_CUTAWAY_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_e_series_cutaway_prices,
-            get_ford_dealer_e_series_cutaway_prices,
-            get_ford_mfg_e_series_cutaway_hero_img,
-            get_ford_dealer_e_series_cutaway_hero_img,
-            const["E_SERIES_CUTAWAY_MANUFACTURER_URL"],
-            const["E_SERIES_CUTAWAY_DEALER_URL"],
-            const["E_SERIES_CUTAWAY_MANUFACTURER_IMAGE_URL"],
-            const["E_SERIES_CUTAWAY_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "E-SERIES STRIPPED CHASSIS",
-            const["E_SERIES_STRIPPED_CHASSIS_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_e_series_stripped_chassis_prices,
-            get_ford_dealer_e_series_stripped_chassis_prices,
-            get_ford_mfg_e_series_stripped_chassis_hero_img,
-            get_ford_dealer_e_series_stripped_chassis_hero_img,
-            const["E_SERIES_STRIPPED_CHASSIS_MANUFACTURER_URL"],
-            const["E_SERIES_STRIPPED_CHASSIS_DEALER_URL"],
-            const["E_SERIES_STRIPPED_CHASSIS_MANUFACTURER_IMAGE_URL"],
-            const["E_SERIES_STRIPPED_CHASSIS_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "E-TRANSIT",
-            const["E_TRANSIT_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_e_transit_prices,
-            get_ford_dealer_e_transit_prices,
-            get_ford_mfg_e_transit_hero_img,
-            get_ford_dealer_e_transit_hero_img,
-            const["E_TRANSIT_MANUFACTURER_URL"],
-            const["E_TRANSIT_DEALER_URL"],
-            const["E_TRANSIT_MANUFACTURER_IMAGE_URL"],
-            const["E_TRANSIT_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "EDGE®",
-            const["EDGE_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_edge_prices,
-            get_ford_dealer_edge_prices,
-            get_ford_mfg_edge_hero_img,
-            get_ford_dealer_edge_hero_img,
-            const["EDGE_MANUFACTURER_URL"],
-            const["EDGE_DEALER_URL"],
-            const["EDGE_MANUFACTURER_IMAGE_URL"],
-            const["EDGE_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "ESCAPE",
-            const["ESCAPE_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_escape_prices,
-            get_ford_dealer_escape_prices,
-            get_ford_mfg_escape_hero_img,
-            get_ford_dealer_escape_hero_img,
-            const["ESCAPE_MANUFACTURER_URL"],
-            const["ESCAPE_DEALER_URL"],
-            const["ESCAPE_MANUFACTURER_IMAGE_URL"],
-            const["ESCAPE_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "EXPLORER®",
-            const["EXPLORER_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_explorer_prices,
-            get_ford_dealer_explorer_prices,
-            get_ford_mfg_explorer_hero_img,
-            get_ford_dealer_explorer_hero_img,
-            const["EXPLORER_MANUFACTURER_URL"],
-            const["EXPLORER_DEALER_URL"],
-            const["EXPLORER_MANUFACTURER_IMAGE_URL"],
-            const["EXPLORER_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "EXPEDITION®",
-            const["EXPEDITION_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_expedition_prices,
-            get_ford_dealer_expedition_prices,
-            get_ford_mfg_expedition_hero_img,
-            get_ford_dealer_expedition_hero_img,
-            const["EXPEDITION_MANUFACTURER_URL"],
-            const["EXPEDITION_DEALER_URL"],
-            const["EXPEDITION_MANUFACTURER_IMAGE_URL"],
-            const["EXPEDITION_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "F-SERIES STRIPPED CHASSIS",
-            const["F_SERIES_STRIPPED_CHASSIS_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_f_series_stripped_chassis_prices,
-            get_ford_dealer_f_series_stripped_chassis_prices,
-            get_ford_mfg_f_series_stripped_chassis_hero_img,
-            get_ford_dealer_f_series_stripped_chassis_hero_img,
-            const["F_SERIES_STRIPPED_CHASSIS_MANUFACTURER_URL"],
-            const["F_SERIES_STRIPPED_CHASSIS_DEALER_URL"],
-            const["F_SERIES_STRIPPED_CHASSIS_MANUFACTURER_IMAGE_URL"],
-            const["F_SERIES_STRIPPED_CHASSIS_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "F-150®",
-            const["F150_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_f150_prices,
-            get_ford_dealer_f150_prices,
-            get_ford_mfg_f150_hero_img,
-            get_ford_dealer_f150_hero_img,
-            const["F150_MANUFACTURER_URL"],
-            const["F150_DEALER_URL"],
-            const["F150_MANUFACTURER_IMAGE_URL"],
-            const["F150_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "F-150® COMMERICAL",
-            const["F150_COMMERCIAL_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_f150_commercial_prices,
-            get_ford_dealer_f150_commercial_prices,
-            get_ford_mfg_f150_commercial_hero_img,
-            get_ford_dealer_f150_commercial_hero_img,
-            const["F150_COMMERCIAL_MANUFACTURER_URL"],
-            const["F150_COMMERCIAL_DEALER_URL"],
-            const["F150_COMMERCIAL_MANUFACTURER_IMAGE_URL"],
-            const["F150_COMMERCIAL_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "F-150® LIGHTENING®",
-            const["F150_LIGHTENING_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_f150_lightening_prices,
-            get_ford_dealer_f150_lightening_prices,
-            get_ford_mfg_f150_lightening_hero_img,
-            get_ford_dealer_f150_lightening_hero_img,
-            const["F150_LIGHTENING_MANUFACTURER_URL"],
-            const["F150_LIGHTENING_DEALER_URL"],
-            const["F150_LIGHTENING_MANUFACTURER_IMAGE_URL"],
-            const["F150_LIGHTENING_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "F-650® F-750®",
-            const["F650_F750_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_f650_f750_prices,
-            get_ford_dealer_f650_f750_prices,
-            get_ford_mfg_f650_f750_hero_img,
-            get_ford_dealer_f650_f750_hero_img,
-            const["F650_F750_MANUFACTURER_URL"],
-            const["F650_F750_DEALER_URL"],
-            const["F650_F750_MANUFACTURER_IMAGE_URL"],
-            const["F650_F750_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "MAVERICK®",
-            const["MAVERICK_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_maverick_prices,
-            get_ford_dealer_maverick_prices,
-            get_ford_mfg_maverick_hero_img,
-            get_ford_dealer_maverick_hero_img,
-            const["MAVERICK_MANUFACTURER_URL"],
-            const["MAVERICK_DEALER_URL"],
-            const["MAVERICK_MANUFACTURER_IMAGE_URL"],
-            const["MAVERICK_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "MUSTANG®",
-            const["MUSTANG_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_mustang_prices,
-            get_ford_dealer_mustang_prices,
-            get_ford_mfg_mustang_hero_img,
-            get_ford_dealer_mustang_hero_img,
-            const["MUSTANG_MANUFACTURER_URL"],
-            const["MUSTANG_DEALER_URL"],
-            const["MUSTANG_MANUFACTURER_IMAGE_URL"],
-            const["MUSTANG_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "MUSTANG MACH-E®",
-            const["MUSTANG_MACH_E_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_mustang_mach_e_prices,
-            get_ford_dealer_mustang_mach_e_prices,
-            get_ford_mfg_mustang_mach_e_hero_img,
-            get_ford_dealer_mustang_mach_e_hero_img,
-            const["MUSTANG_MACH_E_MANUFACTURER_URL"],
-            const["MUSTANG_MACH_E_DEALER_URL"],
-            const["MUSTANG_MACH_E_MANUFACTURER_IMAGE_URL"],
-            const["MUSTANG_MACH_E_DEALER_IMAGE_URL"],
-        )
+        HostScheduler.run(get_site_jobs())
 
-        get_vehicle_data(
-            "RANGER®",
-            const["RANGER_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_ranger_prices,
-            get_ford_dealer_ranger_prices,
-            get_ford_mfg_ranger_hero_img,
-            get_ford_dealer_ranger_hero_img,
-            const["RANGER_MANUFACTURER_URL"],
-            const["RANGER_DEALER_URL"],
-            const["RANGER_MANUFACTURER_IMAGE_URL"],
-            const["RANGER_DEALER_IMAGE_URL"],
-        )
-
-        get_vehicle_data(
-            "SUPER DUTY®",
-            const["SUPER_DUTY_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_super_duty_prices,
-            get_ford_dealer_super_duty_prices,
-            get_ford_mfg_super_duty_hero_img,
-            get_ford_dealer_super_duty_hero_img,
-            const["SUPER_DUTY_MANUFACTURER_URL"],
-            const["SUPER_DUTY_DEALER_URL"],
-            const["SUPER_DUTY_MANUFACTURER_IMAGE_URL"],
-            const["SUPER_DUTY_DEALER_IMAGE_URL"],
+        with Tracer.span("NAVIGATION", "vehicle"):
+            nav_prices_df = run_with_driver(get_navigation_data)
+        vehicle_entries = [
+            vehicle_entry
+            for vehicle_entry in HostScheduler.map(
+                [(task[7], partial(run_vehicle_task, task)) for task in VEHICLE_TASKS]
+            )
+            if vehicle_entry is not None
+        ]
+
+        # Build the hero image table once from the collected records, in
+        # report order, then compare the images themselves
+        vehicle_order = {task[0]: index for index, task in enumerate(VEHICLE_TASKS)}
+        all_model_images_df = (
+            ResultCollector.get_frame("hero_images")
+            .sort_values(
+                "Model Hero Image", key=lambda names: names.map(vehicle_order), kind="stable"
+            )
+            .reset_index(drop=True)
         )
+        with Tracer.span("image compare"):
+            all_model_images_df = ImageComparator.compare_images(all_model_images_df)
+        logging.info(f"Image data shape: {all_model_images_df.shape}")
+
+        # Compare the prices of every vehicle in one pass, then format the report tables
+        with Tracer.span("merge", report="vehicles"):
+            prices_df = compare_vehicle_prices(
+                [(vehicle_name, mfr_prices, dealer_prices)
+                 for vehicle_name, mfr_prices, dealer_prices, _, _, _ in vehicle_entries]
+            )
+            vehicle_frames = get_vehicle_report_frames(
+                prices_df, [vehicle_entry[0] for vehicle_entry in vehicle_entries]
+            )
+        logging.info(f"Vehicle pricing data shape: {prices_df.shape}")
+
+        # Prices the parser could not read are compared as text
+        unparsed_df = prices_df[
+            prices_df[["manufacturer_parse_status", "dealer_parse_status"]].eq("invalid").any(axis=1)
+            & ~prices_df["model"].isin(list(SITE_ERROR_LABELS.values()))
+        ]
+        for _, row in unparsed_df.iterrows():
+            logging.warning(
+                f"Unparsed price for {row['vehicle']} {row['model']}: "
+                f"'{row['manufacturer_price']}' / '{row['dealer_price']}'"
+            )
 
-        get_vehicle_data(
-            "SUPER DUTY® COMMERICAL",
-            const["SUPER_DUTY_COMMERCIAL_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_super_duty_commercial_prices,
-            get_ford_dealer_super_duty_commercial_prices,
-            get_ford_mfg_super_duty_commercial_hero_img,
-            get_ford_dealer_super_duty_commercial_hero_img,
-            const["SUPER_DUTY_COMMERCIAL_MANUFACTURER_URL"],
-            const["SUPER_DUTY_COMMERCIAL_DEALER_URL"],
-            const["SUPER_DUTY_COMMERCIAL_MANUFACTURER_IMAGE_URL"],
-            const["SUPER_DUTY_COMMERCIAL_DEALER_IMAGE_URL"],
-        )
+        for vehicle_name, _, _, mfg_image_url, dealer_image_url, unchanged_note in vehicle_entries:
+            vehicle_prices_df = vehicle_frames[vehicle_name]
 
-        get_vehicle_data(
-            "TRANSIT®",
-            const["TRANSIT_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_transit_prices,
-            get_ford_dealer_transit_prices,
-            get_ford_mfg_transit_hero_img,
-            get_ford_dealer_transit_hero_img,
-            const["TRANSIT_MANUFACTURER_URL"],
-            const["TRANSIT_DEALER_URL"],
-            const["TRANSIT_MANUFACTURER_IMAGE_URL"],
-            const["TRANSIT_DEALER_IMAGE_URL"],
-        )
+            # Mark prices whose pages have not changed since an earlier run
+            if unchanged_note:
+                vehicle_prices_df["Data Status"] = unchanged_note
 
-        get_vehicle_data(
-            "TRANSIT® CC-CA",
-            const["TRANSIT_CC_CA_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_transit_cc_ca_prices,
-            get_ford_dealer_transit_cc_ca_prices,
-            get_ford_mfg_transit_cc_ca_hero_img,
-            get_ford_dealer_transit_cc_ca_hero_img,
-            const["TRANSIT_CC_CA_MANUFACTURER_URL"],
-            const["TRANSIT_CC_CA_DEALER_URL"],
-            const["TRANSIT_CC_CA_MANUFACTURER_IMAGE_URL"],
-            const["TRANSIT_CC_CA_DEALER_IMAGE_URL"],
-        )
+            vehicles_list_html.append(
+                (vehicle_name, vehicle_prices_df, mfg_image_url, dealer_image_url)
+            )
 
-        get_vehicle_data(
-            "TRANSIT® COMMERCIAL",
-            const["TRANSIT_COMMERCIAL_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_transit_commercial_prices,
-            get_ford_dealer_transit_commercial_prices,
-            get_ford_mfg_transit_commercial_hero_img,
-            get_ford_dealer_transit_commercial_hero_img,
-            const["TRANSIT_COMMERCIAL_MANUFACTURER_URL"],
-            const["TRANSIT_COMMERCIAL_DEALER_URL"],
-            const["TRANSIT_COMMERCIAL_MANUFACTURER_IMAGE_URL"],
-            const["TRANSIT_COMMERCIAL_DEALER_IMAGE_URL"],
-        )
+        # Comparison frames of record and replay runs, to diff them
+        SnapshotStore.save_frame("navigation", nav_prices_df)
+        for vehicle_name, vehicle_prices_df, _, _ in vehicles_list_html:
+            SnapshotStore.save_frame(vehicle_name, vehicle_prices_df)
+        SnapshotStore.save_frame("hero_images", all_model_images_df)
+
+        # Append the run to the price history - replays would only repeat a recorded run
+        if const["HISTORY_DIR"] and not SnapshotStore.is_replaying():
+            try:
+                PriceHistory.save_run(
+                    datetime.datetime.fromtimestamp(start_time),
+                    prices_df,
+                    nav_prices_df,
+                    all_model_images_df,
+                    SITE_ERROR_LABELS.values(),
+                )
+            except Exception as e:
+                logging.error(f"Could not save the price history: {e}", exc_info=True)
 
-        get_vehicle_data(
-            "TRANSIT® CONNECT",
-            const["TRANSIT_CONNECT_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_transit_connect_prices,
-            get_ford_dealer_transit_connect_prices,
-            get_ford_mfg_transit_connect_hero_img,
-            get_ford_dealer_transit_connect_hero_img,
-            const["TRANSIT_CONNECT_MANUFACTURER_URL"],
-            const["TRANSIT_CONNECT_DEALER_URL"],
-            const["TRANSIT_CONNECT_MANUFACTURER_IMAGE_URL"],
-            const["TRANSIT_CONNECT_DEALER_IMAGE_URL"],
+        logging.info("Vehicle data processing completed.")
+        logging.info(
+            f"Page loads: {PageCache.page_loads}, pages reused: {PageCache.page_reuses}, "
+            f"HTTP fetches: {HttpFetcher.fetch_count}"
         )
-
-        get_vehicle_data(
-            "TRANSIT® CONNECT COMMERCIAL",
-            const["TRANSIT_CONNECT_COMMERCIAL_SKIP_FLAG"],
-            const["EMAIL_IMG_COMPARISON_SKIP"],
-            get_ford_mfg_transit_connect_commercial_prices,
-            get_ford_dealer_transit_connect_commercial_prices,
-            get_ford_mfg_transit_connect_commercial_hero_img,
-            get_ford_dealer_transit_connect_commercial_hero_img,
-            const["TRANSIT_CONNECT_COMMERCIAL_MANUFACTURER_URL"],
-            const["TRANSIT_CONNECT_COMMERCIAL_DEALER_URL"],
-            const["TRANSIT_CONNECT_COMMERCIAL_MANUFACTURER_IMAGE_URL"],
-            const["TRANSIT_CONNECT_COMMERCIAL_DEALER_IMAGE_URL"],
+        PageReadiness.log_summary()
+        HostScheduler.log_summary()
+        SiteHealth.log_summary()
+        FingerprintStore.log_summary()
+
+        # Render the report once - the email and the archived copy share it
+        report = ReportRenderer.render(
+            vehicles_list_html,
+            all_model_images_df,
+            nav_prices_df,
+            SiteHealth.get_skipped(),
         )
-
-        logging.info("Vehicle data processing completed.")
+        if const["REPORT_ARCHIVE_DIR"]:
+            report_path = os.path.join(
+                const["REPORT_ARCHIVE_DIR"],
+                f"report_{datetime.datetime.fromtimestamp(start_time):%Y%m%d-%H%M%S}.html",
+            )
+            try:
+                report.write(report_path)
+                logging.info(f"Report archived to {report_path}")
+            except OSError as e:
+                logging.error(f"Could not archive the report: {e}")
 
         # Email the data
         if const["EMAIL_SKIP_FLAG"] == False:
@@ -566,9 +428,7 @@ def main():
                     "EMAIL_SUBJECT",
                     f'LOCAL - Ford Vehicle Prices {"and image" if not const["EMAIL_IMG_COMPARISON_SKIP"] else ""}Comparison',
                 ),
-                vehicles_list_html,
-                all_model_images_df,
-                nav_prices_df,
+                report,
             )
 
             logging.info("Email sent successfully.")
@@ -593,6 +453,7 @@ def main():
         )
 
         logging.info("Application completed successfully.")
+        Metrics.set("run_success", 1)
 
     except Exception as e:
         exc_type, exc_obj, exc_tb = sys.exc_info()
@@ -602,6 +463,7 @@ def main():
             f"{exc_type.__name__} at {filename}\nline: {line_number}\n{str(e)}"
         )
         logging.error(error_message)
+        Metrics.set("run_success", 0)
         send_error_email(
             sender_email,
             os.getenv("EMAIL_ERROR_RECIEVER"),
@@ -619,13 +481,28 @@ def main():
 
     finally:
 
-        # Close Webdriver
-        driver = WebDriverSingleton.get_driver()
-        if driver is not None:
-            driver.quit()
-            logging.info("WebDriver closed successfully.")
+        # Close every pooled Webdriver
+        WebDriverPool.close_all()
+        logging.info("WebDriver closed successfully.")
+
+        # After close_all(), since recording browsers save their last page on quit
+        SnapshotStore.finish()
+
+        # Fingerprints for the next run
+        FingerprintStore.finish()
 
 
 if __name__ == "__main__":
 
-    main()
+    with Tracer.span("run", "run"):
+        main()
+
+    # Where the run time went, per phase
+    Tracer.log_summary()
+    Tracer.export_chrome_trace(const["TRACE_FILE"])
+
+    # Metrics for the node exporter textfile collector
+    Metrics.set("run_duration_seconds", time.time() - start_time)
+    Metrics.set("run_timestamp_seconds", time.time())
+    Metrics.write_prometheus(const["METRICS_PROMETHEUS_FILE"])
+    Metrics.write_json(const["METRICS_JSON_FILE"])
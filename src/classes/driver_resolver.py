@@ -0,0 +1,146 @@
+# 3rd Party Pacakges
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+
+# Built-in Packages
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+# Local Packages
+from utilities.constants import constants as const
+
+DRIVER_NAMES = {
+    "chrome": "chromedriver",
+    "edge": "msedgedriver",
+    "firefox": "geckodriver",
+}
+
+
+class DriverResolver:
+    """
+    Finds the browser driver binary without going to the network when it can.
+
+    Resolution order:
+    1. The pinned binary in WEBDRIVER_BINARY_PATHS.
+    2. A driver on the PATH (e.g. installed in the Docker image).
+    3. The path cached on disk by an earlier run, while it is younger than
+       WEBDRIVER_CACHE_TTL_HOURS and the file still exists.
+    4. webdriver_manager, which looks up the latest version online. Its
+       result is written to the disk cache for the next runs.
+
+    The result is kept in memory for the rest of the run, so the pool's
+    workers resolve once between them. When the browser rejects a driver,
+    invalidate() makes the next resolve() go straight to webdriver_manager.
+    """
+
+    _resolved: Dict[str, str] = {}
+    _skip_local: Set[str] = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve(cls, browser: str) -> str:
+        with cls._lock:
+            if browser in cls._resolved:
+                return cls._resolved[browser]
+
+            start_time = time.perf_counter()
+            path, source = None, ""
+            if browser not in cls._skip_local:
+                path, source = cls._find_local(browser)
+            if path is None:
+                path, source = cls._install(browser), "webdriver_manager"
+            elapsed_seconds = time.perf_counter() - start_time
+
+            logging.info(
+                f"Resolved {DRIVER_NAMES[browser]} from {source} in "
+                f"{elapsed_seconds:.2f}s: {path}"
+            )
+            cls._resolved[browser] = path
+            return path
+
+    @classmethod
+    def invalidate(cls, browser: str) -> None:
+        """Forget a driver that did not work with the installed browser."""
+        with cls._lock:
+            cls._resolved.pop(browser, None)
+            cls._skip_local.add(browser)
+            cache = cls._read_cache()
+            if cache.pop(browser, None) is not None:
+                cls._write_cache(cache)
+
+    # ------------------------------------------
+    # Local lookups - no network
+    # ------------------------------------------
+    @classmethod
+    def _find_local(cls, browser: str) -> Tuple[Optional[str], str]:
+        pinned_path = const["WEBDRIVER_BINARY_PATHS"].get(browser)
+        if pinned_path and cls._is_executable(pinned_path):
+            return pinned_path, "WEBDRIVER_BINARY_PATHS"
+        if pinned_path:
+            logging.warning(f"Pinned {browser} driver not found: {pinned_path}")
+
+        path_driver = shutil.which(DRIVER_NAMES[browser])
+        if path_driver:
+            return path_driver, "PATH"
+
+        cached = cls._read_cache().get(browser)
+        if (
+            cached
+            and time.time() - cached["resolved_at"]
+            < const["WEBDRIVER_CACHE_TTL_HOURS"] * 3600
+            and cls._is_executable(cached["path"])
+        ):
+            return cached["path"], "disk cache"
+
+        return None, ""
+
+    @staticmethod
+    def _is_executable(path: str) -> bool:
+        return os.path.isfile(path) and os.access(path, os.X_OK)
+
+    # ------------------------------------------
+    # Network lookup through webdriver_manager
+    # ------------------------------------------
+    @classmethod
+    def _install(cls, browser: str) -> str:
+        if browser == "chrome":
+            path = ChromeDriverManager().install()
+        elif browser == "edge":
+            path = EdgeChromiumDriverManager().install()
+        else:
+            # GitHub rate limits anonymous release lookups
+            if os.getenv("GITHUB_TOKEN"):
+                os.environ["GH_TOKEN"] = os.getenv("GITHUB_TOKEN")
+            path = GeckoDriverManager().install()
+
+        cache = cls._read_cache()
+        cache[browser] = {"path": path, "resolved_at": time.time()}
+        cls._write_cache(cache)
+        return path
+
+    # ------------------------------------------
+    # Disk cache
+    # ------------------------------------------
+    @staticmethod
+    def _read_cache() -> dict:
+        try:
+            with open(os.path.expanduser(const["WEBDRIVER_CACHE_FILE"])) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_cache(cache: dict) -> None:
+        cache_file = os.path.expanduser(const["WEBDRIVER_CACHE_FILE"])
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "w") as file:
+                json.dump(cache, file, indent=2)
+        except OSError as e:
+            logging.warning(f"Could not write the driver cache {cache_file}: {e}")
@@ -0,0 +1,165 @@
+# Built-in Packages
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.host_scheduler import HostScheduler
+from classes.metrics import Metrics
+from classes.snapshot_store import SnapshotStore
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+
+class FingerprintStore:
+    """
+    Page fingerprints kept between runs, for incremental runs.
+
+    A fingerprint hashes the text of the pricing region of a page (the
+    elements its locators match), read in one call right after the page
+    loads. When it matches the previous run, lookup() returns the stored
+    extraction result.
+
+    - Entries are keyed by URL and by the locators of the extraction.
+    - Only pages read in one pass are fingerprinted. Pages the browser
+      clicks through (carousels, next buttons) render prices as they are
+      clicked, which a fingerprint of the loaded page can't see.
+    - A result is reused for at most FINGERPRINT_MAX_AGE_HOURS after the
+      last full extraction.
+    - get_unchanged_since() tells the report which pages were unchanged
+      and since when.
+    - Record and replay runs always extract, and do not use the store.
+    """
+
+    enabled = False
+    _entries: Dict[str, dict] = {}
+    _unchanged: Dict[str, str] = {}
+    _lock = threading.Lock()
+    reuse_count = 0
+
+    # ------------------------------------------
+    # Fingerprint file
+    # ------------------------------------------
+    @classmethod
+    def start(cls) -> None:
+        with cls._lock:
+            cls.enabled = (
+                const["INCREMENTAL_RUNS"]
+                and bool(const["FINGERPRINT_FILE"])
+                and not SnapshotStore.is_recording()
+                and not SnapshotStore.is_replaying()
+            )
+            cls._entries = {}
+            cls._unchanged = {}
+            cls.reuse_count = 0
+
+            if not cls.enabled or not os.path.isfile(const["FINGERPRINT_FILE"]):
+                return
+
+            try:
+                with open(const["FINGERPRINT_FILE"], encoding="utf-8") as file:
+                    cls._entries = json.load(file)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable fingerprint file: {e}")
+
+    @classmethod
+    def finish(cls) -> None:
+        if not cls.enabled:
+            return
+
+        with cls._lock:
+            content = json.dumps(cls._entries, indent=2, ensure_ascii=False)
+
+        temp_path = f"{const['FINGERPRINT_FILE']}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, const["FINGERPRINT_FILE"])
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.enabled
+
+    @staticmethod
+    def fingerprint(region_text: str) -> str:
+        return hashlib.sha256(region_text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _entry_key(url: str, key: str) -> str:
+        return f"{url} {hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+
+    # ------------------------------------------
+    # Results
+    # ------------------------------------------
+    @classmethod
+    def lookup(
+        cls, url: str, key: str, fingerprint: Optional[str]
+    ) -> Optional[List[Tuple[str, ...]]]:
+        """The stored result when the page is unchanged, else None."""
+        if not cls.enabled or fingerprint is None:
+            return None
+
+        with cls._lock:
+            entry = cls._entries.get(cls._entry_key(url, key))
+            if entry is None or entry["fingerprint"] != fingerprint:
+                return None
+
+            extracted_at = datetime.strptime(entry["extracted_at"], TIMESTAMP_FORMAT)
+            max_age = timedelta(hours=const["FINGERPRINT_MAX_AGE_HOURS"])
+            if datetime.now() - extracted_at > max_age:
+                return None
+
+            cls._unchanged[url] = entry["changed_at"]
+            cls.reuse_count += 1
+
+        logging.info(f"Reusing the prices of {url}, unchanged since {entry['changed_at']}")
+        Metrics.inc("fingerprint_reuses_total", host=HostScheduler.get_host(url))
+        return [tuple(row) for row in entry["result"]]
+
+    @classmethod
+    def save(
+        cls, url: str, key: str, fingerprint: Optional[str], result: List[Tuple[str, ...]]
+    ) -> None:
+        # An empty result is more likely a failed read than a page without prices
+        if not cls.enabled or fingerprint is None or not result:
+            return
+
+        now = datetime.now().strftime(TIMESTAMP_FORMAT)
+        entry_key = cls._entry_key(url, key)
+        with cls._lock:
+            previous = cls._entries.get(entry_key)
+            if previous is not None and previous["fingerprint"] == fingerprint:
+                changed_at = previous["changed_at"]
+                cls._unchanged[url] = changed_at
+            else:
+                changed_at = now
+
+            cls._entries[entry_key] = {
+                "fingerprint": fingerprint,
+                "result": [list(row) for row in result],
+                "changed_at": changed_at,
+                "extracted_at": now,
+            }
+
+    @classmethod
+    def get_unchanged_since(cls, url: str) -> Optional[str]:
+        with cls._lock:
+            return cls._unchanged.get(url)
+
+    @classmethod
+    def log_summary(cls) -> None:
+        if cls.enabled:
+            logging.info(
+                f"Incremental run: {cls.reuse_count} pages reused, "
+                f"{len(cls._unchanged)} pages unchanged since the last run"
+            )
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._unchanged = {}
+            cls.reuse_count = 0
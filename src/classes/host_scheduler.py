@@ -0,0 +1,172 @@
+# Built-in Packages
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.snapshot_store import SnapshotStore
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        # Reserve the next token and return how long to wait for it
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostScheduler:
+    """
+    Politeness limits per host, configured in HOST_LIMITS.
+
+    - throttle() wraps every page request (browser page loads and HTTP
+      fetches) in the host's token bucket, so a host never sees more than
+      requests_per_second on average.
+    - run() works through site-level jobs on a worker pool. A job is only
+      started while its host is below max_concurrency, and the workers take
+      turns between hosts, so ford.ca and fordtodealers.ca jobs run side by
+      side instead of one host sitting idle while the other is saturated.
+    - map() does the same and returns the jobs' results in job order.
+    """
+
+    _buckets: Dict[str, TokenBucket] = {}
+    _lock = threading.Lock()
+    throttled_seconds: Dict[str, float] = {}
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urlparse(url).hostname or "unknown"
+
+    @staticmethod
+    def get_limits(host: str) -> dict:
+        host_limits = const["HOST_LIMITS"]
+        return host_limits.get(host, host_limits["default"])
+
+    # ------------------------------------------
+    # Request rate per host
+    # ------------------------------------------
+    @classmethod
+    @contextmanager
+    def throttle(cls, url: str):
+        # Replayed pages come from disk, not from the host
+        if SnapshotStore.is_replaying():
+            yield
+            return
+
+        host = cls.get_host(url)
+        with cls._lock:
+            bucket = cls._buckets.get(host)
+            if bucket is None:
+                limits = cls.get_limits(host)
+                bucket = cls._buckets[host] = TokenBucket(
+                    limits["requests_per_second"], limits["burst"]
+                )
+
+        delay = bucket.take()
+        if delay > 0:
+            with cls._lock:
+                cls.throttled_seconds[host] = cls.throttled_seconds.get(host, 0) + delay
+            time.sleep(delay)
+        yield
+
+    # ------------------------------------------
+    # Site-level jobs, interleaved across hosts
+    # ------------------------------------------
+    @classmethod
+    def run(cls, jobs: List[Tuple[str, Callable[[], None]]]) -> None:
+        """
+        Run (url, job) pairs; a job's exceptions are logged, not raised.
+
+        One worker per host slot, but no more workers than the
+        MAX_BROWSER_WORKERS browsers of WebDriverPool: a job holds its host
+        slot while it waits for a browser, so a worker without one would
+        keep the slot from a job that could run.
+        """
+        queues: Dict[str, Deque[Callable[[], None]]] = {}
+        for url, job in jobs:
+            queues.setdefault(cls.get_host(url), deque()).append(job)
+
+        hosts = list(queues)
+        workers = sum(cls.get_limits(host)["max_concurrency"] for host in hosts)
+        running = {host: 0 for host in hosts}
+        condition = threading.Condition()
+        turn = [0]
+
+        def next_job():
+            # Next host in turn that has work and a free slot
+            for offset in range(len(hosts)):
+                host = hosts[(turn[0] + offset) % len(hosts)]
+                if queues[host] and running[host] < cls.get_limits(host)["max_concurrency"]:
+                    turn[0] = (turn[0] + offset + 1) % len(hosts)
+                    running[host] += 1
+                    return host, queues[host].popleft()
+            return None
+
+        def worker():
+            while True:
+                with condition:
+                    picked = next_job()
+                    while picked is None:
+                        if not any(queues.values()):
+                            return
+                        condition.wait()
+                        picked = next_job()
+
+                host, job = picked
+                try:
+                    job()
+                except Exception as e:
+                    logging.error(f"Scheduled job on {host} failed: {e}", exc_info=True)
+                finally:
+                    with condition:
+                        running[host] -= 1
+                        condition.notify_all()
+
+        workers = max(1, min(workers, len(jobs), const["MAX_BROWSER_WORKERS"]))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="site") as executor:
+            for _ in range(workers):
+                executor.submit(worker)
+
+    @classmethod
+    def map(cls, jobs: List[Tuple[str, Callable[[], Any]]]) -> List[Optional[Any]]:
+        """run() the (url, job) pairs; each job's result, None when it failed."""
+        results: List[Optional[Any]] = [None] * len(jobs)
+
+        def store(index: int, job: Callable[[], Any]) -> None:
+            results[index] = job()
+
+        cls.run([(url, partial(store, index, job)) for index, (url, job) in enumerate(jobs)])
+        return results
+
+    @classmethod
+    def log_summary(cls) -> None:
+        with cls._lock:
+            for host, seconds in sorted(cls.throttled_seconds.items()):
+                logging.info(f"Rate limit delays on {host}: {seconds:.2f}s in total")
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._buckets = {}
+            cls.throttled_seconds = {}
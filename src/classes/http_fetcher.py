@@ -0,0 +1,414 @@
+# 3rd Party Pacakges
+from lxml import etree, html
+import requests
+from requests.adapters import HTTPAdapter
+
+# Built-in Packages
+from collections import defaultdict
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.host_scheduler import HostScheduler
+from classes.metrics import Metrics
+from classes.site_health import SiteDownError, SiteHealth
+from classes.snapshot_store import SnapshotStore
+from classes.tracer import Tracer
+from utilities.retry import call_with_retry
+from utilities.bulk_extraction import HIDDEN_TEXT_XPATH
+from utilities.site_urls import redirect_url
+
+# Elements that start a new line in the rendered text (like innerText)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "section", "table", "td",
+    "th", "tr", "ul",
+}
+SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+
+
+class ServerError(requests.HTTPError):
+    """5xx response - the host is struggling, the request may be retried."""
+
+
+class HttpFetcher:
+    """
+    Reads server-rendered pages over plain HTTP instead of the browser.
+
+    - Pages come from one requests.Session with pooled keep-alive connections
+      and are parsed once per run with lxml.
+    - The extractors' XPath locators are compiled once and reused.
+    - Only hosts in HTTP_FIRST_HOSTS are fetched this way, minus the URLs
+      declared in JAVASCRIPT_URLS. A page is also treated as needing
+      JavaScript when a locator finds nothing in the static HTML; callers
+      then fall back to the browser.
+    """
+
+    _session: Optional[requests.Session] = None
+    _documents: Dict[str, html.HtmlElement] = {}
+    _key_locks: Dict[str, threading.Lock] = {}
+    _compiled: Dict[str, etree.XPath] = {}
+    _lock = threading.Lock()
+    fetch_count = 0
+
+    # ------------------------------------------
+    # HTTP session and documents
+    # ------------------------------------------
+    @classmethod
+    def is_http_first(cls, url: str) -> bool:
+        return (
+            urlparse(url).hostname in const["HTTP_FIRST_HOSTS"]
+            and url not in const["JAVASCRIPT_URLS"]
+        )
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        with cls._lock:
+            if cls._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=len(const["HTTP_FIRST_HOSTS"]) or 1,
+                    pool_maxsize=const["MAX_BROWSER_WORKERS"],
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = const["HTTP_USER_AGENT"]
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def get_document(cls, url: str) -> Optional[html.HtmlElement]:
+        if not cls.is_http_first(url):
+            return None
+
+        with cls._lock:
+            key_lock = cls._key_locks.setdefault(url, threading.Lock())
+
+        # One successful fetch per URL per run, even when several workers ask
+        # at once. A failed fetch is not kept, so a retry fetches it again
+        with key_lock:
+            document = cls._documents.get(url)
+            if document is None:
+                document = cls._fetch(url)
+                if document is not None:
+                    cls._documents[url] = document
+            return document
+
+    @classmethod
+    def _fetch(cls, url: str) -> Optional[html.HtmlElement]:
+        if SnapshotStore.is_replaying():
+            content = SnapshotStore.load_http(url)
+            return html.fromstring(content, base_url=url) if content else None
+
+        host = HostScheduler.get_host(url)
+        try:
+            response = call_with_retry(
+                lambda: cls._get(url, host),
+                const["RETRY"]["page_attempts"],
+                f"HTTP fetch of {url}",
+                "http_fetch",
+                retry_on=(requests.ConnectionError, requests.Timeout, ServerError),
+            )
+            response.raise_for_status()
+        except SiteDownError as e:
+            logging.warning(f"Skipping the HTTP fetch of {url}: {e}")
+            return None
+        except requests.RequestException as e:
+            logging.warning(f"HTTP fetch failed for {url}, using the browser: {e}")
+            Metrics.inc("retries_total", reason="http_fetch_failed")
+            return None
+
+        with cls._lock:
+            cls.fetch_count += 1
+        Metrics.inc("http_response_bytes_total", len(response.content), host=host)
+
+        if SnapshotStore.is_recording():
+            SnapshotStore.save_http(url, response.content)
+
+        return html.fromstring(response.content, base_url=url)
+
+    @classmethod
+    def _get(cls, url: str, host: str) -> requests.Response:
+        with Tracer.span("http fetch", url=url), Metrics.timer(
+            "page_load_seconds", host=host, method="http"
+        ):
+            return cls.get(url)
+
+    @classmethod
+    def get(cls, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        GET on the pooled session, at the SITE_URL_OVERRIDES address of url,
+        within its host's rate limit and circuit breaker.
+        """
+        SiteHealth.check(url)
+        try:
+            with HostScheduler.throttle(url):
+                response = cls.get_session().get(
+                    redirect_url(url), headers=headers, timeout=const["HTTP_TIMEOUT"]
+                )
+            # Client errors are about the page, server errors about the host
+            if response.status_code >= 500:
+                raise ServerError(f"{response.status_code} Server Error for url: {url}", response=response)
+        except (requests.ConnectionError, requests.Timeout, ServerError) as e:
+            SiteHealth.record_failure(url, e)
+            raise
+        SiteHealth.record_success(url)
+        return response
+
+    @classmethod
+    def xpath(cls, expression: str) -> etree.XPath:
+        compiled = cls._compiled.get(expression)
+        if compiled is None:
+            compiled = cls._compiled[expression] = etree.XPath(expression)
+        return compiled
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._documents = {}
+            cls._key_locks = {}
+            cls.fetch_count = 0
+
+    # ------------------------------------------
+    # Extraction - None means the page needs the browser
+    # ------------------------------------------
+    @classmethod
+    def extract_pairs(
+        cls,
+        url: str,
+        model_xpath: str,
+        price_xpath: str,
+        card_xpath: Optional[str] = None,
+    ) -> Optional[List[Tuple[str, str]]]:
+        document = cls.get_document(url)
+        if document is None:
+            return None
+
+        with Tracer.span("extract", url=url):
+            pairs, model_count, price_count = cls.pair_elements(
+                document, model_xpath, price_xpath, card_xpath
+            )
+            if not model_count or not price_count:
+                logging.info(f"Locators not found in the static HTML of {url}")
+                Metrics.inc("retries_total", reason="needs_javascript")
+                return None
+
+            return [cls.pair_text(model, price) for model, price in pairs]
+
+    @classmethod
+    def pair_elements(
+        cls,
+        document,
+        model_xpath: str,
+        price_xpath: str,
+        card_xpath: Optional[str] = None,
+    ) -> Tuple[list, int, int]:
+        """(model, price) element pairs, the number of models and of prices."""
+        if card_xpath:
+            pairs = [
+                (
+                    cls._first(cls.xpath(model_xpath)(card)),
+                    cls._first(cls.xpath(price_xpath)(card)),
+                )
+                for card in cls.xpath(card_xpath)(document)
+            ]
+            model_count = sum(model is not None for model, _ in pairs)
+            price_count = sum(price is not None for _, price in pairs)
+            return pairs, model_count, price_count
+
+        models = cls.xpath(model_xpath)(document)
+        prices = cls.xpath(price_xpath)(document)
+        pairs = cls.pair_models(models, prices)
+        return pairs, len(models), len(prices)
+
+    @staticmethod
+    def pair_models(models: list, prices: list, root=None) -> list:
+        """
+        Same pairing as the in-page scripts: each model takes the first
+        unclaimed price inside its nearest ancestor that holds one, up to
+        the first ancestor that also holds another model, and not above
+        root.
+        """
+        prices_by_ancestor = defaultdict(list)
+        for price in prices:
+            prices_by_ancestor[price].append(price)
+            for ancestor in price.iterancestors():
+                prices_by_ancestor[ancestor].append(price)
+
+        model_counts = defaultdict(int)
+        for model in models:
+            for node in [model, *model.iterancestors()]:
+                model_counts[node] += 1
+
+        claimed = set()
+        pairs = []
+        for model in models:
+            matched_price = None
+            for node in [model, *model.iterancestors()]:
+                if model_counts[node] > 1:
+                    break
+                matched_price = next(
+                    (
+                        price
+                        for price in prices_by_ancestor.get(node, [])
+                        if price not in claimed
+                    ),
+                    None,
+                )
+                if matched_price is not None or node is root:
+                    break
+            if matched_price is not None:
+                claimed.add(matched_price)
+            pairs.append((model, matched_price))
+
+        return pairs
+
+    @classmethod
+    def read_menu(
+        cls,
+        document,
+        category_xpath: str,
+        panel_xpath: str,
+        model_xpath: str,
+        price_xpath: str,
+    ) -> list:
+        """Same result as MENU_SCRIPT: [category, pairs or None] in menu order."""
+        categories = cls.xpath(category_xpath)(document)
+        panels = cls.xpath(panel_xpath)(document)
+
+        def find_panel(category):
+            nodes = [category, *category.iterancestors()]
+            panel = next((panel for panel in panels if panel in nodes), None)
+            if panel is not None:
+                return panel
+            control = next((node for node in nodes if node.get("aria-controls") is not None), None)
+            controlled = (
+                document.get_element_by_id(control.get("aria-controls"), None)
+                if control is not None
+                else None
+            )
+            return controlled if controlled is not None and controlled in panels else None
+
+        menu = []
+        for category in categories:
+            panel = find_panel(category)
+            models = cls.xpath(model_xpath)(panel) if panel is not None else []
+            if not models:
+                menu.append([cls.dom_text(category), None])
+                continue
+
+            pairs = [
+                [cls.dom_text(model), cls.dom_text(price)]
+                for model, price in cls.pair_models(models, cls.xpath(price_xpath)(panel), panel)
+            ]
+
+            # Prices filled in by script once the category is opened
+            if not any(model and price for model, price in pairs):
+                pairs = None
+            menu.append([cls.dom_text(category), pairs])
+
+        return menu
+
+    @classmethod
+    def extract_attribute(cls, url: str, xpath: str, attribute: str) -> Optional[str]:
+        document = cls.get_document(url)
+        if document is None:
+            return None
+
+        with Tracer.span("extract", url=url):
+            element = cls._first(cls.xpath(xpath)(document))
+            if element is None or element.get(attribute) is None:
+                return None
+
+            value = element.get(attribute)
+            if attribute in ("src", "href"):
+                # Absolute URL, like WebElement.get_attribute()
+                value = requests.compat.urljoin(url, value)
+            return value
+
+    @classmethod
+    def get_region_text(cls, url: str, xpaths: List[str]) -> Optional[str]:
+        """Same text as REGION_TEXT_SCRIPT, from the static HTML."""
+        document = cls.get_document(url)
+        if document is None:
+            return None
+
+        parts = []
+        for xpath in xpaths:
+            elements = [
+                element
+                for element in cls.xpath(xpath)(document)
+                if isinstance(element, html.HtmlElement)
+            ]
+            parts.append(str(len(elements)))
+            parts.extend(" ".join(element.text_content().split()) for element in elements)
+        return "\n".join(parts)
+
+    # ------------------------------------------
+    # Text helpers
+    # ------------------------------------------
+    @staticmethod
+    def _first(elements: list):
+        return elements[0] if elements else None
+
+    @classmethod
+    def pair_text(cls, model, price, text: Optional[Callable] = None) -> Tuple[str, str]:
+        """Texts of a pair, the same as PAIRS_SCRIPT returns them."""
+        text = text or cls.element_text
+        model_text = text(model) if model is not None else ""
+        price_text = text(price) if price is not None else ""
+
+        # A price nested in its model element is not part of the model name
+        if model is not None and price is not None and model in price.iterancestors():
+            model_text = model_text.replace(price_text, "").strip()
+
+        return model_text, price_text
+
+    @classmethod
+    def dom_text(cls, element) -> str:
+        """Same text as MENU_SCRIPT: textContent without the HIDDEN_TEXT_XPATH parts."""
+        if element is None:
+            return ""
+        hidden = set(cls.xpath(HIDDEN_TEXT_XPATH)(element))
+        chunks = []
+
+        def walk(node):
+            # Comments have no text, a hidden element keeps only its tail
+            if isinstance(node.tag, str) and node not in hidden:
+                chunks.append(node.text or "")
+                for child in node:
+                    walk(child)
+            if node is not element:
+                chunks.append(node.tail or "")
+
+        walk(element)
+        return " ".join("".join(chunks).split())
+
+    @classmethod
+    def element_text(cls, element) -> str:
+        """Approximate innerText: block elements and <br> start new lines."""
+        chunks = []
+
+        def walk(node):
+            if not isinstance(node.tag, str) or node.tag in SKIPPED_TAGS:
+                chunks.append(node.tail or "")
+                return
+            if node.tag in BLOCK_TAGS:
+                chunks.append("\n")
+            chunks.append(node.text or "")
+            for child in node:
+                walk(child)
+            if node.tag in BLOCK_TAGS:
+                chunks.append("\n")
+            chunks.append(node.tail or "")
+
+        chunks.append(element.text or "")
+        for child in element:
+            walk(child)
+
+        lines = (" ".join(line.split()) for line in "".join(chunks).split("\n"))
+        return "\n".join(line for line in lines if line)
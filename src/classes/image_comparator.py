@@ -0,0 +1,224 @@
+# 3rd Party Pacakges
+import numpy as np
+import pandas as pd
+from PIL import Image, UnidentifiedImageError
+import requests
+
+# Built-in Packages
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import hashlib
+from io import BytesIO
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.http_fetcher import HttpFetcher
+from classes.metrics import Metrics
+from classes.site_health import SiteDownError
+from classes.snapshot_store import SnapshotStore
+from classes.tracer import Tracer
+
+# Image types the hashes are computed for - videos keep the filename comparison
+HASHED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".tif", ".webp")
+
+
+class ImageComparator:
+    """
+    Compares the hero images by content instead of by filename.
+
+    - Images are downloaded with HttpFetcher.get(), so they go through
+      SITE_URL_OVERRIDES, the host rate limits and the circuit breakers
+      like the pages do.
+    - The cache (IMAGE_COMPARISON cache_dir) holds the bytes of each image
+      in a file named after the SHA-1 of its URL, and index.json with the
+      URL, ETag, Last-Modified, size and last use of each file. A cached
+      image is revalidated with its ETag / Last-Modified; on a 304 it is
+      hashed from the cached file instead of being downloaded again.
+    - A perceptual difference hash is computed for each image on a worker
+      pool. Two images match when their hashes are at most
+      max_distance bits apart (Hamming distance), so the same photo under
+      another name or format matches and a swapped photo does not.
+    - The least recently used images are removed once the cache is over
+      cache_max_mb.
+    - Rows whose images can't be hashed (videos, download errors, replay
+      runs) keep the filename comparison.
+    """
+
+    _index: Dict[str, dict] = {}
+    _lock = threading.Lock()
+    download_count = 0
+    reuse_count = 0
+
+    # ------------------------------------------
+    # Cache
+    # ------------------------------------------
+    @staticmethod
+    def get_cache_path(name: str) -> str:
+        return os.path.join(const["IMAGE_COMPARISON"]["cache_dir"], name)
+
+    @classmethod
+    def load_index(cls) -> None:
+        cls._index = {}
+        path = cls.get_cache_path("index.json")
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, encoding="utf-8") as file:
+                cls._index = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable image cache index: {e}")
+
+    @classmethod
+    def save_index(cls) -> None:
+        # Least recently used first out, until the cache fits
+        max_bytes = const["IMAGE_COMPARISON"]["cache_max_mb"] * 1024 * 1024
+        total_bytes = sum(entry["size"] for entry in cls._index.values())
+        for key, entry in sorted(cls._index.items(), key=lambda item: item[1]["used_at"]):
+            if total_bytes <= max_bytes:
+                break
+            try:
+                os.remove(cls.get_cache_path(key))
+            except FileNotFoundError:
+                pass
+            total_bytes -= entry["size"]
+            del cls._index[key]
+
+        path = cls.get_cache_path("index.json")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(cls._index, file, indent=2)
+        os.replace(temp_path, path)
+
+    # ------------------------------------------
+    # Hashes
+    # ------------------------------------------
+    @staticmethod
+    def get_hash(content: bytes) -> Optional[str]:
+        """Difference hash: is each pixel brighter than its right neighbour?"""
+        try:
+            with Image.open(BytesIO(content)) as image:
+                pixels = np.asarray(
+                    image.convert("L").resize((9, 8), Image.Resampling.LANCZOS), dtype=np.int16
+                )
+        except (UnidentifiedImageError, OSError, ValueError):
+            return None
+
+        bits = pixels[:, 1:] > pixels[:, :-1]
+        return np.packbits(bits).tobytes().hex()
+
+    @staticmethod
+    def get_distance(hash_a: str, hash_b: str) -> int:
+        return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+    @classmethod
+    def get_image_hash(cls, url: str) -> Optional[str]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        with cls._lock:
+            entry = cls._index.get(key)
+
+        # Revalidate a cached image with its validators
+        headers = {}
+        if entry is not None and os.path.isfile(cls.get_cache_path(key)):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            with Tracer.span("image fetch", url=url):
+                response = HttpFetcher.get(url, headers)
+            if response.status_code == 304 and headers:
+                with open(cls.get_cache_path(key), "rb") as file:
+                    content = file.read()
+                # Looked up again: another worker or a reload may have replaced it
+                with cls._lock:
+                    entry = cls._index.get(key)
+                    if entry is not None:
+                        entry["used_at"] = datetime.now().isoformat(timespec="seconds")
+                    cls.reuse_count += 1
+                Metrics.inc("image_fetches_total", result="not_modified")
+                return cls.get_hash(content)
+            response.raise_for_status()
+        except (requests.RequestException, SiteDownError, OSError) as e:
+            logging.warning(f"Could not download the hero image {url}: {e}")
+            Metrics.inc("image_fetches_total", result="failed")
+            return None
+
+        image_hash = cls.get_hash(response.content)
+
+        temp_path = cls.get_cache_path(f"{key}.{threading.get_ident()}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(response.content)
+        os.replace(temp_path, cls.get_cache_path(key))
+
+        with cls._lock:
+            cls._index[key] = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "size": len(response.content),
+                "used_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            cls.download_count += 1
+        Metrics.inc("image_fetches_total", result="downloaded")
+        return image_hash
+
+    # ------------------------------------------
+    # Compare the hero images table
+    # ------------------------------------------
+    @classmethod
+    def compare_images(cls, images_df: pd.DataFrame) -> pd.DataFrame:
+        """The table with content comparisons wherever both images hash."""
+        if (
+            images_df.empty
+            or not const["IMAGE_COMPARISON"]["enabled"]
+            or SnapshotStore.is_replaying()
+        ):
+            return images_df
+
+        source_columns = ["Ford Manufacturer Image Source", "Ford Dealer Image Source"]
+        urls: List[str] = sorted(
+            {
+                url
+                for url in images_df[source_columns].to_numpy().flatten()
+                if url and urlparse(url).path.lower().endswith(HASHED_EXTENSIONS)
+            }
+        )
+
+        os.makedirs(const["IMAGE_COMPARISON"]["cache_dir"], exist_ok=True)
+        with cls._lock:
+            cls.load_index()
+            cls.download_count = 0
+            cls.reuse_count = 0
+
+        with ThreadPoolExecutor(
+            max_workers=const["IMAGE_COMPARISON"]["workers"], thread_name_prefix="image"
+        ) as executor:
+            hashes = dict(zip(urls, executor.map(cls.get_image_hash, urls)))
+
+        with cls._lock:
+            cls.save_index()
+
+        images_df = images_df.copy()
+        for index, row in images_df.iterrows():
+            mfr_hash = hashes.get(row["Ford Manufacturer Image Source"])
+            dealer_hash = hashes.get(row["Ford Dealer Image Source"])
+            if mfr_hash is None or dealer_hash is None:
+                continue
+
+            distance = cls.get_distance(mfr_hash, dealer_hash)
+            same_image = distance <= const["IMAGE_COMPARISON"]["max_distance"]
+            images_df.loc[index, "Image Comparison"] = "Match" if same_image else "Mismatch"
+            images_df.loc[index, "Compared By"] = "image content"
+
+        logging.info(
+            f"Hero images: {len(urls)} compared by content, {cls.download_count} downloaded, "
+            f"{cls.reuse_count} unchanged in the cache"
+        )
+        return images_df
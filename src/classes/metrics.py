@@ -0,0 +1,222 @@
+# Built-in Packages
+from bisect import bisect_left
+from contextlib import contextmanager
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+METRIC_PREFIX = "ford_prices_"
+
+# Page loads take from a fraction of a second (HTTP) to the page load timeout
+PAGE_LOAD_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+# name: (type, help, buckets)
+METRICS: Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]] = {
+    "page_load_seconds": ("histogram", "Page load latency per host, browser page loads and HTTP fetches.", PAGE_LOAD_BUCKETS),
+    "webdriver_commands_total": ("counter", "WebDriver commands (browser round trips) per extractor.", None),
+    "http_response_bytes_total": ("counter", "Bytes of HTTP-first page responses per host.", None),
+    "retries_total": ("counter", "Work done again after a failure, by reason.", None),
+    "skipped_total": ("counter", "Vehicle data left out of the report after retries or an open circuit.", None),
+    "circuit_opened_total": ("counter", "Times a host's circuit breaker opened.", None),
+    "fingerprint_reuses_total": ("counter", "Pages whose prices were reused because their fingerprint was unchanged.", None),
+    "image_fetches_total": ("counter", "Hero image requests of the image comparison, by result (downloaded, not_modified, failed).", None),
+    "readiness_timeouts_total": ("counter", "Readiness waits that timed out per host.", None),
+    "extraction_rows": ("gauge", "Rows an extractor returned for a URL.", None),
+    "extraction_errors_total": ("counter", "Extractions that failed and returned an error row.", None),
+    "run_duration_seconds": ("gauge", "Duration of the last run.", None),
+    "run_success": ("gauge", "1 when the last run completed, 0 when it failed.", None),
+    "run_timestamp_seconds": ("gauge", "Unix time the last run finished.", None),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """
+    Run metrics for production monitoring.
+
+    - inc() and set() update counters and gauges, observe() and timer()
+      add to histograms; every call names a metric declared in METRICS.
+    - scope() labels the WebDriver commands sent by the current thread,
+      so the commands can be counted per extractor.
+    - write_prometheus() writes the Prometheus text format for the node
+      exporter textfile collector; write_json() writes the same values
+      as JSON. Both replace their file atomically.
+    """
+
+    _values: Dict[Tuple[str, Labels], float] = {}
+    _histograms: Dict[Tuple[str, Labels], List[float]] = {}
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    @staticmethod
+    def _labels(labels: Dict[str, object]) -> Labels:
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    # ------------------------------------------
+    # Counters, gauges and histograms
+    # ------------------------------------------
+    @classmethod
+    def inc(cls, name: str, value: float = 1, **labels) -> None:
+        key = (name, cls._labels(labels))
+        with cls._lock:
+            cls._values[key] = cls._values.get(key, 0) + value
+
+    @classmethod
+    def set(cls, name: str, value: float, **labels) -> None:
+        with cls._lock:
+            cls._values[(name, cls._labels(labels))] = value
+
+    @classmethod
+    def observe(cls, name: str, value: float, **labels) -> None:
+        buckets = METRICS[name][2]
+        key = (name, cls._labels(labels))
+        with cls._lock:
+            # Bucket counts followed by the sum and the count
+            histogram = cls._histograms.setdefault(key, [0] * len(buckets) + [0.0, 0])
+            for index in range(bisect_left(buckets, value), len(buckets)):
+                histogram[index] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    @classmethod
+    @contextmanager
+    def timer(cls, name: str, **labels):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, time.perf_counter() - start_time, **labels)
+
+    # ------------------------------------------
+    # Labels of the current thread's WebDriver commands
+    # ------------------------------------------
+    @classmethod
+    @contextmanager
+    def scope(cls, **labels):
+        previous = getattr(cls._local, "labels", None)
+        cls._local.labels = labels
+        try:
+            yield
+        finally:
+            cls._local.labels = previous
+
+    @classmethod
+    def get_scope(cls) -> Dict[str, str]:
+        return getattr(cls._local, "labels", None) or {"extractor": "other", "host": "other"}
+
+    @classmethod
+    def count_commands(cls, driver) -> None:
+        """Count every command the driver sends, elements' included."""
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            cls.inc("webdriver_commands_total", **cls.get_scope())
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+
+    # ------------------------------------------
+    # Export
+    # ------------------------------------------
+    @classmethod
+    def get_samples(cls) -> List[dict]:
+        with cls._lock:
+            values = dict(cls._values)
+            histograms = {key: list(value) for key, value in cls._histograms.items()}
+
+        samples = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(values.items())
+        ]
+        for (name, labels), histogram in sorted(histograms.items()):
+            buckets = METRICS[name][2]
+            samples.append(
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "buckets": dict(zip(map(str, buckets), histogram[:-2])),
+                    "sum": histogram[-2],
+                    "count": histogram[-1],
+                }
+            )
+        return samples
+
+    @classmethod
+    def get_prometheus_text(cls) -> str:
+        samples_by_name: Dict[str, List[dict]] = {}
+        for sample in cls.get_samples():
+            samples_by_name.setdefault(sample["name"], []).append(sample)
+
+        lines = []
+        for name, (metric_type, help_text, _) in METRICS.items():
+            if name not in samples_by_name:
+                continue
+            full_name = METRIC_PREFIX + name
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+
+            for sample in samples_by_name[name]:
+                if metric_type != "histogram":
+                    lines.append(f"{full_name}{cls._format_labels(sample['labels'])} {cls._format_value(sample['value'])}")
+                    continue
+                for bound, count in sample["buckets"].items():
+                    labels = {**sample["labels"], "le": bound}
+                    lines.append(f"{full_name}_bucket{cls._format_labels(labels)} {count}")
+                labels = {**sample["labels"], "le": "+Inf"}
+                lines.append(f"{full_name}_bucket{cls._format_labels(labels)} {sample['count']}")
+                lines.append(f"{full_name}_sum{cls._format_labels(sample['labels'])} {cls._format_value(sample['sum'])}")
+                lines.append(f"{full_name}_count{cls._format_labels(sample['labels'])} {sample['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, str]) -> str:
+        if not labels:
+            return ""
+        escaped = (
+            (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+            for name, value in labels.items()
+        )
+        return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+    @classmethod
+    def write_prometheus(cls, path: str) -> None:
+        if path:
+            cls._write_atomic(path, cls.get_prometheus_text())
+
+    @classmethod
+    def write_json(cls, path: str) -> None:
+        if path:
+            content = json.dumps(
+                {"prefix": METRIC_PREFIX, "metrics": cls.get_samples()}, indent=2
+            )
+            cls._write_atomic(path, content + "\n")
+
+    @staticmethod
+    def _write_atomic(path: str, content: str) -> None:
+        # The textfile collector must never read a half written file
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+        logging.info(f"Metrics written to {path}")
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._values = {}
+            cls._histograms = {}
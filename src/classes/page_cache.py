@@ -0,0 +1,104 @@
+# 3rd Party Pacakges
+from selenium.common.exceptions import WebDriverException
+
+# Built-in Packages
+import logging
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.host_scheduler import HostScheduler
+from classes.metrics import Metrics
+from classes.page_readiness import PageReadiness
+from classes.site_health import SiteHealth
+from classes.tracer import Tracer
+from utilities.retry import call_with_retry
+from utilities.site_urls import redirect_url
+
+
+class PageCache:
+    """
+    Run-scoped cache of loaded pages, keyed by URL.
+
+    - load() skips driver.get() when the driver is already showing the URL,
+      so the hero image extractor reuses the page the price extractor just
+      loaded. It then waits until the extractor's locator is present.
+      Failed page loads are retried with backoff, and a host whose circuit
+      is open (SiteHealth) fails at once with SiteDownError.
+    - extract() memoizes an extractor result per (kind, url). Vehicles that
+      share a URL (e.g. SUPER_DUTY and SUPER_DUTY_COMMERCIAL dealer pages)
+      scrape it once; a second worker asking for the same key waits for the
+      first one instead of loading the page again.
+
+    Extractors for a given kind and URL must be interchangeable, which holds
+    for every URL shared in constants.py.
+    """
+
+    _results: Dict[Tuple[str, str], Any] = {}
+    _key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    _lock = threading.Lock()
+    page_loads = 0
+    page_reuses = 0
+
+    @classmethod
+    def load(cls, driver, url: str, ready_xpath: str) -> None:
+        if getattr(driver, "loaded_url", None) == url:
+            with cls._lock:
+                cls.page_reuses += 1
+        else:
+            call_with_retry(
+                lambda: cls._navigate(driver, url),
+                const["RETRY"]["page_attempts"],
+                f"Loading {url}",
+                "page_load",
+                retry_on=(WebDriverException,),
+            )
+            driver.loaded_url = url
+            with cls._lock:
+                cls.page_loads += 1
+
+        # Returns as soon as the element is present, even on a reused page
+        PageReadiness.wait_for(driver, ready_xpath, url)
+
+    @staticmethod
+    def _navigate(driver, url: str) -> None:
+        SiteHealth.check(url)
+
+        host = HostScheduler.get_host(url)
+        try:
+            with HostScheduler.throttle(url), Tracer.span("navigate", url=url), Metrics.timer(
+                "page_load_seconds", host=host, method="browser"
+            ):
+                driver.get(redirect_url(url))
+        except WebDriverException as e:
+            SiteHealth.record_failure(url, e)
+            raise
+        SiteHealth.record_success(url)
+
+    @classmethod
+    def extract(cls, kind: str, url: str, extractor: Callable[[str], Any]) -> Any:
+        key = (kind, url)
+        with cls._lock:
+            key_lock = cls._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key in cls._results:
+                logging.info(f"Reusing {kind} extracted earlier in this run for {url}")
+                return cls._results[key]
+
+            # WebDriver commands are counted per extractor and host
+            with Metrics.scope(extractor=kind, host=HostScheduler.get_host(url)):
+                result = extractor(url)
+            if isinstance(result, list):
+                Metrics.set("extraction_rows", len(result), extractor=kind, url=url)
+            cls._results[key] = result
+            return result
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._results = {}
+            cls._key_locks = {}
+            cls.page_loads = 0
+            cls.page_reuses = 0
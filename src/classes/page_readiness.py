@@ -0,0 +1,115 @@
+# 3rd Party Pacakges
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Built-in Packages
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.metrics import Metrics
+from classes.tracer import Tracer
+
+
+class PageReadiness:
+    """
+    Condition-based waits that replace the fixed time.sleep() calls.
+
+    Each wait polls for the locator an extractor actually needs and returns
+    as soon as it is satisfied, bounded by the per-site timeout in
+    PAGE_READY_TIMEOUTS. The timeout is looked up from the site URL the
+    extractor was given, not driver.current_url, which SITE_URL_OVERRIDES
+    may point at a stand-in or replay host. Every wait is recorded so the
+    run can report how long the pages really took to become ready.
+    """
+
+    _waits: List[Tuple[str, str, float, bool]] = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_timeout(url: Optional[str]) -> float:
+        timeouts = const["PAGE_READY_TIMEOUTS"]
+        host = urlparse(url).hostname if url else None
+        return timeouts.get(host, timeouts["default"])
+
+    @classmethod
+    def wait_until(
+        cls, driver, condition: Callable, description: str, url: Optional[str] = None
+    ) -> bool:
+        host = (urlparse(url).hostname if url else None) or "unknown"
+        wait = WebDriverWait(
+            driver,
+            cls.get_timeout(url),
+            poll_frequency=const["PAGE_READY_POLL_INTERVAL"],
+            ignored_exceptions=(WebDriverException,),
+        )
+
+        start_time = time.perf_counter()
+        try:
+            with Tracer.span("readiness wait", locator=description):
+                wait.until(condition)
+            ready = True
+        except TimeoutException:
+            ready = False
+            logging.warning(f"Timed out on {host} waiting for {description}")
+            Metrics.inc("readiness_timeouts_total", host=host)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        with cls._lock:
+            cls._waits.append((host, description, elapsed_seconds, ready))
+
+        return ready
+
+    # ------------------------------------------
+    # Wait for an element located by XPath
+    # ------------------------------------------
+    @classmethod
+    def wait_for(cls, driver, xpath: str, url: str, visible: bool = False) -> bool:
+        locator = (By.XPATH, xpath)
+        condition = (
+            EC.visibility_of_any_elements_located(locator)
+            if visible
+            else EC.presence_of_element_located(locator)
+        )
+        return cls.wait_until(driver, condition, xpath, url)
+
+    # ------------------------------------------
+    # Wait for a clicked carousel indicator to become the active one
+    # ------------------------------------------
+    @classmethod
+    def wait_for_active(cls, driver, element, url: str) -> bool:
+        return cls.wait_until(
+            driver,
+            lambda _: "active" in (element.get_attribute("class") or ""),
+            "active carousel indicator",
+            url,
+        )
+
+    # ------------------------------------------
+    # Log how long the waits really took per site
+    # ------------------------------------------
+    @classmethod
+    def log_summary(cls) -> None:
+        with cls._lock:
+            waits = list(cls._waits)
+
+        for host in sorted({wait[0] for wait in waits}):
+            host_waits = [wait for wait in waits if wait[0] == host]
+            durations = [wait[2] for wait in host_waits]
+            timeouts = sum(1 for wait in host_waits if not wait[3])
+            logging.info(
+                f"Readiness waits on {host}: {len(durations)} waits, "
+                f"avg {sum(durations) / len(durations):.2f}s, "
+                f"max {max(durations):.2f}s, {timeouts} timed out"
+            )
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._waits = []
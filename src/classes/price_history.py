@@ -0,0 +1,310 @@
+# 3rd Party Pacakges
+import pandas as pd
+
+# Built-in Packages
+from contextlib import closing
+from datetime import datetime, timedelta
+import glob
+import logging
+import os
+import sqlite3
+from typing import Iterable, Optional
+
+# Local Packages
+from utilities.constants import constants as const
+
+TABLES = ("vehicle_prices", "nav_prices", "hero_images")
+
+# Prices of the vehicle and navigation rows, as scraped and as parsed
+PRICE_COLUMNS = [
+    "manufacturer_price",
+    "dealer_price",
+    "manufacturer_cents",
+    "dealer_cents",
+    "manufacturer_parse_status",
+    "dealer_parse_status",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    run_at TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vehicle_prices (
+    run_id TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    date TEXT NOT NULL,
+    vehicle TEXT NOT NULL,
+    model TEXT NOT NULL,
+    manufacturer_price TEXT,
+    dealer_price TEXT,
+    manufacturer_cents INTEGER,
+    dealer_cents INTEGER,
+    manufacturer_parse_status TEXT,
+    dealer_parse_status TEXT,
+    comparison TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vehicle_prices_by_vehicle_model
+    ON vehicle_prices (vehicle, model, run_at);
+CREATE INDEX IF NOT EXISTS vehicle_prices_by_model
+    ON vehicle_prices (model, run_at);
+CREATE INDEX IF NOT EXISTS vehicle_prices_mismatches
+    ON vehicle_prices (run_at) WHERE comparison = 'Mismatch';
+
+CREATE TABLE IF NOT EXISTS nav_prices (
+    run_id TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    date TEXT NOT NULL,
+    category TEXT,
+    model TEXT NOT NULL,
+    manufacturer_price TEXT,
+    dealer_price TEXT,
+    manufacturer_cents INTEGER,
+    dealer_cents INTEGER,
+    manufacturer_parse_status TEXT,
+    dealer_parse_status TEXT,
+    comparison TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nav_prices_by_model
+    ON nav_prices (model, run_at);
+CREATE INDEX IF NOT EXISTS nav_prices_mismatches
+    ON nav_prices (run_at) WHERE comparison = 'Mismatch';
+
+CREATE TABLE IF NOT EXISTS hero_images (
+    run_id TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    date TEXT NOT NULL,
+    vehicle TEXT NOT NULL,
+    manufacturer_filename TEXT,
+    dealer_filename TEXT,
+    comparison TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hero_images_by_vehicle
+    ON hero_images (vehicle, run_at);
+CREATE INDEX IF NOT EXISTS hero_images_mismatches
+    ON hero_images (run_at) WHERE comparison = 'Mismatch';
+"""
+
+
+class PriceHistory:
+    """
+    Append-only history of every run's prices and hero image filenames.
+
+    - Parquet: the archive, one file per run and table, partitioned by
+      date (HISTORY_DIR/parquet/<table>/date=YYYY-MM-DD/<run_id>.parquet),
+      for pandas/pyarrow/DuckDB analysis.
+    - SQLite: the same rows in HISTORY_DIR/history.db, indexed by
+      (vehicle, model, time) and on the mismatches, so the query helpers
+      answer in milliseconds after years of runs. rebuild_index()
+      recreates it from the Parquet files.
+    """
+
+    # ------------------------------------------
+    # Storage
+    # ------------------------------------------
+    @staticmethod
+    def get_parquet_dir(table: str) -> str:
+        return os.path.join(const["HISTORY_DIR"], "parquet", table)
+
+    @staticmethod
+    def connect() -> sqlite3.Connection:
+        os.makedirs(const["HISTORY_DIR"], exist_ok=True)
+        connection = sqlite3.connect(os.path.join(const["HISTORY_DIR"], "history.db"))
+        connection.executescript(SCHEMA)
+
+        # Parse status columns, added after the first runs were saved
+        for table in ("vehicle_prices", "nav_prices"):
+            existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+            for column in ("manufacturer_parse_status", "dealer_parse_status"):
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+        return connection
+
+    # ------------------------------------------
+    # Save a run
+    # ------------------------------------------
+    @classmethod
+    def save_run(
+        cls,
+        run_at: datetime,
+        prices_df: pd.DataFrame,
+        nav_prices_df: Optional[pd.DataFrame],
+        all_model_images_df: pd.DataFrame,
+        error_models: Iterable[str] = (),
+    ) -> None:
+        run_id = run_at.strftime("%Y%m%d-%H%M%S")
+        tables = {
+            "vehicle_prices": cls.get_vehicle_prices_rows(prices_df, error_models),
+            "nav_prices": cls.get_nav_prices_rows(nav_prices_df),
+            "hero_images": cls.get_hero_images_rows(all_model_images_df),
+        }
+        for table, df in tables.items():
+            df.insert(0, "date", run_at.strftime("%Y-%m-%d"))
+            df.insert(0, "run_at", run_at.strftime("%Y-%m-%d %H:%M:%S"))
+            df.insert(0, "run_id", run_id)
+
+        # Parquet first: the index can always be rebuilt from the archive
+        for table, df in tables.items():
+            if not df.empty:
+                cls.write_parquet(table, run_at, run_id, df)
+
+        with closing(cls.connect()) as connection, connection:
+            connection.execute(
+                "INSERT INTO runs (run_id, run_at, date) VALUES (?, ?, ?)",
+                (run_id, run_at.strftime("%Y-%m-%d %H:%M:%S"), run_at.strftime("%Y-%m-%d")),
+            )
+            for table, df in tables.items():
+                cls.insert_rows(connection, table, df)
+
+        logging.info(
+            "Price history saved: "
+            + ", ".join(f"{len(df)} {table} rows" for table, df in tables.items())
+        )
+
+    @classmethod
+    def write_parquet(cls, table: str, run_at: datetime, run_id: str, df: pd.DataFrame) -> None:
+        partition_dir = os.path.join(
+            cls.get_parquet_dir(table), f"date={run_at.strftime('%Y-%m-%d')}"
+        )
+        os.makedirs(partition_dir, exist_ok=True)
+
+        # The partition column lives in the directory name, like pyarrow datasets
+        path = os.path.join(partition_dir, f"{run_id}.parquet")
+        df.drop(columns=["date"]).to_parquet(f"{path}.tmp", engine="pyarrow", index=False)
+        os.replace(f"{path}.tmp", path)
+
+    @staticmethod
+    def insert_rows(connection: sqlite3.Connection, table: str, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        columns = ", ".join(df.columns)
+        placeholders = ", ".join("?" for _ in df.columns)
+        rows = (
+            tuple(None if pd.isna(value) else value for value in row)
+            for row in df.astype(object).itertuples(index=False, name=None)
+        )
+        connection.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows
+        )
+
+    # ------------------------------------------
+    # Report frames to history rows
+    # ------------------------------------------
+    @staticmethod
+    def get_vehicle_prices_rows(
+        prices_df: pd.DataFrame, error_models: Iterable[str] = ()
+    ) -> pd.DataFrame:
+        """Rows of compare_vehicle_prices(), already parsed to cents."""
+        df = prices_df[["vehicle", "model", *PRICE_COLUMNS, "comparison"]]
+
+        # Error rows hold an error message, not a price
+        return df[~df["model"].isin(list(error_models))].reset_index(drop=True)
+
+    @staticmethod
+    def get_nav_prices_rows(nav_prices_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Rows of create_navigation_prices_df(), already parsed to cents."""
+        columns = ["category", "model", *PRICE_COLUMNS, "comparison"]
+        if nav_prices_df is None:
+            return pd.DataFrame(columns=columns)
+        return nav_prices_df.rename(
+            columns={"Category": "category", "Car Model": "model", "Price Comparison": "comparison"}
+        )[columns].reset_index(drop=True)
+
+    @staticmethod
+    def get_hero_images_rows(all_model_images_df: pd.DataFrame) -> pd.DataFrame:
+        if all_model_images_df.empty:
+            return pd.DataFrame(
+                columns=["vehicle", "manufacturer_filename", "dealer_filename", "comparison"]
+            )
+        return pd.DataFrame(
+            {
+                "vehicle": all_model_images_df["Model Hero Image"],
+                "manufacturer_filename": all_model_images_df["Ford Manufacturer Image Filename"],
+                "dealer_filename": all_model_images_df["Ford Dealer Image Filename"],
+                "comparison": all_model_images_df["Image Comparison"],
+            }
+        ).reset_index(drop=True)
+
+    # ------------------------------------------
+    # Query helpers - served by the SQLite indexes
+    # ------------------------------------------
+    @classmethod
+    def query(cls, sql: str, params: tuple = ()) -> pd.DataFrame:
+        with closing(cls.connect()) as connection:
+            return pd.read_sql_query(sql, connection, params=params)
+
+    @staticmethod
+    def get_since(days: Optional[float]) -> str:
+        if days is None:
+            return ""
+        return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+    @classmethod
+    def get_model_price_history(
+        cls, model: str, vehicle: Optional[str] = None, days: Optional[float] = None
+    ) -> pd.DataFrame:
+        """Prices of a model over time, oldest first."""
+        sql = (
+            "SELECT run_at, vehicle, model, manufacturer_price, dealer_price, "
+            "manufacturer_cents, dealer_cents, comparison "
+            "FROM vehicle_prices WHERE model = ?"
+        )
+        params: tuple = (model,)
+        if vehicle is not None:
+            sql += " AND vehicle = ?"
+            params += (vehicle,)
+        sql += " AND run_at >= ? ORDER BY run_at"
+        return cls.query(sql, params + (cls.get_since(days),))
+
+    @classmethod
+    def get_mismatches(cls, days: float = 30, table: str = "vehicle_prices") -> pd.DataFrame:
+        """Mismatched rows of a table in the last days, newest first."""
+        if table not in TABLES:
+            raise ValueError(f"Unknown history table '{table}'. Use one of {', '.join(TABLES)}.")
+
+        # The literal comparison lets SQLite use the partial mismatch index
+        return cls.query(
+            f"SELECT * FROM {table} WHERE comparison = 'Mismatch' AND run_at >= ? "
+            "ORDER BY run_at DESC",
+            (cls.get_since(days),),
+        )
+
+    @classmethod
+    def get_price_changes(
+        cls, model: str, vehicle: Optional[str] = None, days: Optional[float] = None
+    ) -> pd.DataFrame:
+        """Only the runs where the model's manufacturer or dealer price changed."""
+        df = cls.get_model_price_history(model, vehicle, days)
+        prices = df[["manufacturer_cents", "dealer_cents"]].astype("float")
+        previous = prices.groupby(df["vehicle"]).shift()
+
+        # The first run of each vehicle has no previous price and is kept
+        changed = (prices.ne(previous) & ~(prices.isna() & previous.isna())).any(axis=1)
+        return df[changed].reset_index(drop=True)
+
+    # ------------------------------------------
+    # Rebuild the SQLite index from the Parquet archive
+    # ------------------------------------------
+    @classmethod
+    def rebuild_index(cls) -> None:
+        database_path = os.path.join(const["HISTORY_DIR"], "history.db")
+        if os.path.exists(database_path):
+            os.remove(database_path)
+
+        with closing(cls.connect()) as connection, connection:
+            runs = {}
+            for table in TABLES:
+                for path in sorted(glob.glob(os.path.join(cls.get_parquet_dir(table), "date=*", "*.parquet"))):
+                    df = pd.read_parquet(path, engine="pyarrow")
+                    df.insert(2, "date", os.path.basename(os.path.dirname(path))[len("date="):])
+                    runs[df["run_id"].iloc[0]] = (df["run_at"].iloc[0], df["date"].iloc[0])
+                    cls.insert_rows(connection, table, df)
+
+            connection.executemany(
+                "INSERT INTO runs (run_id, run_at, date) VALUES (?, ?, ?)",
+                [(run_id, run_at, date) for run_id, (run_at, date) in sorted(runs.items())],
+            )
+
+        logging.info(f"Price history index rebuilt from {len(runs)} runs")
@@ -0,0 +1,212 @@
+# 3rd Party Pacakges
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+import pandas as pd
+
+# Built-in Packages
+from functools import cached_property
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.tracer import Tracer
+
+# src/templates
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+# Columns whose "Mismatch" cells are highlighted - one per report table
+STATUS_COLUMNS = ("Comparison Result", "Price Comparison", "Image Comparison")
+
+# Columns kept in the records for the comparisons and the price history,
+# but not shown in the report
+HIDDEN_COLUMNS = [
+    "Ford Manufacturer Image Source",
+    "Ford Dealer Image Source",
+    "manufacturer_price",
+    "dealer_price",
+    "manufacturer_cents",
+    "dealer_cents",
+    "manufacturer_parse_status",
+    "dealer_parse_status",
+]
+
+
+class Report:
+    """
+    A report rendered once, shared by the email (HTML and plain text
+    parts) and the archived HTML file.
+    """
+
+    def __init__(self, html_chunks: List[str], text: str, has_mismatch: bool, has_skipped: bool):
+        self.html_chunks = html_chunks
+        self.text = text
+        self.has_mismatch = has_mismatch
+        self.has_skipped = has_skipped
+
+    @cached_property
+    def html(self) -> str:
+        return "".join(self.html_chunks)
+
+    def get_subject(self, subject: str) -> str:
+        subject_prepend = "[Mismatch Found] - " if self.has_mismatch else ""
+        if self.has_skipped:
+            subject_prepend += "[Vehicles Skipped] - "
+        return f"{subject_prepend} {subject}"
+
+    def write(self, path: str) -> None:
+        """Archive the HTML, chunk by chunk."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.writelines(self.html_chunks)
+        os.replace(temp_path, path)
+
+
+class ReportRenderer:
+    """
+    Renders the comparison report from the templates in src/templates.
+
+    - The templates are compiled once per process and kept: the
+      environment doesn't check the files again (no auto reload).
+    - Tables are passed as columns and row tuples straight from the
+      comparison frames; the templates highlight the Mismatch cells, so
+      there is no per-cell callback.
+    - The HTML is streamed from the template in chunks, which the Report
+      keeps for the archive and joins once for the email.
+    """
+
+    _environment: Optional[Environment] = None
+    _templates: Dict[str, Template] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_template(cls, name: str) -> Template:
+        with cls._lock:
+            if cls._environment is None:
+                cls._environment = Environment(
+                    loader=FileSystemLoader(TEMPLATE_DIR),
+                    autoescape=select_autoescape(["html"]),
+                    undefined=StrictUndefined,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                    auto_reload=False,
+                )
+            if name not in cls._templates:
+                cls._templates[name] = cls._environment.get_template(name)
+            return cls._templates[name]
+
+    # ------------------------------------------
+    # Context
+    # ------------------------------------------
+    @staticmethod
+    def get_table(df: pd.DataFrame) -> dict:
+        df = df.drop(columns=HIDDEN_COLUMNS, errors="ignore")
+        columns = list(df.columns)
+        status_index = next(
+            (index for index, column in enumerate(columns) if column in STATUS_COLUMNS), None
+        )
+        rows = df.astype(object).where(df.notna(), "").itertuples(index=False, name=None)
+        return {"columns": columns, "rows": list(rows), "status_index": status_index}
+
+    @staticmethod
+    def get_status(df: Optional[pd.DataFrame], column: str) -> str:
+        return "Mismatch" if df is not None and df[column].eq("Mismatch").any() else "All Match"
+
+    @classmethod
+    def build_context(
+        cls,
+        vehicles_list_html: List[Tuple[str, pd.DataFrame, str, str]],
+        all_model_images_df: pd.DataFrame,
+        nav_prices_df: Optional[pd.DataFrame],
+        skipped: List[Tuple[str, str, str]],
+    ) -> dict:
+        # Summary - Skipped vehicles, Navigation, Vehicles, then Images
+        summary = []
+        if skipped:
+            summary.append(
+                {"title": "SKIPPED VEHICLES", "anchor": "skipped", "result": f"{len(skipped)} Skipped"}
+            )
+        if nav_prices_df is not None:
+            summary.append(
+                {
+                    "title": "NAVIGATION MENU PRICES",
+                    "anchor": "nav_prices",
+                    "result": cls.get_status(nav_prices_df, "Price Comparison"),
+                }
+            )
+
+        vehicles = []
+        for vehicle_name, vehicle_df, manufacturer_url, dealer_url in vehicles_list_html:
+            vehicle_id = vehicle_name.replace("™", "").replace("®", "").replace(" ", "_")
+            summary.append(
+                {
+                    "title": vehicle_name,
+                    "anchor": vehicle_id,
+                    "result": "All Match" if vehicle_df["Price Comparison"].eq("Match").all() else "Mismatch",
+                }
+            )
+            vehicles.append(
+                {
+                    "name": vehicle_name,
+                    "anchor": vehicle_id,
+                    "manufacturer_url": manufacturer_url,
+                    "dealer_url": dealer_url,
+                    "table": cls.get_table(vehicle_df),
+                }
+            )
+
+        if not all_model_images_df.empty:
+            summary.append(
+                {
+                    "title": "MODEL HERO IMAGES",
+                    "anchor": "hero_images",
+                    "result": cls.get_status(all_model_images_df, "Image Comparison"),
+                }
+            )
+
+        return {
+            "images_compared": not const["EMAIL_IMG_COMPARISON_SKIP"],
+            "summary": summary,
+            "skipped": (
+                cls.get_table(pd.DataFrame(skipped, columns=["Vehicle", "Data", "Reason"]))
+                if skipped
+                else None
+            ),
+            "navigation": (
+                {
+                    "manufacturer_url": const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"],
+                    "dealer_url": const["MAIN_NAVIGATION_MENU_DEALER_URL"],
+                    "table": cls.get_table(nav_prices_df),
+                }
+                if nav_prices_df is not None
+                else None
+            ),
+            "vehicles": vehicles,
+            "images": None if all_model_images_df.empty else cls.get_table(all_model_images_df),
+        }
+
+    # ------------------------------------------
+    # Render
+    # ------------------------------------------
+    @classmethod
+    def render(
+        cls,
+        vehicles_list_html: List[Tuple[str, pd.DataFrame, str, str]],
+        all_model_images_df: pd.DataFrame,
+        nav_prices_df: Optional[pd.DataFrame],
+        skipped: Optional[List[Tuple[str, str, str]]] = None,
+    ) -> Report:
+        skipped = skipped or []
+
+        with Tracer.span("render"):
+            context = cls.build_context(vehicles_list_html, all_model_images_df, nav_prices_df, skipped)
+            html_chunks = list(cls.get_template("report.html").generate(context))
+            text = cls.get_template("report.txt").render(context)
+
+        return Report(
+            html_chunks,
+            text,
+            has_mismatch=any(section["result"] == "Mismatch" for section in context["summary"]),
+            has_skipped=bool(skipped),
+        )
@@ -0,0 +1,63 @@
+# 3rd Party Pacakges
+import pandas as pd
+
+# Built-in Packages
+import threading
+from typing import Dict, List
+
+# Columns of each report table, in report order
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    "hero_images": [
+        "Model Hero Image",
+        "Ford Manufacturer Image URL",
+        "Ford Manufacturer Image Filename",
+        "Ford Dealer Image URL",
+        "Ford Dealer Image Filename",
+        "Image Comparison",
+        "Compared By",
+        "Ford Manufacturer Image Source",
+        "Ford Dealer Image Source",
+    ],
+}
+
+
+class ResultCollector:
+    """
+    Report rows gathered during the run, as plain records.
+
+    - add() appends a record (a dict keyed by the table's columns) and can
+      be called from any worker thread.
+    - get_frame() builds the table's DataFrame once, at report time,
+      instead of concatenating a growing frame for every vehicle. The frame
+      is kept until another record is added to the table.
+    """
+
+    _records: Dict[str, List[dict]] = {}
+    _frames: Dict[str, pd.DataFrame] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def add(cls, table: str, record: dict) -> None:
+        with cls._lock:
+            cls._records.setdefault(table, []).append(record)
+            cls._frames.pop(table, None)
+
+    @classmethod
+    def get_frame(cls, table: str) -> pd.DataFrame:
+        with cls._lock:
+            if table not in cls._frames:
+                cls._frames[table] = pd.DataFrame.from_records(
+                    cls._records.get(table, []), columns=TABLE_COLUMNS[table]
+                )
+            return cls._frames[table]
+
+    @classmethod
+    def count(cls, table: str) -> int:
+        with cls._lock:
+            return len(cls._records.get(table, []))
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._records = {}
+            cls._frames = {}
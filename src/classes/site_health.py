@@ -0,0 +1,124 @@
+# Built-in Packages
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.host_scheduler import HostScheduler
+from classes.metrics import Metrics
+from classes.snapshot_store import SnapshotStore
+
+
+class SiteDownError(Exception):
+    """Raised instead of loading a page from a host whose circuit is open."""
+
+
+class SiteHealth:
+    """
+    Per-host circuit breaker, and the work the run skipped because of it.
+
+    - record_failure() counts consecutive page load and HTTP failures per
+      host. At CIRCUIT_BREAKER failure_threshold the host's circuit opens.
+    - check() raises SiteDownError while the circuit is open, so the
+      remaining pages of a dead host fail in milliseconds instead of each
+      waiting for its timeouts and retries.
+    - After reset_seconds one request is let through again (half open):
+      a success closes the circuit, a failure opens it for another period.
+    - record_skip() keeps which vehicles were skipped and why, for the
+      report.
+    """
+
+    _failures: Dict[str, int] = {}
+    _opened_at: Dict[str, float] = {}
+    _last_errors: Dict[str, str] = {}
+    _skipped: List[Tuple[str, str, str]] = []
+    _lock = threading.Lock()
+
+    # ------------------------------------------
+    # Circuit breaker
+    # ------------------------------------------
+    @classmethod
+    def check(cls, url: str) -> None:
+        host = HostScheduler.get_host(url)
+        with cls._lock:
+            opened_at = cls._opened_at.get(host)
+            if opened_at is None:
+                return
+
+            if time.monotonic() - opened_at < const["CIRCUIT_BREAKER"]["reset_seconds"]:
+                raise SiteDownError(
+                    f"{host} is unavailable after {cls._failures[host]} failed "
+                    f"requests (last error: {cls._last_errors[host]})"
+                )
+
+            # Half open: this request is the trial, the others keep failing fast
+            cls._opened_at[host] = time.monotonic()
+            logging.info(f"Circuit of {host} half open, trying {url}")
+
+    @classmethod
+    def record_success(cls, url: str) -> None:
+        host = HostScheduler.get_host(url)
+        with cls._lock:
+            if host in cls._opened_at:
+                logging.info(f"Circuit of {host} closed, the host is responding again")
+            cls._failures.pop(host, None)
+            cls._opened_at.pop(host, None)
+
+    @classmethod
+    def record_failure(cls, url: str, error: Exception) -> None:
+        # A replayed page that was not recorded says nothing about the host
+        if SnapshotStore.is_replaying():
+            return
+
+        host = HostScheduler.get_host(url)
+        with cls._lock:
+            cls._failures[host] = cls._failures.get(host, 0) + 1
+            cls._last_errors[host] = str(error).strip().split("\n")[0]
+            if cls._failures[host] >= const["CIRCUIT_BREAKER"]["failure_threshold"]:
+                if host not in cls._opened_at:
+                    logging.error(
+                        f"Circuit of {host} opened after {cls._failures[host]} failed "
+                        f"requests. Skipping its remaining pages."
+                    )
+                    Metrics.inc("circuit_opened_total", host=host)
+                cls._opened_at[host] = time.monotonic()
+
+    @classmethod
+    def is_open(cls, host: str) -> bool:
+        with cls._lock:
+            return host in cls._opened_at
+
+    # ------------------------------------------
+    # Skipped work, for the report
+    # ------------------------------------------
+    @classmethod
+    def record_skip(cls, vehicle_name: str, data: str, reason: str) -> None:
+        with cls._lock:
+            cls._skipped.append((vehicle_name, data, reason))
+        Metrics.inc("skipped_total", data=data)
+
+    @classmethod
+    def get_skipped(cls) -> List[Tuple[str, str, str]]:
+        with cls._lock:
+            return list(cls._skipped)
+
+    @classmethod
+    def log_summary(cls) -> None:
+        with cls._lock:
+            open_hosts = sorted(cls._opened_at)
+            skipped = list(cls._skipped)
+
+        for host in open_hosts:
+            logging.warning(f"Circuit of {host} is open: {cls._last_errors[host]}")
+        for vehicle_name, data, reason in skipped:
+            logging.warning(f"Skipped {vehicle_name} ({data}): {reason}")
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._failures = {}
+            cls._opened_at = {}
+            cls._last_errors = {}
+            cls._skipped = []
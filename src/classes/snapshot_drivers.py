@@ -0,0 +1,301 @@
+# 3rd Party Pacakges
+from lxml import html
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+# Built-in Packages
+import logging
+from typing import List, Optional
+
+# Local Packages
+from utilities.bulk_extraction import ATTRIBUTE_SCRIPT, MENU_SCRIPT, PAIRS_SCRIPT
+from classes.http_fetcher import HttpFetcher
+from classes.snapshot_store import SnapshotStore
+
+CLICK_SCRIPT = "arguments[0].click();"
+
+# What the browser returned, saved on the element so a replay returns it too
+TEXT_ATTRIBUTE = "data-snapshot-text"  # WebElement.text
+DISPLAYED_ATTRIBUTE = "data-snapshot-displayed"  # WebElement.is_displayed()
+INNER_TEXT_ATTRIBUTE = "data-snapshot-inner-text"  # Text read by PAIRS_SCRIPT
+URL_ATTRIBUTES = {"src": "data-snapshot-src", "href": "data-snapshot-href"}
+
+# ----------------------------------------------------------------------
+# Saves what the bulk extraction scripts are about to read on the
+# elements themselves: the visible text and the absolute src/href
+# ----------------------------------------------------------------------
+ANNOTATE_SCRIPT = """
+const [xpaths, cardXPath] = arguments;
+
+function query(xpath, context) {
+  const result = document.evaluate(
+    xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  );
+  const nodes = [];
+  for (let i = 0; i < result.snapshotLength; i++) {
+    nodes.push(result.snapshotItem(i));
+  }
+  return nodes;
+}
+
+function visibleText(element) {
+  const style = window.getComputedStyle(element);
+  if (
+    style.display === "none" ||
+    style.visibility === "hidden" ||
+    element.getClientRects().length === 0
+  ) {
+    return "";
+  }
+  return (element.innerText || "").trim();
+}
+
+const contexts = cardXPath ? query(cardXPath, document) : [document];
+for (const context of contexts) {
+  for (const xpath of xpaths) {
+    for (const element of query(xpath, context)) {
+      element.setAttribute("data-snapshot-inner-text", visibleText(element));
+      for (const name of ["src", "href"]) {
+        if (typeof element[name] === "string" && element[name]) {
+          element.setAttribute("data-snapshot-" + name, element[name]);
+        }
+      }
+    }
+  }
+}
+"""
+
+SAVE_ATTRIBUTE_SCRIPT = "arguments[0].setAttribute(arguments[1], arguments[2]);"
+
+
+# ----------------------------------------------------------------------
+# Record mode
+# ----------------------------------------------------------------------
+class RecordingElement:
+    """WebElement that saves what it returns and tells the driver about clicks."""
+
+    def __init__(self, element, recorder: "RecordingDriver"):
+        self.element = element
+        self.recorder = recorder
+
+    @property
+    def text(self) -> str:
+        text = self.element.text
+        self.recorder.save_on_element(self.element, TEXT_ATTRIBUTE, text)
+        return text
+
+    def is_displayed(self) -> bool:
+        displayed = self.element.is_displayed()
+        self.recorder.save_on_element(
+            self.element, DISPLAYED_ATTRIBUTE, "1" if displayed else "0"
+        )
+        return displayed
+
+    def click(self) -> None:
+        self.recorder.end_state()
+        self.element.click()
+
+    def __getattr__(self, name):
+        return getattr(self.element, name)
+
+
+class RecordingDriver:
+    """
+    WebDriver that saves a snapshot of every DOM state the extractors read.
+
+    Reads only mark the state as read; the page source is saved once, when
+    the state ends (a click, another page or quit), so the snapshot holds
+    the page exactly as the last read of that state saw it.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.url: Optional[str] = None
+        self.state = 0
+        self.read = False
+
+    def get(self, url: str) -> None:
+        self.end_state()
+        self.driver.get(url)
+        self.url = url
+        self.state = 0
+
+    def find_element(self, by=By.ID, value: Optional[str] = None) -> RecordingElement:
+        element = self.driver.find_element(by, value)
+        self.read = True
+        return RecordingElement(element, self)
+
+    def find_elements(self, by=By.ID, value: Optional[str] = None) -> List[RecordingElement]:
+        elements = self.driver.find_elements(by, value)
+        self.read = True
+        return [RecordingElement(element, self) for element in elements]
+
+    def execute_script(self, script: str, *args):
+        args = [arg.element if isinstance(arg, RecordingElement) else arg for arg in args]
+
+        if script == CLICK_SCRIPT:
+            self.end_state()
+        elif script == PAIRS_SCRIPT:
+            model_xpath, price_xpath, card_xpath = args
+            self.driver.execute_script(
+                ANNOTATE_SCRIPT, [model_xpath, price_xpath], card_xpath
+            )
+            self.read = True
+        elif script == ATTRIBUTE_SCRIPT:
+            self.driver.execute_script(ANNOTATE_SCRIPT, [args[0]], None)
+            self.read = True
+        elif script == MENU_SCRIPT:
+            # textContent is in the saved DOM as is, nothing to annotate
+            self.read = True
+
+        return self.driver.execute_script(script, *args)
+
+    def save_on_element(self, element, name: str, value: str) -> None:
+        self.driver.execute_script(SAVE_ATTRIBUTE_SCRIPT, element, name, value)
+        self.read = True
+
+    def end_state(self) -> None:
+        if self.read and self.url is not None:
+            SnapshotStore.save_page(
+                self.url,
+                self.state,
+                self.driver.execute_script("return document.documentElement.outerHTML;"),
+            )
+        self.read = False
+        self.state += 1
+
+    def quit(self) -> None:
+        try:
+            self.end_state()
+        except WebDriverException as e:
+            logging.warning(f"Could not save the last snapshot of {self.url}: {e}")
+        self.driver.quit()
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+# ----------------------------------------------------------------------
+# Replay mode
+# ----------------------------------------------------------------------
+class ReplayElement:
+    """Element of a replayed page, looked up again in every later state."""
+
+    def __init__(self, replayer: "ReplayDriver", element: html.HtmlElement):
+        self.replayer = replayer
+        self.path = element.getroottree().getpath(element)
+
+    def current(self) -> Optional[html.HtmlElement]:
+        found = self.replayer.document.xpath(self.path)
+        return found[0] if found else None
+
+    @property
+    def text(self) -> str:
+        element = self.current()
+        return element.get(TEXT_ATTRIBUTE, "") if element is not None else ""
+
+    def is_displayed(self) -> bool:
+        element = self.current()
+        return element is not None and element.get(DISPLAYED_ATTRIBUTE) == "1"
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        element = self.current()
+        if element is None:
+            return None
+        if name in URL_ATTRIBUTES:
+            return element.get(URL_ATTRIBUTES[name]) or element.get(name)
+        return element.get(name)
+
+    def click(self) -> None:
+        self.replayer.next_state()
+
+
+class ReplayDriver:
+    """
+    Stands in for the browser in replay mode.
+
+    Serves the recorded snapshots of each page, moves to the page's next
+    DOM state on every click, and answers the bulk extraction scripts from
+    the values the recording saved on the elements.
+    """
+
+    def __init__(self):
+        self.url: Optional[str] = None
+        self.state = 0
+        self.document = html.fromstring("<html><body></body></html>")
+
+    @property
+    def current_url(self) -> str:
+        return self.url or "about:blank"
+
+    def get(self, url: str) -> None:
+        if not SnapshotStore.has_page(url):
+            raise WebDriverException(f"No snapshot recorded for {url}")
+        self.url = url
+        self.state = 0
+        self.load_state()
+
+    def next_state(self) -> None:
+        self.state += 1
+        self.load_state()
+
+    def load_state(self) -> None:
+        page_source = SnapshotStore.load_page(self.url, self.state)
+        self.document = html.fromstring(
+            page_source or "<html><body></body></html>", base_url=self.url
+        )
+
+    def find_elements(self, by=By.ID, value: Optional[str] = None) -> List[ReplayElement]:
+        if by != By.XPATH:
+            raise WebDriverException(f"Replay mode only supports XPath locators, not {by}")
+        return [
+            ReplayElement(self, element)
+            for element in HttpFetcher.xpath(value)(self.document)
+            if isinstance(element, html.HtmlElement)
+        ]
+
+    def find_element(self, by=By.ID, value: Optional[str] = None) -> ReplayElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return elements[0]
+
+    def execute_script(self, script: str, *args):
+        if script == CLICK_SCRIPT:
+            args[0].click()
+            return None
+
+        if script == PAIRS_SCRIPT:
+            pairs, model_count, price_count = HttpFetcher.pair_elements(
+                self.document, *args
+            )
+            return {
+                "pairs": [
+                    list(HttpFetcher.pair_text(model, price, self._inner_text))
+                    for model, price in pairs
+                ],
+                "models": model_count,
+                "prices": price_count,
+            }
+
+        if script == ATTRIBUTE_SCRIPT:
+            xpath, attribute = args
+            elements = HttpFetcher.xpath(xpath)(self.document)
+            if not elements:
+                return None
+            return ReplayElement(self, elements[0]).get_attribute(attribute)
+
+        if script == MENU_SCRIPT:
+            return HttpFetcher.read_menu(self.document, *args)
+
+        raise WebDriverException("Script was not recorded and cannot be replayed.")
+
+    @staticmethod
+    def _inner_text(element: Optional[html.HtmlElement]) -> str:
+        return element.get(INNER_TEXT_ATTRIBUTE, "") if element is not None else ""
+
+    def set_page_load_timeout(self, seconds: float) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
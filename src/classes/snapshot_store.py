@@ -0,0 +1,194 @@
+# 3rd Party Pacakges
+import pandas as pd
+
+# Built-in Packages
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+# Local Packages
+from utilities.constants import constants as const
+
+RUN_MODES = ("live", "record", "replay")
+
+
+class SnapshotStore:
+    """
+    Page snapshots of a run, for debugging and tuning without the live sites.
+
+    RUN_MODE selects what a run does with them:
+    - live: nothing is saved (the default).
+    - record: every page the browser reads is saved to a new run directory
+      under SNAPSHOT_DIR, once per DOM state. A state ends when something
+      on the page is clicked, so carousel slides and navigation flyouts
+      each get their own snapshot. HTTP-first pages are saved as fetched.
+    - replay: the pages of a recorded run (REPLAY_RUN, or the latest one)
+      are served to the extractors instead of the sites. No browser is
+      started and no request leaves the machine.
+
+    Recording and replaying runs also write their comparison frames as CSV
+    files, under frames/ and replay-frames/ of the run directory, so a
+    replay can be diffed against the run it came from.
+    """
+
+    mode = "live"
+    run_dir: Optional[str] = None
+    _pages: Dict[str, Dict[str, str]] = {}
+    _http: Dict[str, str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_recording(cls) -> bool:
+        return cls.mode == "record"
+
+    @classmethod
+    def is_replaying(cls) -> bool:
+        return cls.mode == "replay"
+
+    # ------------------------------------------
+    # Run directory
+    # ------------------------------------------
+    @classmethod
+    def start(cls) -> None:
+        mode = const["RUN_MODE"].lower()
+        if mode not in RUN_MODES:
+            raise ValueError(
+                "Invalid RUN_MODE in the constants.py file. Use 'live', 'record', or 'replay'."
+            )
+
+        with cls._lock:
+            cls.mode = mode
+            cls.run_dir = None
+            cls._pages = {}
+            cls._http = {}
+
+            if mode == "record":
+                cls.run_dir = os.path.join(
+                    const["SNAPSHOT_DIR"], datetime.now().strftime("%Y%m%d-%H%M%S")
+                )
+                os.makedirs(os.path.join(cls.run_dir, "pages"), exist_ok=True)
+                logging.info(f"Recording page snapshots to {cls.run_dir}")
+
+            elif mode == "replay":
+                cls.run_dir = cls._find_replay_run()
+                with open(os.path.join(cls.run_dir, "index.json"), encoding="utf-8") as file:
+                    index = json.load(file)
+                cls._pages = index["pages"]
+                cls._http = index["http"]
+                logging.info(
+                    f"Replaying {len(cls._pages)} browser pages and "
+                    f"{len(cls._http)} HTTP pages from {cls.run_dir}"
+                )
+
+    @staticmethod
+    def _find_replay_run() -> str:
+        if const["REPLAY_RUN"]:
+            return os.path.join(const["SNAPSHOT_DIR"], const["REPLAY_RUN"])
+
+        # Run directories are named by start time, so the last one is the latest
+        runs = sorted(
+            name
+            for name in os.listdir(const["SNAPSHOT_DIR"])
+            if os.path.isfile(os.path.join(const["SNAPSHOT_DIR"], name, "index.json"))
+        )
+        if not runs:
+            raise FileNotFoundError(f"No recorded runs found in {const['SNAPSHOT_DIR']}")
+        return os.path.join(const["SNAPSHOT_DIR"], runs[-1])
+
+    @classmethod
+    def finish(cls) -> None:
+        if not cls.is_recording():
+            return
+
+        with cls._lock:
+            index = {"pages": cls._pages, "http": cls._http}
+            with open(os.path.join(cls.run_dir, "index.json"), "w", encoding="utf-8") as file:
+                json.dump(index, file, indent=2)
+
+        logging.info(
+            f"Recorded {len(cls._pages)} browser pages and {len(cls._http)} HTTP pages "
+            f"to {cls.run_dir}"
+        )
+
+    # ------------------------------------------
+    # Browser pages - one file per DOM state
+    # ------------------------------------------
+    @classmethod
+    def save_page(cls, url: str, state: int, page_source: str) -> None:
+        file_name = f"{cls._url_hash(url)}-{state}.html"
+        cls._write(file_name, page_source.encode("utf-8"))
+        with cls._lock:
+            cls._pages.setdefault(url, {})[str(state)] = file_name
+
+    @classmethod
+    def has_page(cls, url: str) -> bool:
+        return bool(cls._pages.get(url))
+
+    @classmethod
+    def has_snapshot(cls, url: str) -> bool:
+        """True when the URL was recorded, by the browser or over HTTP."""
+        return cls.has_page(url) or url in cls._http
+
+    @classmethod
+    def load_page(cls, url: str, state: int) -> Optional[str]:
+        """The page as it was in the state, or in the last state read before it."""
+        states = cls._pages.get(url)
+        if not states:
+            return None
+
+        recorded = [int(key) for key in states if int(key) <= state]
+        if not recorded:
+            return None
+        return cls._read(states[str(max(recorded))]).decode("utf-8")
+
+    # ------------------------------------------
+    # HTTP-first pages - the response body
+    # ------------------------------------------
+    @classmethod
+    def save_http(cls, url: str, content: bytes) -> None:
+        file_name = f"{cls._url_hash(url)}-http.html"
+        cls._write(file_name, content)
+        with cls._lock:
+            cls._http[url] = file_name
+
+    @classmethod
+    def load_http(cls, url: str) -> Optional[bytes]:
+        file_name = cls._http.get(url)
+        return cls._read(file_name) if file_name else None
+
+    # ------------------------------------------
+    # Comparison frames
+    # ------------------------------------------
+    @classmethod
+    def save_frame(cls, name: str, df: Optional[pd.DataFrame]) -> None:
+        if cls.run_dir is None or df is None:
+            return
+
+        frames_dir = os.path.join(
+            cls.run_dir, "frames" if cls.is_recording() else "replay-frames"
+        )
+        os.makedirs(frames_dir, exist_ok=True)
+        file_name = re.sub(r"[^A-Za-z0-9-]+", "_", name).strip("_") + ".csv"
+        df.to_csv(os.path.join(frames_dir, file_name), index=False)
+
+    # ------------------------------------------
+    # Files
+    # ------------------------------------------
+    @staticmethod
+    def _url_hash(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def _write(cls, file_name: str, content: bytes) -> None:
+        with open(os.path.join(cls.run_dir, "pages", file_name), "wb") as file:
+            file.write(content)
+
+    @classmethod
+    def _read(cls, file_name: str) -> bytes:
+        with open(os.path.join(cls.run_dir, "pages", file_name), "rb") as file:
+            return file.read()
@@ -0,0 +1,140 @@
+# Built-in Packages
+from contextlib import contextmanager
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+
+class Tracer:
+    """
+    Nested timing spans of a run, exported as a Chrome trace.
+
+    Spans nest per thread, by time, the way chrome://tracing and Perfetto
+    draw them:
+    - run: the whole main() call
+    - site: one HostScheduler job, i.e. the pages of one vehicle on one site
+    - vehicle: building the report data of one vehicle from the page cache
+    - phase: driver acquire, navigate, http fetch, readiness wait, click
+      loop, extract, merge, render and smtp
+
+    export_chrome_trace() writes the Trace Event Format JSON that
+    chrome://tracing and ui.perfetto.dev open; log_summary() logs the total
+    time per phase.
+    """
+
+    _events: List[dict] = []
+    _thread_names: Dict[int, str] = {}
+    _lock = threading.Lock()
+
+    # ------------------------------------------
+    # Spans
+    # ------------------------------------------
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, category: str = "phase", **args):
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "start_ns": start_ns,
+                "dur_ns": end_ns - start_ns,
+                "tid": thread.native_id,
+                "args": args,
+            }
+            with cls._lock:
+                cls._events.append(event)
+                cls._thread_names.setdefault(thread.native_id, thread.name)
+
+    @classmethod
+    def get_events(cls) -> List[dict]:
+        with cls._lock:
+            return list(cls._events)
+
+    # ------------------------------------------
+    # Chrome trace / Perfetto export
+    # ------------------------------------------
+    @classmethod
+    def export_chrome_trace(cls, path: str) -> None:
+        if not path:
+            return
+
+        events = cls.get_events()
+        if not events:
+            return
+        origin_ns = min(event["start_ns"] for event in events)
+        pid = os.getpid()
+
+        trace_events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for tid, thread_name in cls._thread_names.items()
+        ]
+        for event in sorted(events, key=lambda event: event["start_ns"]):
+            trace_events.append(
+                {
+                    "name": event["name"],
+                    "cat": event["cat"],
+                    "ph": "X",
+                    "ts": (event["start_ns"] - origin_ns) / 1000,  # microseconds
+                    "dur": event["dur_ns"] / 1000,
+                    "pid": pid,
+                    "tid": event["tid"],
+                    "args": event["args"],
+                }
+            )
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+        logging.info(f"Trace written to {path} ({len(events)} spans)")
+
+    # ------------------------------------------
+    # Summary table - total time per (category, name)
+    # ------------------------------------------
+    @classmethod
+    def get_summary(cls) -> List[Tuple[str, str, int, float, float]]:
+        """(category, name, count, total seconds, max seconds), slowest first."""
+        totals: Dict[Tuple[str, str], List[float]] = {}
+        for event in cls.get_events():
+            totals.setdefault((event["cat"], event["name"]), []).append(
+                event["dur_ns"] / 1e9
+            )
+
+        summary = [
+            (category, name, len(durations), sum(durations), max(durations))
+            for (category, name), durations in totals.items()
+        ]
+        return sorted(summary, key=lambda row: row[3], reverse=True)
+
+    @classmethod
+    def log_summary(cls) -> None:
+        # Phases and the run; the per vehicle and site spans are in the trace
+        rows = [row for row in cls.get_summary() if row[0] in ("run", "phase")]
+        if not rows:
+            return
+
+        lines = [f"{'Span':<24}{'Count':>7}{'Total s':>10}{'Avg s':>9}{'Max s':>9}"]
+        for _, name, count, total, longest in rows:
+            lines.append(
+                f"{name:<24}{count:>7}{total:>10.2f}{total / count:>9.2f}{longest:>9.2f}"
+            )
+        logging.info("Run time by span (phases overlap across workers):\n" + "\n".join(lines))
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._events = []
+            cls._thread_names = {}
@@ -1,5 +1,9 @@
+# 3rd Party Pacakges
 import pandas as pd
 
+# Local Packages
+from utilities.price_parsing import parse_prices
+
 
 class Vehicle:
     def __init__(self, model, price, category=None, hero_image=None):
@@ -12,16 +16,13 @@ class Vehicle:
         return f"Category: {self.category}, Model: {self.model}, Price: {self.price}, Hero Image: {self.hero_image}"
 
     def clean_price(self, price):
-        try:
-            # Strip non-numeric characters and convert to numeric
-            cleaned_price = pd.to_numeric(
-                price.replace("[\$,]", "", regex=True), errors="coerce"
-            )
-
-            return cleaned_price
-        except ValueError:
+        # Price in dollars, None when the text is not a price
+        cents = parse_prices(pd.Series([price]))["cents"][0]
+        if pd.isna(cents):
             return None  # or any default value indicating an invalid price
 
+        return cents / 100
+
     def convert_price_to_currency(self, decimal_places=0):
         try:
             if pd.notnull(self.price):
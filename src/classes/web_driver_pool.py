@@ -0,0 +1,351 @@
+# 3rd Party Pacakges
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+# Built-in Packages
+from contextlib import contextmanager
+import logging
+import threading
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.driver_resolver import DriverResolver
+from classes.metrics import Metrics
+from classes.snapshot_drivers import RecordingDriver, ReplayDriver
+from classes.snapshot_store import SnapshotStore
+from classes.tracer import Tracer
+
+# Load environment variables from the .env file
+load_dotenv(override=True)
+
+
+class PooledDriver:
+    """
+    Thin wrapper around a WebDriver that counts page loads.
+
+    Every other attribute is forwarded to the wrapped driver, so extractors
+    use it exactly like a regular WebDriver.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.loaded_url = None  # Set by PageCache once a page has loaded
+        self.failed = False  # A job failed on it, check the session on release
+
+    def get(self, url: str) -> None:
+        self.page_loads += 1
+        self.loaded_url = None
+        self.driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class WebDriverPool:
+    """
+    Bounded pool of browser sessions shared by the scraping workers.
+
+    - acquire()/release() check a driver out and back in.
+    - checkout() is a context manager that binds a driver to the current
+      thread for its duration; the driver is only started when the first
+      extractor calls get_driver(), so skipped vehicles never start one.
+    - A driver's session is only checked after an error (a failed job, or
+      before a retry), not on every checkout, and replaced when it is dead.
+    - A driver is recycled (quit and replaced) after WEBDRIVER_MAX_PAGE_LOADS
+      page loads to keep browser memory from creeping up on long runs.
+    """
+
+    _idle = []
+    _open_count = 0
+    _condition = threading.Condition()
+    _local = threading.local()
+
+    # ------------------------------------------
+    # Pool API
+    # ------------------------------------------
+    @classmethod
+    def acquire(cls) -> PooledDriver:
+        with cls._condition:
+            while not cls._idle and cls._open_count >= const["MAX_BROWSER_WORKERS"]:
+                cls._condition.wait()
+
+            if cls._idle:
+                return cls._idle.pop()
+
+            # Reserve the slot now, start the browser outside the lock
+            cls._open_count += 1
+
+        try:
+            return PooledDriver(cls.create_driver())
+        except Exception:
+            with cls._condition:
+                cls._open_count -= 1
+                cls._condition.notify()
+            raise
+
+    @classmethod
+    def release(cls, pooled_driver: PooledDriver) -> None:
+        if pooled_driver.page_loads >= const["WEBDRIVER_MAX_PAGE_LOADS"]:
+            logging.info(
+                f"Recycling WebDriver after {pooled_driver.page_loads} page loads."
+            )
+            cls._discard(pooled_driver)
+        elif pooled_driver.failed and not cls.is_alive(pooled_driver):
+            logging.warning("WebDriver session died while in use. Discarding it.")
+            Metrics.inc("retries_total", reason="driver_replaced")
+            cls._discard(pooled_driver)
+        else:
+            pooled_driver.failed = False
+            with cls._condition:
+                cls._idle.append(pooled_driver)
+                cls._condition.notify()
+
+    @classmethod
+    @contextmanager
+    def checkout(cls):
+        cls._local.leased = True
+        cls._local.driver = None
+        try:
+            yield
+        except Exception:
+            if cls._local.driver is not None:
+                cls._local.driver.failed = True
+            raise
+        finally:
+            pooled_driver = cls._local.driver
+            cls._local.leased = False
+            cls._local.driver = None
+            if pooled_driver is not None:
+                cls.release(pooled_driver)
+
+    @classmethod
+    def get_driver(cls) -> PooledDriver:
+        # Outside checkout() (e.g. a module's test functions) the driver
+        # stays bound to this thread until close_all()
+        pooled_driver = getattr(cls._local, "driver", None)
+        if pooled_driver is None:
+            with Tracer.span("driver acquire"):
+                pooled_driver = cls.acquire()
+            cls._local.driver = pooled_driver
+        return pooled_driver
+
+    @classmethod
+    def forget_page(cls) -> None:
+        # Called before a retry: the next PageCache.load() on this thread
+        # reloads the page, on a new driver when the session died
+        pooled_driver = getattr(cls._local, "driver", None)
+        if pooled_driver is None:
+            return
+
+        pooled_driver.loaded_url = None
+        if not cls.is_alive(pooled_driver):
+            logging.warning("WebDriver session died while in use. Replacing it.")
+            Metrics.inc("retries_total", reason="driver_replaced")
+            cls._local.driver = None
+            cls._discard(pooled_driver)
+
+    @classmethod
+    def close_all(cls) -> None:
+        pooled_driver = getattr(cls._local, "driver", None)
+        cls._local.driver = None
+        if pooled_driver is not None and not getattr(cls._local, "leased", False):
+            cls._quit(pooled_driver)
+            with cls._condition:
+                cls._open_count -= 1
+
+        with cls._condition:
+            idle_drivers, cls._idle = cls._idle, []
+            cls._open_count -= len(idle_drivers)
+            cls._condition.notify_all()
+
+        for idle_driver in idle_drivers:
+            cls._quit(idle_driver)
+
+    # ------------------------------------------
+    # Health checks
+    # ------------------------------------------
+    @staticmethod
+    def is_alive(pooled_driver: PooledDriver) -> bool:
+        try:
+            # Any cheap round trip fails fast once the session is gone
+            pooled_driver.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @classmethod
+    def _discard(cls, pooled_driver: PooledDriver) -> None:
+        cls._quit(pooled_driver)
+        with cls._condition:
+            cls._open_count -= 1
+            cls._condition.notify()
+
+    @staticmethod
+    def _quit(pooled_driver: PooledDriver) -> None:
+        try:
+            pooled_driver.driver.quit()
+        except Exception:
+            pass  # The browser may already be gone
+
+    # ------------------------------------------
+    # Driver setup
+    # ------------------------------------------
+    @classmethod
+    def create_driver(cls):
+        # Replays read recorded snapshots, no browser needed
+        if SnapshotStore.is_replaying():
+            return ReplayDriver()
+
+        driver_type = const["BROWSER_DRIVER_TYPE"].lower()
+
+        if driver_type == "chrome":
+            setup_driver = cls.setup_chrome_driver
+        elif driver_type == "firefox":
+            setup_driver = cls.setup_firefox_driver
+        elif driver_type == "edge":
+            setup_driver = cls.setup_edge_driver
+        else:
+            raise ValueError(
+                "Invalid BROWSER_DRIVER_TYPE in the constants.py file. Use 'chrome', 'firefox', or 'edge'."
+            )
+
+        try:
+            driver = setup_driver()
+        except SessionNotCreatedException:
+            # The local driver doesn't match the installed browser version
+            logging.warning(f"Local {driver_type} driver rejected. Downloading a new one.")
+            DriverResolver.invalidate(driver_type)
+            Metrics.inc("retries_total", reason="driver_download")
+            driver = setup_driver()
+
+        # Browser round trips, per extractor (see Metrics.scope)
+        Metrics.count_commands(driver)
+
+        # A hung page raises TimeoutException instead of blocking the worker
+        driver.set_page_load_timeout(const["WEBDRIVER_PAGE_LOAD_TIMEOUT"])
+
+        if SnapshotStore.is_recording():
+            return RecordingDriver(driver)
+        return driver
+
+    @staticmethod
+    def setup_chrome_driver():
+        chrome_service = ChromeService(DriverResolver.resolve("chrome"))
+        chrome_options = ChromeOptions()
+        chrome_options.add_experimental_option("detach", False)
+        headless_mode = const["HEADLESS_MODE"]
+        if headless_mode:
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--disable-gpu")
+        if const["LEAN_BROWSER_MODE"]:
+            WebDriverPool.set_lean_chromium_options(chrome_options)
+        driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
+        if const["LEAN_BROWSER_MODE"]:
+            WebDriverPool.block_chromium_urls(driver)
+        return driver
+
+    @staticmethod
+    def setup_edge_driver():
+        edge_service = EdgeService(DriverResolver.resolve("edge"))
+        edge_options = EdgeOptions()
+        edge_options.add_experimental_option("detach", False)
+        headless_mode = const["HEADLESS_MODE"]
+        if headless_mode:
+            edge_options.add_argument("--headless")
+        if const["LEAN_BROWSER_MODE"]:
+            WebDriverPool.set_lean_chromium_options(edge_options)
+        driver = webdriver.Edge(service=edge_service, options=edge_options)
+        if const["LEAN_BROWSER_MODE"]:
+            WebDriverPool.block_chromium_urls(driver)
+        return driver
+
+    @staticmethod
+    def setup_firefox_driver():
+        firefox_service = FirefoxService(DriverResolver.resolve("firefox"))
+        firefox_options = FirefoxOptions()
+        firefox_options.add_argument(
+            "--disable-gpu"
+        )  # Add any additional options if needed
+        headless_mode = const["HEADLESS_MODE"]
+        if headless_mode:
+            firefox_options.add_argument("--headless")
+        if const["LEAN_BROWSER_MODE"]:
+            WebDriverPool.set_lean_firefox_options(firefox_options)
+        driver = webdriver.Firefox(service=firefox_service, options=firefox_options)
+        driver.set_window_size(1920, 1080)
+        return driver
+
+    # ------------------------------------------
+    # Lean browser profile
+    # - The extractors only read text and the src/style attributes, so
+    #   images, fonts and media are never needed and are not downloaded
+    # - Pages are handed back at DOMContentLoaded; PageReadiness then
+    #   waits for the exact element each extractor needs
+    # ------------------------------------------
+    @staticmethod
+    def set_lean_chromium_options(options) -> None:
+        options.page_load_strategy = "eager"
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+        for argument in (
+            "--blink-settings=imagesEnabled=false",
+            "--autoplay-policy=user-gesture-required",
+            "--mute-audio",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-default-apps",
+            "--disable-extensions",
+            "--disable-sync",
+            "--no-first-run",
+        ):
+            options.add_argument(argument)
+
+    @staticmethod
+    def block_chromium_urls(driver) -> None:
+        # Fonts, video and third-party analytics/ad hosts
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": const["BLOCKED_URL_PATTERNS"]}
+        )
+
+    @staticmethod
+    def set_lean_firefox_options(options) -> None:
+        options.page_load_strategy = "eager"
+        for name, value in {
+            # Images, web fonts and media
+            "permissions.default.image": 2,
+            "gfx.downloadable_fonts.enabled": False,
+            "media.autoplay.default": 5,
+            "media.preload.default": 0,
+            "media.preload.auto": 0,
+            # Firefox blocks known analytics and ad hosts with its tracking
+            # protection lists (BLOCKED_URL_PATTERNS is Chrome/Edge only)
+            "privacy.trackingprotection.enabled": True,
+            "privacy.trackingprotection.socialtracking.enabled": True,
+            # Background services
+            "app.update.auto": False,
+            "browser.safebrowsing.malware.enabled": False,
+            "browser.safebrowsing.phishing.enabled": False,
+            "browser.safebrowsing.downloads.enabled": False,
+            "datareporting.healthreport.uploadEnabled": False,
+            "datareporting.policy.dataSubmissionEnabled": False,
+            "toolkit.telemetry.enabled": False,
+            "extensions.update.enabled": False,
+            "network.prefetch-next": False,
+            "network.dns.disablePrefetch": True,
+            "dom.push.enabled": False,
+        }.items():
+            options.set_preference(name, value)
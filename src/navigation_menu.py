@@ -5,8 +5,7 @@ from selenium.webdriver.common.by import By
 
 # Built-in Packages
 import logging
-import time
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 import os
 import re
 import sys
@@ -25,179 +24,218 @@ sys.path.append(os.path.join(os.path.dirname(script_dir), "src"))
 
 # Local Packages
 from utilities.constants import constants as const
+from utilities.bulk_extraction import extract_menu, extract_pairs
+from utilities.model_matching import get_model_keys, merge_models
+from utilities.price_comparison import (
+    format_confidence,
+    format_dollars,
+    format_report_prices,
+    get_comparison,
+)
+from utilities.price_parsing import parse_prices
 from utilities.utilities import parse_img_filename
-from classes.web_driver_singleton import WebDriverSingleton
+from classes.page_cache import PageCache
+from classes.page_readiness import PageReadiness
+from classes.tracer import Tracer
+from classes.web_driver_pool import WebDriverPool
 
 # Load environment variables from the .env file
 load_dotenv(override=True)
 
 
 # ------------------------------------------
-# Get prices from ford.ca
+# Navigation menu locators of each site
+# - menu_button opens the vehicles menu, category holds the name of a
+#   category (and opens it when clicked)
+# - panel holds the vehicles of a category; model and price are relative
+#   to it
+# - open_model / open_price match the vehicles of the opened category,
+#   for the click fallback
 # ------------------------------------------
-def get_ford_mfg_nav_prices(url: str) -> List[Tuple[str, str]]:
+MFG_OPEN_PANEL = "//div[@class='vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container open']"
+MFG_NAV_LOCATORS = {
+    "menu_button": "//li[@class='main-nav-item no-float-md flyout-item-wrap']/button",
+    "category": "//button[contains(@class,'bri-nav__list-link segment-anchor-trigger fgx-btn')]//span[@class='link-text']",
+    "panel": "//div[starts-with(@class,'vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container')]",
+    "model": ".//a[@class='veh-item-inline']",
+    "price": ".//span[contains(@data-pricing-template,'price')]",
+    "open_model": MFG_OPEN_PANEL + "//a[@class='veh-item-inline']",
+    "open_price": MFG_OPEN_PANEL + "//span[contains(@data-pricing-template,'price')]",
+}
+
+DEALER_MENU_ITEM = "li[starts-with(@class, 'mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom mega-menu-item-has-children mega-menu-megamenu mega-menu-grid')"
+DEALER_VEHICLE_COLUMN = "//li[contains(@class,'mega-menu-column') and not(contains(@class, 'hide'))]"
+DEALER_NAV_LOCATORS = {
+    "menu_button": "//a[@class='mega-menu-link sf-with-ul']",
+    "category": "//li[contains(@class,'mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom mega-menu-item-has-children mega-menu-megamenu mega-menu-grid')]//a[@class='mega-menu-link sf-with-ul']",
+    "panel": "//" + DEALER_MENU_ITEM + "]",
+    "model": "." + DEALER_VEHICLE_COLUMN + "//p[@class='vehicle-top']//span[contains(@class,'vehicle-name')]/a[1]",
+    "price": "." + DEALER_VEHICLE_COLUMN + "//p[@class='vehicle-bottom']//span[@class='vprice']/span[1]",
+    "open_model": "//" + DEALER_MENU_ITEM + " and contains(@class,'mega-toggle-on')]" + DEALER_VEHICLE_COLUMN + "//p[@class='vehicle-top']//span[contains(@class,'vehicle-name')]/a[1]",
+    "open_price": "//" + DEALER_MENU_ITEM + " and contains(@class,'mega-toggle-on')]" + DEALER_VEHICLE_COLUMN + "//p[@class='vehicle-bottom']//span[@class='vprice']/span[1]",
+}
+
+# Columns of the navigation table: the report columns, then the prices as
+# scraped and parsed, for the price history
+NAV_REPORT_COLUMNS = [
+    "Category",
+    "Car Model",
+    "Ford Manufacturer Price",
+    "Ford Dealer Price",
+    "Price Difference",
+    "Price Comparison",
+    "Match Confidence",
+]
+NAV_PRICE_COLUMNS = [
+    "manufacturer_price",
+    "dealer_price",
+    "manufacturer_cents",
+    "dealer_cents",
+    "manufacturer_parse_status",
+    "dealer_parse_status",
+]
 
-    # Set up the Web driver
-    driver = WebDriverSingleton.get_driver()
 
-    # Main URL
-    driver.get(url)
-    time.sleep(const["TIME_SLEEP"])  # Allow time for the page to load
+# ------------------------------------------
+# Get prices from ford.ca
+# ------------------------------------------
+def get_ford_mfg_nav_prices(url: str) -> List[Tuple[str, str, str]]:
+    vehicle_prices = get_nav_prices(url, MFG_NAV_LOCATORS, "Ford.ca Error")
 
-    # Troubleshooting - Get browser console logs
-    # logs = driver.get_log("browser")
-    # for log in logs:
-    #    print(log)
+    # Debugging: Log the vehicle prices
+    logging.info("Ford Manufacturer Navigation Prices: %s", vehicle_prices)
 
-    # Troubleshooting - Save screenshot
-    # driver.save_screenshot("screenshot.png")
+    return vehicle_prices
 
-    # Troubleshooting - Save page html source
-    # with open("page_source.html", "w", encoding="utf-8") as file:
-    #    file.write(driver.page_source)
 
-    vehicle_prices = []
+# ------------------------------------------
+# Get prices from fordtodealers.ca
+# ------------------------------------------
+def get_ford_dealer_nav_prices(url: str) -> List[Tuple[str, str, str]]:
+    vehicle_prices = get_nav_prices(url, DEALER_NAV_LOCATORS, "Fordtodealers.ca Error")
 
-    try:
-        # Click on Vehicles button in the main navigation bar
-        all_vehicles_button = driver.find_element(
-            By.XPATH, "//li[@class='main-nav-item no-float-md flyout-item-wrap']/button"
-        )
-        all_vehicles_button.click()
+    # Debugging: Log the vehicle prices
+    logging.info("Ford Dealer Navigation Prices: %s", vehicle_prices)
 
-        # Get all the Sub menu buttons
-        sub_menu_buttons = driver.find_elements(
-            By.XPATH,
-            "//button[contains(@class,'bri-nav__list-link segment-anchor-trigger fgx-btn')]//span[@class='link-text']",
-        )
+    return vehicle_prices
 
-        if not sub_menu_buttons:
-            raise Exception(
-                "Vehicle sub menu navigation not found. Page structure may have changed."
-            )
 
-        # Click through each sub menu to load model and price
-        for sub_menu_button in sub_menu_buttons:
-            sub_menu_button_name = sub_menu_button.text.strip()
-            if sub_menu_button_name == "":
-                continue
-            sub_menu_button.click()
+# ------------------------------------------
+# Get the (category, model, price) rows of a navigation menu
+# - NAVIGATION_EXTRACTION "menu": every category is read from the menu
+#   DOM in one script call, hidden or not; only the categories whose
+#   vehicles load when opened are clicked
+# - NAVIGATION_EXTRACTION "click": every category is clicked and read
+#   once shown
+# ------------------------------------------
+def get_nav_prices(url: str, locators: dict, error_label: str) -> List[Tuple[str, str, str]]:
 
-            # Wait for data to load
-            time.sleep(2)
+    vehicle_prices = []
 
-            # Get the vehicle names and prices
-            sub_menu_all_vehicles_names = driver.find_elements(
-                By.XPATH,
-                "//div[@class='vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container open']//a[@class='veh-item-inline']",
+    try:
+        # Set up the Web driver
+        driver = WebDriverPool.get_driver()
+
+        # Main URL - reused when already loaded, then waits for the locator it needs
+        PageCache.load(driver, url, locators["menu_button"])
+
+        # Troubleshooting - Save page html source
+        # with open("page_source.html", "w", encoding="utf-8") as file:
+        #    file.write(driver.page_source)
+
+        if const["NAVIGATION_EXTRACTION"] == "menu":
+            menu = extract_menu(
+                driver,
+                locators["category"],
+                locators["panel"],
+                locators["model"],
+                locators["price"],
             )
-            sub_menu_all_vehicles_prices = driver.find_elements(
-                By.XPATH,
-                "//div[@class='vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container open']//span[contains(@data-pricing-template,'price')]",
+            if not menu:
+                raise Exception(
+                    "Vehicle sub menu navigation not found. Page structure may have changed."
+                )
+        else:
+            menu = []
+
+        # Categories still to open: the lazy ones, or all of them in click mode
+        lazy_categories = {category for category, pairs in menu if pairs is None}
+        clicked_prices = []
+        if not menu or lazy_categories:
+            clicked_prices = get_clicked_nav_prices(
+                driver, url, locators, lazy_categories if menu else None
             )
 
-            # For element, get the name and price
-            for vehicle, price in zip(
-                sub_menu_all_vehicles_names, sub_menu_all_vehicles_prices
-            ):
-                vehicle_name = vehicle.text.strip()
-                vehicle_price = price.text.strip()
-                if (
-                    vehicle_name == "" or vehicle_price == ""
-                ):  # Ignore half captured data
-                    continue
-                vehicle_prices.append(
-                    (sub_menu_button_name, vehicle_name, vehicle_price)
-                )
+        # Rows in menu order
+        for category, pairs in menu:
+            if pairs is None:
+                vehicle_prices += [row for row in clicked_prices if row[0] == category]
+            else:
+                vehicle_prices += [(category, vehicle_name, vehicle_price) for vehicle_name, vehicle_price in pairs]
+        if not menu:
+            vehicle_prices = clicked_prices
+
+        logging.info(
+            f"Navigation menu of {url}: {len(menu) - len(lazy_categories)} categories "
+            f"read in one pass, {len(lazy_categories) if menu else 'all'} clicked"
+        )
 
-        # Remove possible duplicates
-        vehicle_prices_sorted = list(dict.fromkeys(vehicle_prices).keys())
-        vehicle_prices = vehicle_prices_sorted
+        # Ignore half captured data and remove possible duplicates
+        vehicle_prices = list(
+            dict.fromkeys(
+                row for row in vehicle_prices if row[0] != "" and row[1] != "" and row[2] != ""
+            ).keys()
+        )
 
     except Exception as e:
-        vehicle_prices = [("Ford.ca Error", str(e))]
-
-    # Debugging: Log the vehicle prices
-    logging.info("Ford Manufacturer Navigation Prices: %s", vehicle_prices)
+        # Same 3 fields as a vehicle row: category, car model and price
+        vehicle_prices = [(error_label, error_label, str(e))]
 
     return vehicle_prices
 
 
 # ------------------------------------------
-# Get prices from fordtodealers.ca
+# Click categories of a navigation menu open and read their vehicles
+# - categories: the names to open, None for all of them
 # ------------------------------------------
-def get_ford_dealer_nav_prices(url: str) -> List[Tuple[str, str, str]]:
-
-    # Set up the Web driver
-    driver = WebDriverSingleton.get_driver()
-
-    # Main URL
-    driver.get(url)
-    time.sleep(const["TIME_SLEEP"])  # Allow time for the page to load
-
+def get_clicked_nav_prices(
+    driver, url: str, locators: dict, categories: Optional[Set[str]] = None
+) -> List[Tuple[str, str, str]]:
     vehicle_prices = []
 
-    try:
-        # Click on Vehicles button in the main navigation bar
-        all_vehicles_button = driver.find_element(
-            By.XPATH, "//a[@class='mega-menu-link sf-with-ul']"
-        )
-        all_vehicles_button.click()
+    # Click on Vehicles button in the main navigation bar
+    all_vehicles_button = driver.find_element(By.XPATH, locators["menu_button"])
+    all_vehicles_button.click()
 
-        # Get all the Sub menu buttons
-        sub_menu_buttons = driver.find_elements(
-            By.XPATH,
-            "//li[contains(@class,'mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom mega-menu-item-has-children mega-menu-megamenu mega-menu-grid')]//a[@class='mega-menu-link sf-with-ul']",
-        )
+    # Get all the Sub menu buttons
+    sub_menu_buttons = driver.find_elements(By.XPATH, locators["category"])
 
-        if not sub_menu_buttons:
-            raise Exception(
-                "Vehicle sub menu navigation not found. Page structure may have changed."
-            )
+    if not sub_menu_buttons:
+        raise Exception(
+            "Vehicle sub menu navigation not found. Page structure may have changed."
+        )
 
-        # Click through each sub menu to load model and price
+    # Click through each sub menu to load model and price
+    with Tracer.span("click loop", url=url, buttons=len(sub_menu_buttons)):
         for sub_menu_button in sub_menu_buttons:
             sub_menu_button_name = sub_menu_button.text.strip()
             if sub_menu_button_name == "":
                 continue
+            if categories is not None and sub_menu_button_name not in categories:
+                continue
             sub_menu_button.click()
 
-            # Wait for data to load
-            time.sleep(2)
+            # Wait for the sub menu vehicles to be shown
+            PageReadiness.wait_for(driver, locators["open_model"], url, visible=True)
 
-            # Get the vehicle names and prices
-            sub_menu_all_vehicles_names = driver.find_elements(
-                By.XPATH,
-                "//li[starts-with(@class, 'mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom mega-menu-item-has-children mega-menu-megamenu mega-menu-grid') and contains(@class,'mega-toggle-on')]//li[contains(@class,'mega-menu-column') and not(contains(@class, 'hide'))]//p[@class='vehicle-top']//span[contains(@class,'vehicle-name')]/a[1]",
-            )
-            sub_menu_all_vehicles_prices = driver.find_elements(
-                By.XPATH,
-                "//li[starts-with(@class, 'mega-menu-item mega-menu-item-type-custom mega-menu-item-object-custom mega-menu-item-has-children mega-menu-megamenu mega-menu-grid') and contains(@class,'mega-toggle-on')]//li[contains(@class,'mega-menu-column') and not(contains(@class, 'hide'))]//p[@class='vehicle-bottom']//span[@class='vprice']/span[1]",
+            # Get the vehicle names and prices in one round trip
+            sub_menu_vehicle_prices = extract_pairs(
+                driver, locators["open_model"], locators["open_price"], required=False
             )
 
-            # For element, get the name and price
-            for vehicle, price in zip(
-                sub_menu_all_vehicles_names, sub_menu_all_vehicles_prices
-            ):
-                vehicle_name = vehicle.text.strip()
-                vehicle_price = price.text.strip()
-                if (
-                    vehicle_name == "" or vehicle_price == ""
-                ):  # Ignore half captured data
-                    continue
-                vehicle_prices.append(
-                    (sub_menu_button_name, vehicle_name, vehicle_price)
-                )
-
-        # Remove possible duplicates
-        vehicle_prices_sorted = list(dict.fromkeys(vehicle_prices).keys())
-        vehicle_prices = vehicle_prices_sorted
-
-    except Exception as e:
-        vehicle_prices = [("Fordtodealers.ca Error", str(e))]
-
-    # Debugging: Log the vehicle prices
-    logging.info("Ford Dealer Navigation Prices: %s", vehicle_prices)
+            # For each vehicle, keep the name and price
+            for vehicle_name, vehicle_price in sub_menu_vehicle_prices:
+                vehicle_prices.append((sub_menu_button_name, vehicle_name, vehicle_price))
 
     return vehicle_prices
 
@@ -207,97 +245,109 @@ def get_ford_dealer_nav_prices(url: str) -> List[Tuple[str, str, str]]:
 # ------------------------------------------
 def create_navigation_prices_df(mfr_url: str, dealer_url: str) -> pd.DataFrame:
     try:
-        # Get Vehicle Data
-        ford_mfr_nav_prices = get_ford_mfg_nav_prices(mfr_url)
-        ford_dealer_nav_prices = get_ford_dealer_nav_prices(dealer_url)
+        # Get Vehicle Data - already in the page cache when prefetched by the scheduler
+        ford_mfr_nav_prices = PageCache.extract(
+            "nav_prices", mfr_url, get_ford_mfg_nav_prices
+        )
+        ford_dealer_nav_prices = PageCache.extract(
+            "nav_prices", dealer_url, get_ford_dealer_nav_prices
+        )
 
         # Debugging: Print the data to check the structure
         logging.info("Ford Manufacturer Navigation Prices: %s", ford_mfr_nav_prices)
         logging.info("Ford Dealer Navigation Prices: %s", ford_dealer_nav_prices)
 
-        # Convert datasets to DataFrames
-        nav_mfr_prices_df = pd.DataFrame(
-            ford_mfr_nav_prices,
-            columns=["Category", "Car Model", "Ford Manufacturer Price"],
-        )
-        nav_dealer_prices_df = pd.DataFrame(
-            ford_dealer_nav_prices,
-            columns=["Category", "Car Model", "Ford Dealer Price"],
-        )
-
-        # Debugging: Print the data frames to check the structure
-        logging.info("Manufacturer Prices DataFrame:\n%s", nav_mfr_prices_df)
-        logging.info("Dealer Prices DataFrame:\n%s", nav_dealer_prices_df)
-
-        # String Manipulation for matching - Change ford.ca text to upper
-        nav_mfr_prices_df["Car Model"] = nav_mfr_prices_df["Car Model"].str.upper()
-
-        # String Manipulation for matching - Remove ™ and ® from ford.ca
-        nav_mfr_prices_df["Car Model"] = nav_mfr_prices_df["Car Model"].replace(
-            {"™": "", "®": ""}, regex=True
-        )
-
-        # String Manipulation for matching - Remove ™ and ® from fordtodealers.ca
-        nav_dealer_prices_df["Car Model"] = nav_dealer_prices_df["Car Model"].replace(
-            {"™": "", "®": ""}, regex=True
-        )
-
-        # Add a temporary 'order' column to mfr_df
-        nav_mfr_prices_df["order"] = range(len(nav_mfr_prices_df))
-
-        # Merge datasets on 'Car Model'
-        merged_df = pd.merge(
-            nav_mfr_prices_df,
-            nav_dealer_prices_df,
-            on=["Category", "Car Model"],
-            how="outer",
-            suffixes=("_ford_mfr_vehicles", "_ford_dealer_vehicles"),
-        )
-
-        # Debugging: Print the merged data frame to check the structure
-        logging.info("Merged DataFrame:\n%s", merged_df)
+        with Tracer.span("merge", report="navigation"):
+            # Convert datasets to DataFrames
+            nav_mfr_prices_df = pd.DataFrame(
+                ford_mfr_nav_prices,
+                columns=["Category", "Car Model", "Ford Manufacturer Price"],
+            )
+            nav_dealer_prices_df = pd.DataFrame(
+                ford_dealer_nav_prices,
+                columns=["Category", "Car Model", "Ford Dealer Price"],
+            )
 
-        # Sort by the 'order' column and drop it
-        merged_df.sort_values("order", inplace=True)
-        merged_df.drop("order", axis=1, inplace=True)
+            # Debugging: Print the data frames to check the structure
+            logging.info("Manufacturer Prices DataFrame:\n%s", nav_mfr_prices_df)
+            logging.info("Dealer Prices DataFrame:\n%s", nav_dealer_prices_df)
 
-        # Replace NaN values with $0
-        merged_df.fillna("$0", inplace=True)
+            # Matching keys - no case, ™/® or punctuation differences between the sites
+            nav_mfr_prices_df["key"] = get_model_keys(nav_mfr_prices_df["Car Model"])
+            nav_dealer_prices_df["key"] = get_model_keys(nav_dealer_prices_df["Car Model"])
 
-        # Add a column for price difference
-        merged_df["Price Difference"] = pd.to_numeric(
-            merged_df["Ford Manufacturer Price"].replace("[\\$,]", "", regex=True),
-            errors="coerce",
-        ) - pd.to_numeric(
-            merged_df["Ford Dealer Price"].replace("[\\$,]", "", regex=True),
-            errors="coerce",
-        )
-
-        # Format the "Price Difference" column as currency with negative sign before the dollar amount and no decimals
-        merged_df["Price Difference"] = merged_df["Price Difference"].apply(
-            lambda x: "${:,.0f}".format(x).replace("$-", "-$") if pd.notnull(x) else x
-        )
+            # Match the models of each category, in ford.ca order
+            merged_df = merge_models(
+                nav_mfr_prices_df,
+                nav_dealer_prices_df,
+                on=["Category"],
+                suffixes=("_ford_mfr_vehicles", "_ford_dealer_vehicles"),
+            )
+            merged_df.insert(
+                1,
+                "Car Model",
+                merged_df.pop("Car Model_ford_mfr_vehicles").fillna(
+                    merged_df.pop("Car Model_ford_dealer_vehicles")
+                ),
+            )
 
-        # Add a column for price comparison
-        merged_df["Price Comparison"] = "Match"
-        merged_df.loc[
-            merged_df["Ford Manufacturer Price"] != merged_df["Ford Dealer Price"],
-            "Price Comparison",
-        ] = "Mismatch"
+            # Debugging: Print the merged data frame to check the structure
+            logging.info("Merged DataFrame:\n%s", merged_df)
 
-        # Filter Navigation List by Car Model if needed - Reducing the list
-        if const.get("NAVIGATION_MODEL_LIST", []):
-            merged_df = merged_df[
-                merged_df["Car Model"].isin(const["NAVIGATION_MODEL_LIST"])
-            ]
+            # Parse the prices once into cents - a model missing on one site
+            # gets a "$0" price there
+            for site, price_column in (
+                ("manufacturer", "Ford Manufacturer Price"),
+                ("dealer", "Ford Dealer Price"),
+            ):
+                missing = merged_df[price_column].isna()
+                parsed_prices = parse_prices(merged_df[price_column])
+                merged_df[f"{site}_cents"] = parsed_prices["cents"].mask(missing, 0)
+                merged_df[f"{site}_parse_status"] = parsed_prices["parse_status"].mask(
+                    missing, "missing"
+                )
+                merged_df[price_column] = merged_df[price_column].fillna("$0")
 
-        # Filter Navigation List by Car Category if needed - Reducing the list
-        if const.get("NAVIGATION_CATEGORY_LIST", []):
-            merged_df = merged_df[
-                ~merged_df["Category"].isin(const["NAVIGATION_CATEGORY_LIST"])
-            ]
+            # Add a column for price difference, as currency with negative sign before the dollar amount and no decimals
+            merged_df["Price Difference"] = format_dollars(
+                merged_df["manufacturer_cents"] - merged_df["dealer_cents"]
+            )
 
-        return merged_df
+            # Add a column for price comparison
+            merged_df["Price Comparison"] = get_comparison(
+                merged_df["Ford Manufacturer Price"],
+                merged_df["Ford Dealer Price"],
+                merged_df["manufacturer_cents"],
+                merged_df["dealer_cents"],
+            )
+            merged_df["Match Confidence"] = format_confidence(merged_df.pop("match_confidence"))
+
+            # Filter Navigation List by Car Model if needed - Reducing the list
+            if const.get("NAVIGATION_MODEL_LIST", []):
+                merged_df = merged_df[
+                    merged_df["key"].isin(
+                        get_model_keys(pd.Series(const["NAVIGATION_MODEL_LIST"]))
+                    )
+                ]
+
+            # Filter Navigation List by Car Category if needed - Reducing the list
+            if const.get("NAVIGATION_CATEGORY_LIST", []):
+                merged_df = merged_df[
+                    ~merged_df["Category"].isin(const["NAVIGATION_CATEGORY_LIST"])
+                ]
+
+            # Prices as the report shows them, keeping the scraped ones
+            for site, price_column in (
+                ("manufacturer", "Ford Manufacturer Price"),
+                ("dealer", "Ford Dealer Price"),
+            ):
+                merged_df[f"{site}_price"] = merged_df[price_column]
+                merged_df[price_column] = format_report_prices(
+                    merged_df[price_column],
+                    merged_df[f"{site}_cents"],
+                    merged_df[f"{site}_parse_status"],
+                )
+            return merged_df[NAV_REPORT_COLUMNS + NAV_PRICE_COLUMNS].reset_index(drop=True)
 
     except Exception as e:
         logging.error("An error occurred in create_navigation_prices_df: %s", str(e))
@@ -315,5 +365,4 @@ if __name__ == "__main__":
         )
     )
 
-    driver = WebDriverSingleton.get_driver()
-    driver.quit()
+    WebDriverPool.close_all()
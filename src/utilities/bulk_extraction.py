@@ -0,0 +1,300 @@
+# Built-in Packages
+import json
+from typing import List, Optional, Tuple
+
+# Local Packages
+from classes.tracer import Tracer
+
+
+# ----------------------------------------------------------------------
+# In-page script that pairs models with prices
+# - Reads the text the same way WebElement.text does (empty when hidden)
+# - With card_xpath, model and price XPaths are relative to each card;
+#   the counts are the models and prices found in the cards
+# - Without it, every model is paired with the first unclaimed price
+#   inside its nearest ancestor that holds one. The search stops at the
+#   first ancestor that also holds another model (the list, not the
+#   card), so a card without a price gives (model, "") instead of taking
+#   the next card's price and shifting every later pair
+# - A price nested in its model element is removed from the model name,
+#   like HttpFetcher.pair_text() does on the static HTML
+# ----------------------------------------------------------------------
+PAIRS_SCRIPT = """
+const [modelXPath, priceXPath, cardXPath] = arguments;
+
+function query(xpath, context) {
+  const result = document.evaluate(
+    xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  );
+  const nodes = [];
+  for (let i = 0; i < result.snapshotLength; i++) {
+    nodes.push(result.snapshotItem(i));
+  }
+  return nodes;
+}
+
+function visibleText(element) {
+  if (!element) {
+    return "";
+  }
+  const style = window.getComputedStyle(element);
+  if (
+    style.display === "none" ||
+    style.visibility === "hidden" ||
+    element.getClientRects().length === 0
+  ) {
+    return "";
+  }
+  return (element.innerText || "").trim();
+}
+
+function pairText(model, price) {
+  let modelText = visibleText(model);
+  const priceText = visibleText(price);
+  if (model && price && priceText && model.contains(price)) {
+    modelText = modelText.split(priceText).join("").trim();
+  }
+  return [modelText, priceText];
+}
+
+const pairs = [];
+
+if (cardXPath) {
+  let modelCount = 0;
+  let priceCount = 0;
+  for (const card of query(cardXPath, document)) {
+    const model = query(modelXPath, card)[0];
+    const price = query(priceXPath, card)[0];
+    modelCount += model ? 1 : 0;
+    priceCount += price ? 1 : 0;
+    pairs.push(pairText(model, price));
+  }
+  return {pairs: pairs, models: modelCount, prices: priceCount};
+}
+
+const models = query(modelXPath, document);
+const prices = query(priceXPath, document);
+const claimed = new Set();
+
+for (const model of models) {
+  let price = null;
+  for (let node = model; node && !price; node = node.parentElement) {
+    if (models.some((other) => other !== model && node.contains(other))) {
+      break;
+    }
+    price = prices.find((candidate) => !claimed.has(candidate) && node.contains(candidate));
+  }
+  if (price) {
+    claimed.add(price);
+  }
+  pairs.push(pairText(model, price));
+}
+
+return {pairs: pairs, models: models.length, prices: prices.length};
+"""
+
+ATTRIBUTE_SCRIPT = """
+const [xpath, attribute] = arguments;
+const element = document.evaluate(
+  xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!element) {
+  return null;
+}
+// Like WebElement.get_attribute(), src and href come back as absolute URLs
+if (attribute === "src" || attribute === "href") {
+  return element[attribute] || element.getAttribute(attribute);
+}
+return element.getAttribute(attribute);
+"""
+
+# ----------------------------------------------------------------------
+# Text of the pricing region, for the page fingerprint
+# - textContent, so hidden carousel slides count too
+# - Each locator adds its match count, so a removed card shows even when
+#   its text moved elsewhere
+# ----------------------------------------------------------------------
+REGION_TEXT_SCRIPT = """
+const [xpaths] = arguments;
+const parts = [];
+for (const xpath of xpaths) {
+  const result = document.evaluate(
+    xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  );
+  parts.push(String(result.snapshotLength));
+  for (let i = 0; i < result.snapshotLength; i++) {
+    parts.push((result.snapshotItem(i).textContent || "").replace(/\\s+/g, " ").trim());
+  }
+}
+return parts.join("\\n");
+"""
+
+# ----------------------------------------------------------------------
+# Parts of an element that are never shown as its text: screen-reader
+# only text, hidden and aria-hidden elements, and scripts
+# ----------------------------------------------------------------------
+HIDDEN_TEXT_XPATH = (
+    "descendant-or-self::*[self::script or self::style or self::template"
+    " or @hidden or @aria-hidden='true'"
+    " or contains(translate(@style, ' ', ''), 'display:none')"
+    " or contains(translate(@style, ' ', ''), 'visibility:hidden')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' sr-only ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' visually-hidden ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' screen-reader-text ')]"
+)
+
+# ----------------------------------------------------------------------
+# Every category of a navigation menu with its (model, price) pairs
+# - Reads the text in the DOM (textContent), so the categories that are
+#   not opened are read too, without the HIDDEN_TEXT_XPATH parts inside
+#   each element
+# - A category belongs to the panel that contains it, or the panel its
+#   aria-controls names
+# - Models and prices pair like PAIRS_SCRIPT, within the panel
+# - A category without a panel, or whose panel holds no priced models yet
+#   (they load when opened), comes back with pairs set to null, and is
+#   read by clicking it
+# - Replays answer it with HttpFetcher.read_menu() on the recorded DOM
+# ----------------------------------------------------------------------
+MENU_SCRIPT = f"const hiddenTextXPath = {json.dumps(HIDDEN_TEXT_XPATH)};\n" + """
+const [categoryXPath, panelXPath, modelXPath, priceXPath] = arguments;
+
+function query(xpath, context) {
+  const result = document.evaluate(
+    xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+  );
+  const nodes = [];
+  for (let i = 0; i < result.snapshotLength; i++) {
+    nodes.push(result.snapshotItem(i));
+  }
+  return nodes;
+}
+
+function text(element) {
+  const hidden = element ? new Set(query(hiddenTextXPath, element)) : null;
+  if (!element || hidden.has(element)) {
+    return "";
+  }
+  const walker = document.createTreeWalker(element, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+    acceptNode: (node) => (hidden.has(node) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT),
+  });
+  const parts = [];
+  for (let node = walker.currentNode; node; node = walker.nextNode()) {
+    if (node.nodeType === Node.TEXT_NODE) {
+      parts.push(node.nodeValue);
+    }
+  }
+  return parts.join("").replace(/\\s+/g, " ").trim();
+}
+
+function findPanel(category) {
+  const panel = panels.find((candidate) => candidate.contains(category));
+  if (panel) {
+    return panel;
+  }
+  const control = category.closest("[aria-controls]");
+  const controlled = control && document.getElementById(control.getAttribute("aria-controls"));
+  return controlled && panels.includes(controlled) ? controlled : null;
+}
+
+const categories = query(categoryXPath, document);
+const panels = query(panelXPath, document);
+
+return categories.map((category) => {
+  const panel = findPanel(category);
+  if (!panel) {
+    return [text(category), null];
+  }
+
+  const models = query(modelXPath, panel);
+  const prices = query(priceXPath, panel);
+  if (!models.length) {
+    return [text(category), null];
+  }
+
+  const claimed = new Set();
+  const pairs = models.map((model) => {
+    let price = null;
+    for (let node = model; node && node !== panel.parentElement && !price; node = node.parentElement) {
+      if (models.some((other) => other !== model && node.contains(other))) {
+        break;
+      }
+      price = prices.find((candidate) => !claimed.has(candidate) && node.contains(candidate));
+    }
+    if (price) {
+      claimed.add(price);
+    }
+    return [text(model), text(price)];
+  });
+
+  // Prices filled in by script once the category is opened
+  if (!pairs.some(([model, price]) => model && price)) {
+    return [text(category), null];
+  }
+  return [text(category), pairs];
+});
+"""
+
+
+# ------------------------------------------------------------
+# Get (model, price) text pairs in a single WebDriver round trip
+# ------------------------------------------------------------
+def extract_pairs(
+    driver,
+    model_xpath: str,
+    price_xpath: str,
+    card_xpath: Optional[str] = None,
+    required: bool = True,
+) -> List[Tuple[str, str]]:
+    with Tracer.span("extract"):
+        result = driver.execute_script(PAIRS_SCRIPT, model_xpath, price_xpath, card_xpath)
+
+    # Check if model or price elements are not found
+    if required and (not result["models"] or not result["prices"]):
+        raise Exception(
+            "Model or price elements not found. Page structure may have changed."
+        )
+
+    return [(model, price) for model, price in result["pairs"]]
+
+
+# ------------------------------------------------------------
+# Get an attribute of the first element matching the XPath
+# ------------------------------------------------------------
+def extract_attribute(driver, xpath: str, attribute: str) -> str:
+    with Tracer.span("extract"):
+        value = driver.execute_script(ATTRIBUTE_SCRIPT, xpath, attribute)
+
+    if value is None:
+        raise Exception(
+            f"Element with a {attribute} attribute not found. Page structure may have changed."
+        )
+
+    return value
+
+
+# ------------------------------------------------------------
+# Get the text of the pricing region in a single round trip
+# ------------------------------------------------------------
+def extract_region_text(driver, xpaths: List[str]) -> str:
+    with Tracer.span("extract"):
+        return driver.execute_script(REGION_TEXT_SCRIPT, xpaths)
+
+
+# ------------------------------------------------------------
+# Get every category of a navigation menu in a single round trip
+# - (category, pairs) in menu order, pairs is None for a category that
+#   has to be opened to load its models
+# ------------------------------------------------------------
+def extract_menu(
+    driver, category_xpath: str, panel_xpath: str, model_xpath: str, price_xpath: str
+) -> List[Tuple[str, Optional[List[Tuple[str, str]]]]]:
+    with Tracer.span("extract"):
+        result = driver.execute_script(
+            MENU_SCRIPT, category_xpath, panel_xpath, model_xpath, price_xpath
+        )
+
+    return [
+        (category, None if pairs is None else [(model, price) for model, price in pairs])
+        for category, pairs in result
+    ]
@@ -4,7 +4,192 @@ constants = {
     # ----------------------------------------------------------------
     "BROWSER_DRIVER_TYPE": "firefox",
     "HEADLESS_MODE": True,
-    "TIME_SLEEP": 3,
+    # ----------------------------------------------------------------
+    # HOST_LIMITS keeps the scraping polite per host:
+    # - max_concurrency: vehicles scraped on the host at the same time
+    # - requests_per_second / burst: token bucket for page requests
+    # Hosts that are not listed each get the "default" limits.
+    # ----------------------------------------------------------------
+    "HOST_LIMITS": {
+        "www.ford.ca": {"max_concurrency": 2, "requests_per_second": 0.5, "burst": 2},
+        "fordtodealers.ca": {"max_concurrency": 2, "requests_per_second": 1, "burst": 3},
+        "default": {"max_concurrency": 1, "requests_per_second": 0.5, "burst": 1},
+    },
+    # ----------------------------------------------------------------
+    # WEBDRIVER_BINARY_PATHS pins a local driver per browser, e.g.
+    # "/usr/local/bin/geckodriver". Without one, a driver on the PATH is
+    # used, then the path cached in WEBDRIVER_CACHE_FILE while it is
+    # younger than WEBDRIVER_CACHE_TTL_HOURS, then webdriver_manager.
+    # ----------------------------------------------------------------
+    "WEBDRIVER_BINARY_PATHS": {"chrome": "", "edge": "", "firefox": ""},
+    "WEBDRIVER_CACHE_FILE": "~/.wdm/resolved_drivers.json",
+    "WEBDRIVER_CACHE_TTL_HOURS": 24,
+    # ----------------------------------------------------------------
+    # LEAN_BROWSER_MODE skips images, fonts, media, analytics and the
+    # browser's background services. BLOCKED_URL_PATTERNS are the URL's
+    # Chrome and Edge never request in lean mode (* is a wildcard).
+    # ----------------------------------------------------------------
+    "LEAN_BROWSER_MODE": True,
+    "BLOCKED_URL_PATTERNS": [
+        "*.mp4*",
+        "*.webm*",
+        "*.m3u8*",
+        "*.woff*",
+        "*.ttf*",
+        "*.otf*",
+        "*.eot*",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*facebook.net*",
+        "*facebook.com/tr*",
+        "*adobedtm.com*",
+        "*demdex.net*",
+        "*omtrdc.net*",
+        "*everesttech.net*",
+        "*hotjar.com*",
+        "*bat.bing.com*",
+        "*tiktok.com*",
+        "*linkedin.com/px*",
+        "*snap.licdn.com*",
+    ],
+    # ----------------------------------------------------------------
+    # PAGE_READY_TIMEOUTS is the maximum number of seconds to wait, per
+    # site, for the element an extractor needs. Pages that are ready
+    # sooner are scraped right away. PAGE_READY_POLL_INTERVAL is how
+    # often (seconds) the element is checked for.
+    # ----------------------------------------------------------------
+    "PAGE_READY_TIMEOUTS": {
+        "www.ford.ca": 15,
+        "fordtodealers.ca": 10,
+        "default": 10,
+    },
+    "PAGE_READY_POLL_INTERVAL": 0.25,
+    # ----------------------------------------------------------------
+    # MAX_BROWSER_WORKERS is the number of vehicles scraped at the same
+    # time. Each worker runs its own browser, so keep it low enough for
+    # the container memory (about 300-400 MB per Firefox instance).
+    # ----------------------------------------------------------------
+    "MAX_BROWSER_WORKERS": 3,
+    # ----------------------------------------------------------------
+    # WEBDRIVER_MAX_PAGE_LOADS recycles a browser after that many page
+    # loads. WEBDRIVER_PAGE_LOAD_TIMEOUT (seconds) stops a hung page.
+    # ----------------------------------------------------------------
+    "WEBDRIVER_MAX_PAGE_LOADS": 20,
+    "WEBDRIVER_PAGE_LOAD_TIMEOUT": 60,
+    # ----------------------------------------------------------------
+    # HTTP_FIRST_HOSTS are read with a plain HTTP request and lxml, and
+    # only fall back to the browser when the page needs JavaScript.
+    # JAVASCRIPT_URLS always use the browser. HTTP_TIMEOUT is in seconds.
+    # ----------------------------------------------------------------
+    "HTTP_FIRST_HOSTS": ["fordtodealers.ca"],
+    "JAVASCRIPT_URLS": [],
+    "HTTP_TIMEOUT": 20,
+    "HTTP_USER_AGENT": "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+    # ----------------------------------------------------------------
+    # SITE_URL_OVERRIDES sends the requests of a site origin to another
+    # one, e.g. the local stand-in server of benchmarks/standin_server.py:
+    # {"https://www.ford.ca": "http://localhost:8800/www.ford.ca",
+    #  "https://fordtodealers.ca": "http://localhost:8800/fordtodealers.ca"}
+    # Leave empty to scrape the real sites.
+    # ----------------------------------------------------------------
+    "SITE_URL_OVERRIDES": {},
+    # ----------------------------------------------------------------
+    # RUN_MODE options are: live, record, replay
+    # - record saves every page read in the run to a new directory in
+    #   SNAPSHOT_DIR, including the states after each carousel and
+    #   navigation menu click
+    # - replay runs the comparison from a recorded run without the
+    #   browser or the sites: REPLAY_RUN is the run directory name, or
+    #   "" for the latest recorded run
+    # ----------------------------------------------------------------
+    "RUN_MODE": "live",
+    "SNAPSHOT_DIR": "snapshots",
+    "REPLAY_RUN": "",
+    # ----------------------------------------------------------------
+    # Retries and circuit breaker
+    # - A failed page load or HTTP fetch is tried up to page_attempts
+    #   times, a failed vehicle extraction up to vehicle_attempts times
+    #   on a reloaded page. The wait before a retry is random between 0
+    #   and base_delay * 2^(attempt - 1), capped at max_delay seconds.
+    # - After failure_threshold failed requests in a row, a host is
+    #   skipped for reset_seconds; its remaining pages fail at once and
+    #   are listed as skipped in the report.
+    # ----------------------------------------------------------------
+    "RETRY": {
+        "page_attempts": 3,
+        "vehicle_attempts": 2,
+        "base_delay": 1.0,
+        "max_delay": 10.0,
+    },
+    "CIRCUIT_BREAKER": {
+        "failure_threshold": 3,
+        "reset_seconds": 120,
+    },
+    # ----------------------------------------------------------------
+    # Incremental runs
+    # - The pricing region of every page read in one pass is
+    #   fingerprinted and saved in FINGERPRINT_FILE. When a page's
+    #   fingerprint matches the last run, its prices are reused and the
+    #   report marks them "unchanged since <timestamp>". Pages the browser
+    #   clicks through (carousels, next buttons) are always extracted.
+    # - Reused prices are extracted again once they are older than
+    #   FINGERPRINT_MAX_AGE_HOURS.
+    # ----------------------------------------------------------------
+    "INCREMENTAL_RUNS": True,
+    "FINGERPRINT_FILE": "fingerprints.json",
+    "FINGERPRINT_MAX_AGE_HOURS": 168,
+    # ----------------------------------------------------------------
+    # HISTORY_DIR keeps the prices and hero image filenames of every
+    # run: Parquet files partitioned by date, and a SQLite index for
+    # the PriceHistory query helpers. Leave empty to keep no history.
+    # ----------------------------------------------------------------
+    "HISTORY_DIR": "history",
+    # ----------------------------------------------------------------
+    # MODEL_MATCHING pairs manufacturer and dealer model names that are
+    # not written the same way. Names match when they are equal without
+    # trademarks, case, punctuation and the vehicle name; the remaining
+    # names match when their similarity (0 to 1) is at least
+    # min_similarity. The report shows the match confidence.
+    # ----------------------------------------------------------------
+    "MODEL_MATCHING": {
+        "min_similarity": 0.9,
+    },
+    # ----------------------------------------------------------------
+    # IMAGE_COMPARISON compares the hero images by content: their bytes
+    # are downloaded into cache_dir (revalidated on later runs, least
+    # recently used removed past cache_max_mb) and hashed on a pool of
+    # workers. Images match when their 64 bit hashes differ in at most
+    # max_distance bits. Disabled, or for videos, the filenames are
+    # compared.
+    # ----------------------------------------------------------------
+    "IMAGE_COMPARISON": {
+        "enabled": True,
+        "cache_dir": "image_cache",
+        "cache_max_mb": 200,
+        "workers": 4,
+        "max_distance": 10,
+    },
+    # ----------------------------------------------------------------
+    # REPORT_ARCHIVE_DIR keeps a copy of each run's HTML report, the
+    # same one that is emailed. Leave empty to not archive the reports.
+    # ----------------------------------------------------------------
+    "REPORT_ARCHIVE_DIR": "reports",
+    # ----------------------------------------------------------------
+    # TRACE_FILE receives the timing spans of each run (run, site,
+    # vehicle and phases) as a Chrome trace: open it in chrome://tracing
+    # or https://ui.perfetto.dev. Leave empty to only log the summary.
+    # ----------------------------------------------------------------
+    "TRACE_FILE": "trace.json",
+    # ----------------------------------------------------------------
+    # Metrics written at the end of each run: Prometheus text format for
+    # the node exporter textfile collector (point its
+    # --collector.textfile.directory at the folder) and the same values
+    # as JSON. Leave a file empty to skip it.
+    # ----------------------------------------------------------------
+    "METRICS_PROMETHEUS_FILE": "metrics/ford_prices.prom",
+    "METRICS_JSON_FILE": "metrics/ford_prices.json",
     # ----------------------------------------------------------------
     # Email configuration
     # ----------------------------------------------------------------
@@ -23,6 +208,10 @@ constants = {
         "MUSTANG MACH-E",
     ],
     "NAVIGATION_CATEGORY_LIST": [],
+    # NAVIGATION_EXTRACTION "menu" reads every category of the navigation
+    # menus from the page in one call, and only clicks the categories
+    # whose vehicles load once opened. "click" opens every category.
+    "NAVIGATION_EXTRACTION": "menu",
     "MAIN_NAVIGATION_MENU_MANUFACTURER_URL": "https://www.ford.ca",
     "MAIN_NAVIGATION_MENU_DEALER_URL": "https://fordtodealers.ca",
     # ----------------------------------------------------------------
@@ -0,0 +1,204 @@
+# 3rd Party Pacakges
+import numpy as np
+import pandas as pd
+
+# Built-in Packages
+from collections import defaultdict, deque
+from difflib import SequenceMatcher
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Local Packages
+from .constants import constants as const
+
+# Marks the sites add to some model names but not others
+TRADEMARKS = r"[™®©℠]"
+
+
+# ----------------------------------------------------------------------
+# Matching key of model names: no trademarks, upper case, and words of
+# letters and digits separated by single spaces ("F-150® XLT" ->
+# "F 150 XLT")
+# - context (e.g. the vehicle name) is removed from the start of the
+#   key, so "F-150® XLT" and "XLT" get the same key on an F-150 page
+# ----------------------------------------------------------------------
+def get_model_keys(names: pd.Series, context: str = "") -> pd.Series:
+    keys = (
+        names.astype("string")
+        .str.replace(TRADEMARKS, "", regex=True)
+        .str.normalize("NFKC")
+        .str.upper()
+        .str.replace(r"[^0-9A-Z]+", " ", regex=True)
+        .str.strip()
+        .fillna("")
+        .astype(object)
+    )
+    context_key = normalize_model(context) if context else ""
+    if not context_key:
+        return keys
+
+    # A key that is only the context keeps it
+    prefix = context_key + " "
+    return keys.map(lambda key: key[len(prefix):] if key.startswith(prefix) else key)
+
+
+def normalize_model(name: str, context: str = "") -> str:
+    return get_model_keys(pd.Series([name]), context).iloc[0]
+
+
+# ----------------------------------------------------------------------
+# Similarity of two matching keys, from 0 to 1
+# - 0 when the numbers differ (F-150 / F-250, Transit 250 / 350) or when
+#   one key only adds words to the other (Raptor / Raptor R), those are
+#   different trims
+# - Otherwise the similarity of the keys without spaces, so "F150" and
+#   "F 150" are the same and small spelling differences score high
+# ----------------------------------------------------------------------
+def get_similarity(key_a: str, key_b: str) -> float:
+    compact_a = key_a.replace(" ", "")
+    compact_b = key_b.replace(" ", "")
+    if re.findall(r"\d+", compact_a) != re.findall(r"\d+", compact_b):
+        return 0.0
+
+    tokens_a = set(key_a.split())
+    tokens_b = set(key_b.split())
+    if tokens_a != tokens_b and (tokens_a <= tokens_b or tokens_b <= tokens_a):
+        return 0.0
+
+    return SequenceMatcher(None, compact_a, compact_b).ratio()
+
+
+# ----------------------------------------------------------------------
+# Match two lists of keys one to one
+# - Returns (left index, right index, confidence) in left order, then
+#   the unmatched right keys; an unmatched side is None with confidence
+#   None
+# - Equal keys match first, with confidence 1, the n-th occurrence of a
+#   key on one side with its n-th occurrence on the other
+# - The keys left over are only compared when they share a word or the
+#   first letters (blocking), and pair up best first when their
+#   similarity is at least MODEL_MATCHING min_similarity
+# ----------------------------------------------------------------------
+def match_models(
+    left_keys: List[str], right_keys: List[str]
+) -> List[Tuple[Optional[int], Optional[int], Optional[float]]]:
+    matches: Dict[int, Tuple[int, float]] = {}
+
+    # Normalized-key index
+    right_by_key: Dict[str, deque] = defaultdict(deque)
+    for right_index, key in enumerate(right_keys):
+        right_by_key[key].append(right_index)
+    for left_index, key in enumerate(left_keys):
+        if right_by_key.get(key):
+            matches[left_index] = (right_by_key[key].popleft(), 1.0)
+
+    # Similarity fallback over the leftovers, within their blocks
+    matched_right = {right_index for right_index, _ in matches.values()}
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for right_index, key in enumerate(right_keys):
+        if right_index not in matched_right:
+            for block in get_blocks(key):
+                blocks[block].append(right_index)
+
+    candidates = []
+    for left_index, key in enumerate(left_keys):
+        if left_index in matches:
+            continue
+        compared = set()
+        for block in get_blocks(key):
+            for right_index in blocks.get(block, []):
+                if right_index in compared:
+                    continue
+                compared.add(right_index)
+                similarity = get_similarity(key, right_keys[right_index])
+                if similarity >= const["MODEL_MATCHING"]["min_similarity"]:
+                    candidates.append((-similarity, left_index, right_index))
+
+    for negative_similarity, left_index, right_index in sorted(candidates):
+        if left_index not in matches and right_index not in matched_right:
+            matches[left_index] = (right_index, round(-negative_similarity, 2))
+            matched_right.add(right_index)
+
+    pairs: List[Tuple[Optional[int], Optional[int], Optional[float]]] = [
+        (left_index, *matches[left_index]) if left_index in matches else (left_index, None, None)
+        for left_index in range(len(left_keys))
+    ]
+    pairs.extend(
+        (None, right_index, None)
+        for right_index in range(len(right_keys))
+        if right_index not in matched_right
+    )
+    return pairs
+
+
+def get_blocks(key: str) -> set:
+    return set(key.split()) | {"#" + key.replace(" ", "")[:3]}
+
+
+# ----------------------------------------------------------------------
+# Outer merge of the manufacturer and dealer rows of model names
+# - Both frames hold the "on" columns, a "key" column (get_model_keys)
+#   and their own columns; the columns both have get the suffixes
+# - Rows match within the same "on" values, as match_models() pairs
+#   them: equal keys with one vectorized merge, the rows left over by
+#   similarity
+# - Adds "match_confidence": 1 for equal keys, the similarity for
+#   similar keys, NaN for a row found on one side only
+# - Rows keep the left order, followed by the unmatched right rows in
+#   their order
+# ----------------------------------------------------------------------
+def merge_models(
+    left_df: pd.DataFrame,
+    right_df: pd.DataFrame,
+    on: List[str],
+    suffixes: Tuple[str, str] = ("_left", "_right"),
+) -> pd.DataFrame:
+    join_columns = on + ["key", "occurrence"]
+    left_df = left_df.assign(
+        occurrence=left_df.groupby(on + ["key"], sort=False).cumcount(),
+        left_order=np.arange(len(left_df)),
+    )
+    right_df = right_df.assign(
+        occurrence=right_df.groupby(on + ["key"], sort=False).cumcount(),
+        right_order=np.arange(len(right_df)),
+    )
+    merged_df = pd.merge(
+        left_df, right_df, on=join_columns, how="outer", suffixes=suffixes, sort=False
+    )
+    merged_df["match_confidence"] = np.where(
+        merged_df["left_order"].notna() & merged_df["right_order"].notna(), 1.0, np.nan
+    )
+
+    # Right columns in the merged frame, to move a similar right row onto its left row
+    shared_columns = (set(left_df.columns) & set(right_df.columns)) - set(join_columns)
+    right_columns = [
+        column + suffixes[1] if column in shared_columns else column
+        for column in right_df.columns
+        if column not in join_columns + ["right_order"]
+    ]
+
+    left_only = merged_df[merged_df["right_order"].isna()]
+    right_only = merged_df[merged_df["left_order"].isna()]
+    if not left_only.empty and not right_only.empty:
+        right_groups = dict(list(right_only.groupby(on, sort=False, dropna=False)))
+        moved_rows = []
+        for group, left_rows in left_only.groupby(on, sort=False, dropna=False):
+            right_rows = right_groups.get(group)
+            if right_rows is None:
+                continue
+            for left_index, right_index, confidence in match_models(
+                list(left_rows["key"]), list(right_rows["key"])
+            ):
+                if left_index is None or right_index is None:
+                    continue
+                left_label = left_rows.index[left_index]
+                right_label = right_rows.index[right_index]
+                merged_df.loc[left_label, right_columns] = merged_df.loc[right_label, right_columns]
+                merged_df.loc[left_label, "match_confidence"] = confidence
+                moved_rows.append(right_label)
+        merged_df = merged_df.drop(index=moved_rows)
+
+    merged_df = merged_df.sort_values(
+        ["left_order", "right_order"], kind="stable", na_position="last"
+    )
+    return merged_df.drop(columns=["occurrence", "left_order", "right_order"]).reset_index(drop=True)
@@ -0,0 +1,183 @@
+# 3rd Party Pacakges
+from selenium.webdriver.common.by import By
+
+# Built-in Packages
+import logging
+from typing import List, Optional, Tuple
+
+# Local Packages
+from utilities.bulk_extraction import (
+    extract_attribute,
+    extract_pairs,
+    extract_region_text,
+)
+from classes.fingerprint_store import FingerprintStore
+from classes.http_fetcher import HttpFetcher
+from classes.page_cache import PageCache
+from classes.page_readiness import PageReadiness
+from classes.tracer import Tracer
+from classes.web_driver_pool import WebDriverPool
+
+
+# ------------------------------------------------------------
+# Get (model, price) text pairs, over HTTP when the page is
+# server-rendered and from the browser otherwise
+# - carousel_xpath: the browser clicks each carousel button and
+#   collects the pairs of every slide
+# - script_click: click through JavaScript, for carousel buttons
+#   that are covered by other elements
+# - The pairs of a page whose fingerprint matches the last run are
+#   reused (FingerprintStore). Pages the browser clicks through are
+#   always extracted: their fingerprint would only see the first slide
+# ------------------------------------------------------------
+def get_model_prices(
+    url: str,
+    model_xpath: str,
+    price_xpath: str,
+    carousel_xpath: Optional[str] = None,
+    card_xpath: Optional[str] = None,
+    script_click: bool = False,
+) -> List[Tuple[str, str]]:
+    region_xpaths = [
+        xpath for xpath in (carousel_xpath, card_xpath, model_xpath, price_xpath) if xpath
+    ]
+    fingerprint_key = "|".join(region_xpaths)
+
+    model_prices = HttpFetcher.extract_pairs(url, model_xpath, price_xpath, card_xpath)
+    if model_prices is not None:
+        # Read in milliseconds, the fingerprint only tells if the page changed
+        if FingerprintStore.is_enabled():
+            fingerprint = FingerprintStore.fingerprint(
+                HttpFetcher.get_region_text(url, region_xpaths)
+            )
+            FingerprintStore.save(url, fingerprint_key, fingerprint, model_prices)
+        return model_prices
+
+    logging.info(f"Using the browser for {url}")
+
+    # Set up the Web driver
+    driver = WebDriverPool.get_driver()
+
+    # Vehicle URL - reused when already loaded, then waits for the locator it needs
+    PageCache.load(driver, url, carousel_xpath or card_xpath or model_xpath)
+
+    if carousel_xpath:
+        return get_carousel_model_prices(
+            driver, url, model_xpath, price_xpath, carousel_xpath, card_xpath, script_click
+        )
+
+    fingerprint = get_page_fingerprint(driver, region_xpaths)
+    stored_prices = FingerprintStore.lookup(url, fingerprint_key, fingerprint)
+    if stored_prices is not None:
+        return stored_prices
+
+    model_prices = extract_pairs(driver, model_xpath, price_xpath, card_xpath)
+    FingerprintStore.save(url, fingerprint_key, fingerprint, model_prices)
+    return model_prices
+
+
+# ------------------------------------------------------------
+# Click through every slide of a carousel and collect its pairs
+# ------------------------------------------------------------
+def get_carousel_model_prices(
+    driver,
+    url: str,
+    model_xpath: str,
+    price_xpath: str,
+    carousel_xpath: str,
+    card_xpath: Optional[str] = None,
+    script_click: bool = False,
+) -> List[Tuple[str, str]]:
+    buttons = driver.find_elements(By.XPATH, carousel_xpath)
+
+    # Check if buttons are not found
+    if not buttons:
+        raise Exception("Scrolling buttons not found. Page structure may have changed.")
+
+    model_prices = []
+    with Tracer.span("click loop", url=url, buttons=len(buttons)):
+        for button in buttons:
+            # Click the current carousel button
+            if script_click:
+                driver.execute_script("arguments[0].click();", button)
+            else:
+                button.click()
+
+            # Wait for the clicked slide to become the active one
+            PageReadiness.wait_for_active(driver, button, url)
+
+            model_prices.extend(
+                extract_pairs(driver, model_xpath, price_xpath, card_xpath)
+            )
+
+    return model_prices
+
+
+# ------------------------------------------------------------
+# Get (model, price) text pairs of every page of a carousel that
+# only has a next button, until the button is disabled
+# - Always extracted: a fingerprint would only see the first page
+# ------------------------------------------------------------
+def get_paged_model_prices(
+    url: str,
+    model_xpath: str,
+    price_xpath: str,
+    next_xpath: str,
+    max_pages: int,
+) -> List[Tuple[str, str]]:
+
+    # Set up the Web driver
+    driver = WebDriverPool.get_driver()
+
+    # Vehicle URL - reused when already loaded, then waits for the locator it needs
+    PageCache.load(driver, url, next_xpath)
+
+    exit_count = max_pages  # Exit count to prevent infinite loop
+    model_prices = []
+
+    with Tracer.span("click loop", url=url):
+        while True:
+            button = driver.find_element(By.XPATH, next_xpath)
+
+            model_prices.extend(extract_pairs(driver, model_xpath, price_xpath))
+
+            # Check if the button is disabled
+            if "disabled" in button.get_attribute("class"):
+                break
+
+            # Decrement the exit count, if it reaches 0, raise an exception
+            exit_count -= 1
+            if exit_count == 0:
+                raise Exception("Exit count reached 0 - infinite loop detected.")
+
+            button.click()
+
+    return model_prices
+
+
+# ------------------------------------------------------------
+# Fingerprint of the pricing region of the loaded page, or None
+# when incremental runs are off
+# ------------------------------------------------------------
+def get_page_fingerprint(driver, region_xpaths: List[str]) -> Optional[str]:
+    if not FingerprintStore.is_enabled():
+        return None
+    return FingerprintStore.fingerprint(extract_region_text(driver, region_xpaths))
+
+
+# ------------------------------------------------------------
+# Get an attribute of the first element matching the XPath,
+# over HTTP when the page is server-rendered
+# ------------------------------------------------------------
+def get_attribute(url: str, xpath: str, attribute: str) -> str:
+    value = HttpFetcher.extract_attribute(url, xpath, attribute)
+    if value is not None:
+        return value
+
+    # Set up the Web driver
+    driver = WebDriverPool.get_driver()
+
+    # Vehicle URL - reused when already loaded, then waits for the locator it needs
+    PageCache.load(driver, url, xpath)
+
+    return extract_attribute(driver, xpath, attribute)
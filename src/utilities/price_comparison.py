@@ -0,0 +1,189 @@
+# 3rd Party Pacakges
+import numpy as np
+import pandas as pd
+
+# Built-in Packages
+from typing import Dict, List, Tuple
+
+# Local Packages
+from .model_matching import get_model_keys, merge_models
+from .price_parsing import format_prices, parse_prices
+
+# Report columns of a vehicle price table
+REPORT_COLUMNS = [
+    "Car Model",
+    "Ford Manufacturer Price",
+    "Ford Dealer Price",
+    "Price Difference",
+    "Price Comparison",
+    "Match Confidence",
+]
+
+
+# ----------------------------------------------------------------------
+# Match when both prices are the same number of cents; text that is not
+# a price is compared as text
+# ----------------------------------------------------------------------
+def get_comparison(
+    manufacturer_prices: pd.Series,
+    dealer_prices: pd.Series,
+    manufacturer_cents: pd.Series,
+    dealer_cents: pd.Series,
+) -> pd.Series:
+    both_parsed = manufacturer_cents.notna() & dealer_cents.notna()
+    same = np.where(
+        both_parsed,
+        (manufacturer_cents == dealer_cents).fillna(False),
+        manufacturer_prices == dealer_prices,
+    )
+    return pd.Series(
+        np.where(same, "Match", "Mismatch"), index=manufacturer_prices.index
+    )
+
+
+# ----------------------------------------------------------------------
+# Format cents as whole dollars, "-$1,500" for negative amounts and "-"
+# when there is no amount - only done when the report is rendered
+# ----------------------------------------------------------------------
+def format_dollars(cents: pd.Series) -> pd.Series:
+    dollars = (cents.astype("Float64") / 100).round()
+    text = dollars.abs().astype("Int64").astype("string")
+
+    # Thousands separators: "34995" -> "34,995"
+    text = text.str.replace(r"(\d)(?=(\d{3})+$)", r"\1,", regex=True)
+
+    return ("$" + text).where(dollars >= 0, "-$" + text).fillna("-").astype(object)
+
+
+# ----------------------------------------------------------------------
+# Prices as the report shows them: "$45,995" for a parsed price, the
+# scraped text otherwise - only done when the report is rendered
+# ----------------------------------------------------------------------
+def format_report_prices(
+    prices: pd.Series, cents: pd.Series, parse_status: pd.Series
+) -> pd.Series:
+    return format_prices(cents).where(parse_status == "ok", prices).astype(object)
+
+
+# ----------------------------------------------------------------------
+# Format match confidences as percentages, "-" for a model found on one
+# site only
+# ----------------------------------------------------------------------
+def format_confidence(confidence: pd.Series) -> pd.Series:
+    percent = (confidence.astype("Float64") * 100).round().astype("Int64").astype("string")
+    return (percent + "%").fillna("-").astype(object)
+
+
+# ----------------------------------------------------------------------
+# Compare the prices of every vehicle in one pass
+# - vehicle_prices holds (vehicle name, manufacturer pairs, dealer
+#   pairs) in report order
+# - The pairs of both sites go into a single long frame, are parsed to
+#   cents once (with their parse status) and matched on (vehicle, model
+#   key) by merge_models(). The prices stay as scraped; the cents and
+#   parse status columns go on to the report and the price history
+# - A model missing on one site gets a "$0" price on that site, and no
+#   match confidence
+# - Rows keep the report order of the vehicles and are sorted by the
+#   manufacturer price within a vehicle
+# ----------------------------------------------------------------------
+def compare_vehicle_prices(
+    vehicle_prices: List[Tuple[str, List[Tuple[str, str]], List[Tuple[str, str]]]]
+) -> pd.DataFrame:
+    records = [
+        (vehicle_order, vehicle_name, site, model, price)
+        for vehicle_order, (vehicle_name, mfr_prices, dealer_prices) in enumerate(vehicle_prices)
+        for site, prices in (("manufacturer", mfr_prices), ("dealer", dealer_prices))
+        for model, price in prices
+    ]
+    long_df = pd.DataFrame.from_records(
+        records, columns=["vehicle_order", "vehicle", "site", "model", "price"]
+    )
+    long_df[["cents", "parse_status"]] = parse_prices(long_df["price"])
+
+    # Matching keys without the vehicle name, e.g. "XLT" for "F-150® XLT" on the F-150 page
+    long_df["key"] = long_df.groupby("vehicle", sort=False)["model"].transform(
+        lambda models: get_model_keys(models, models.name)
+    )
+
+    is_manufacturer = long_df["site"] == "manufacturer"
+    columns = ["vehicle_order", "vehicle", "key", "model", "price", "cents", "parse_status"]
+    merged_df = merge_models(
+        long_df.loc[is_manufacturer, columns],
+        long_df.loc[~is_manufacturer, columns],
+        on=["vehicle_order", "vehicle"],
+        suffixes=("_manufacturer", "_dealer"),
+    )
+
+    # Sort on the manufacturer price as scraped, models it lacks go last
+    merged_df.sort_values(
+        ["vehicle_order", "cents_manufacturer"],
+        kind="stable",
+        na_position="last",
+        inplace=True,
+    )
+
+    prices_df = pd.DataFrame(
+        {
+            "vehicle": merged_df["vehicle"],
+            "model": merged_df["model_manufacturer"].fillna(merged_df["model_dealer"]),
+            "dealer_model": merged_df["model_dealer"],
+            "manufacturer_price": merged_df["price_manufacturer"].fillna("$0"),
+            "dealer_price": merged_df["price_dealer"].fillna("$0"),
+            "manufacturer_cents": merged_df["cents_manufacturer"].mask(
+                merged_df["price_manufacturer"].isna(), 0
+            ),
+            "dealer_cents": merged_df["cents_dealer"].mask(
+                merged_df["price_dealer"].isna(), 0
+            ),
+            "manufacturer_parse_status": merged_df["parse_status_manufacturer"].fillna("missing"),
+            "dealer_parse_status": merged_df["parse_status_dealer"].fillna("missing"),
+            "match_confidence": merged_df["match_confidence"],
+        }
+    ).reset_index(drop=True)
+
+    prices_df["difference_cents"] = prices_df["manufacturer_cents"] - prices_df["dealer_cents"]
+    prices_df["comparison"] = get_comparison(
+        prices_df["manufacturer_price"],
+        prices_df["dealer_price"],
+        prices_df["manufacturer_cents"],
+        prices_df["dealer_cents"],
+    )
+    return prices_df
+
+
+# ----------------------------------------------------------------------
+# Report tables of every vehicle, formatted once for all vehicles
+# - Vehicles without any price get an empty table
+# ----------------------------------------------------------------------
+def get_vehicle_report_frames(
+    prices_df: pd.DataFrame, vehicle_names: List[str]
+) -> Dict[str, pd.DataFrame]:
+    report_df = pd.DataFrame(
+        {
+            "vehicle": prices_df["vehicle"],
+            "Car Model": prices_df["model"],
+            "Ford Manufacturer Price": format_report_prices(
+                prices_df["manufacturer_price"],
+                prices_df["manufacturer_cents"],
+                prices_df["manufacturer_parse_status"],
+            ),
+            "Ford Dealer Price": format_report_prices(
+                prices_df["dealer_price"],
+                prices_df["dealer_cents"],
+                prices_df["dealer_parse_status"],
+            ),
+            "Price Difference": format_dollars(prices_df["difference_cents"]),
+            "Price Comparison": prices_df["comparison"],
+            "Match Confidence": format_confidence(prices_df["match_confidence"]),
+        }
+    )
+
+    vehicle_frames = {
+        vehicle_name: vehicle_df.drop(columns="vehicle").reset_index(drop=True)
+        for vehicle_name, vehicle_df in report_df.groupby("vehicle", sort=False)
+    }
+    return {
+        vehicle_name: vehicle_frames.get(vehicle_name, pd.DataFrame(columns=REPORT_COLUMNS))
+        for vehicle_name in vehicle_names
+    }
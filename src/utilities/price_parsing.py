@@ -0,0 +1,78 @@
+# 3rd Party Pacakges
+import pandas as pd
+
+# Built-in Packages
+import re
+
+# ----------------------------------------------------------------------
+# Price patterns, compiled once
+# - An amount is whole dollars with an optional 2 digit decimal part
+#   ("45,995", "45,995.00"), its thousands separated by the same ",",
+#   space or no-break space throughout ("45 995,00" in French-Canadian)
+# - The amount next to a "$" is the price, so labels, model years and
+#   footnotes around it are ignored: "Starting at $45,995 1",
+#   "À partir de 45 995 $", "MSRP $45,995*"
+# - A digit stuck to a complete group of 3 is a footnote innerText ran
+#   into the price ("$45,9951" is $45,995), and a bare number is never
+#   the part before a thousands separator ("45" of "45,9951")
+# - An amount is never read from part of a number: "." before 3 digits
+#   is not a decimal point ("$45.995", "45.995 $" are not prices)
+# ----------------------------------------------------------------------
+AMOUNT = (
+    r"(?P<dollars>\d{1,3}(?P<separator>[,\u0020\u00a0\u202f])\d{3}(?:(?P=separator)\d{3})*"
+    r"|\d+(?![,\u0020\u00a0\u202f]\d{3}))"
+    r"(?:[.,](?P<decimals>\d{2}))?(?:(?<=[,\u0020\u00a0\u202f]\d{3})\d)?(?!\d)(?!\.\d)"
+)
+DOLLAR_FIRST = re.compile(r"\$\s*" + AMOUNT)
+DOLLAR_LAST = re.compile(r"(?<![\d.,])" + AMOUNT + r"\s*\$")
+
+# A price without "$" is only read when nothing else is left around it
+PRICE_LABELS = re.compile(
+    r"starting\s+(?:at|from)|à\s+partir\s+de|a\s+partir\s+de|msrp|pdsf|from|dès|:",
+    re.IGNORECASE,
+)
+BARE_AMOUNT = re.compile(r"^\s*" + AMOUNT + r"\s*$")
+
+# Superscript footnote digits and footnote marks
+FOOTNOTES = re.compile(r"[\u00b9\u00b2\u00b3\u2070-\u2079*†‡§]")
+
+
+# ----------------------------------------------------------------------
+# Parse price texts into integer cents, all at once
+# - Returns "cents" (NA when the text is not a price) and
+#   "parse_status": "ok", "empty" (no text) or "invalid" (e.g. an error
+#   message)
+# ----------------------------------------------------------------------
+def parse_prices(prices: pd.Series) -> pd.DataFrame:
+    text = prices.astype("string").str.replace(FOOTNOTES, "", regex=True)
+
+    parts = text.str.extract(DOLLAR_FIRST)
+    for pattern, pattern_text in (
+        (DOLLAR_LAST, text),
+        (BARE_AMOUNT, text.str.replace(PRICE_LABELS, "", regex=True)),
+    ):
+        missing = parts["dollars"].isna()
+        if not missing.any():
+            break
+        parts.loc[missing] = pattern_text[missing].str.extract(pattern)
+
+    dollars = pd.to_numeric(parts["dollars"].str.replace(r"\D", "", regex=True), errors="coerce")
+    decimals = pd.to_numeric(parts["decimals"], errors="coerce").fillna(0)
+    cents = (dollars * 100 + decimals).astype("Int64")
+
+    is_empty = text.str.strip().fillna("").eq("")
+    parse_status = pd.Series("invalid", index=prices.index, dtype=object)
+    parse_status[cents.notna()] = "ok"
+    parse_status[is_empty] = "empty"
+
+    return pd.DataFrame({"cents": cents.where(~is_empty), "parse_status": parse_status})
+
+
+# ----------------------------------------------------------------------
+# Price text of cents, the way the report shows prices: "$45,995", or
+# "$45,995.50" when there are cents
+# ----------------------------------------------------------------------
+def format_prices(cents: pd.Series) -> pd.Series:
+    dollars = (cents // 100).astype("string").str.replace(r"(\d)(?=(\d{3})+$)", r"\1,", regex=True)
+    decimals = (cents % 100).astype("string").str.zfill(2)
+    return ("$" + dollars).where(cents % 100 == 0, "$" + dollars + "." + decimals)
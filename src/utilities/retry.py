@@ -0,0 +1,61 @@
+# Built-in Packages
+import logging
+import random
+import time
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+# Local Packages
+from .constants import constants as const
+from classes.metrics import Metrics
+from classes.site_health import SiteDownError
+from classes.snapshot_store import SnapshotStore
+
+T = TypeVar("T")
+
+
+# ----------------------------------------------------------------------
+# Backoff before the next attempt, with full jitter
+# - Random between 0 and the exponential delay, so workers that failed
+#   together do not all retry the same host at the same moment
+# ----------------------------------------------------------------------
+def get_backoff_delay(attempt: int) -> float:
+    retry = const["RETRY"]
+    return random.uniform(0, min(retry["max_delay"], retry["base_delay"] * 2 ** (attempt - 1)))
+
+
+# ----------------------------------------------------------------------
+# Call func until it succeeds or runs out of attempts
+# - SiteDownError is never retried: the host's circuit is open
+# - before_retry runs after the backoff, e.g. to force a page reload
+# ----------------------------------------------------------------------
+def call_with_retry(
+    func: Callable[[], T],
+    attempts: int,
+    description: str,
+    reason: str,
+    retry_on: Tuple[Type[Exception], ...] = (Exception,),
+    before_retry: Optional[Callable[[], None]] = None,
+) -> T:
+    # Replayed pages are the same on every attempt
+    if SnapshotStore.is_replaying():
+        attempts = 1
+
+    for attempt in range(1, attempts + 1):
+        try:
+            return func()
+        except SiteDownError:
+            raise
+        except retry_on as e:
+            if attempt == attempts:
+                raise
+
+            delay = get_backoff_delay(attempt)
+            message = str(e).strip().split("\n")[0] or type(e).__name__
+            logging.warning(
+                f"{description} failed (attempt {attempt} of {attempts}), "
+                f"retrying in {delay:.1f}s: {message}"
+            )
+            Metrics.inc("retries_total", reason=reason)
+            time.sleep(delay)
+            if before_retry is not None:
+                before_retry()
@@ -0,0 +1,22 @@
+# Built-in Packages
+from typing import Dict, Optional
+
+# Local Packages
+from .constants import constants as const
+
+
+# ------------------------------------------------------------
+# URL actually requested for a site URL
+# - SITE_URL_OVERRIDES maps a site origin to another one (e.g. the
+#   local stand-in server). Only the request goes there: caches,
+#   snapshots, rate limits and the report keep the site URL.
+# ------------------------------------------------------------
+def redirect_url(url: str, overrides: Optional[Dict[str, str]] = None) -> str:
+    overrides = const["SITE_URL_OVERRIDES"] if overrides is None else overrides
+
+    for origin, target in overrides.items():
+        origin = origin.rstrip("/")
+        if url == origin or (url.startswith(origin) and url[len(origin)] in "/?#"):
+            return target.rstrip("/") + url[len(origin) :]
+
+    return url
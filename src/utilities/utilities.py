@@ -11,9 +11,15 @@ import re
 import smtplib
 import time
 from typing import Callable, Optional, List, Tuple
+from urllib.parse import urljoin
 
 # Local Packages
 from .constants import constants as const
+from classes.fingerprint_store import FingerprintStore
+from classes.page_cache import PageCache
+from classes.report_renderer import Report
+from classes.result_collector import ResultCollector
+from classes.tracer import Tracer
 
 # Load environment variables from the .env file
 load_dotenv(override=True)
@@ -39,137 +45,92 @@ def print_elapsed_time(start_time: float, process_name: str) -> None:
     )
 
 
-# ----------------------------------------------------------------------
-# Change the colour background to Red if found the word Mismatch.
-# ----------------------------------------------------------------------
-def redden(x: str) -> str:
-    if x == "Mismatch":
-        return f'<span style="background-color: red; color: white; padding: 2px 5px; border-radius: 3px;">{x}</span>'
-    return str(x)
-
-
 # ------------------------------------------
-# Create Model-Prices data frame
+# Get the Model-Prices pairs of both sites
+# - Compared for every vehicle at once by compare_vehicle_prices()
 # ------------------------------------------
-def create_vehicle_prices_df(
+def get_vehicle_prices(
     price_func_mfr: Callable[[str], list],
     price_func_dealer: Callable[[str], list],
     mfr_price_url: str,
     dealer_price_url: str,
-) -> pd.DataFrame:
-
-    # Get Vehicle Prices
-    vehicle_mfr_prices = price_func_mfr(mfr_price_url)
-    vehicle_dealer_prices = price_func_dealer(dealer_price_url)
-
-    # Convert datasets to DataFrames
-    vehicle_mfr_prices_df = pd.DataFrame(
-        vehicle_mfr_prices, columns=["Car Model", "Ford Manufacturer Price"]
-    )
-    vehicle_dealer_prices_df = pd.DataFrame(
-        vehicle_dealer_prices, columns=["Car Model", "Ford Dealer Price"]
-    )
-
-    # Merge datasets on 'Car Model'
-    merged_df = pd.merge(
-        vehicle_mfr_prices_df,
-        vehicle_dealer_prices_df,
-        on="Car Model",
-        how="outer",
-        suffixes=("_ford_mfr_vehicles", "_ford_dealer_vehicles"),
-    )
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
 
-    # Create a temporary column with numeric values
-    merged_df["temp"] = pd.to_numeric(
-        merged_df["Ford Manufacturer Price"].replace("[\$,]", "", regex=True),
-        errors="coerce",
+    # Get Vehicle Prices - a URL shared with another vehicle is only scraped once per run
+    vehicle_mfr_prices = PageCache.extract("prices", mfr_price_url, price_func_mfr)
+    vehicle_dealer_prices = PageCache.extract(
+        "prices", dealer_price_url, price_func_dealer
     )
 
-    # Sort by the temporary column
-    merged_df.sort_values(by=["temp"], inplace=True)
+    return vehicle_mfr_prices, vehicle_dealer_prices
 
-    # Drop the temporary column
-    merged_df.drop(columns=["temp"], inplace=True)
 
-    # Set the index to 'Car Model'
-    merged_df.set_index("Car Model", inplace=True)
-
-    # Replace NaN values with $0
-    merged_df.fillna("$0", inplace=True)
-
-    # Reset the index to avoid multi-level index rendering issues
-    merged_df.reset_index(inplace=True)
-
-    # Add a column for price difference
-    merged_df["Price Difference"] = pd.to_numeric(
-        merged_df["Ford Manufacturer Price"].replace("[\$,]", "", regex=True),
-        errors="coerce",
-    ) - pd.to_numeric(
-        merged_df["Ford Dealer Price"].replace("[\$,]", "", regex=True), errors="coerce"
-    )
-
-    # Format the "Price Difference" column as currency with negative sign before the dollar amount and no decimals
-    merged_df["Price Difference"] = merged_df["Price Difference"].apply(
-        lambda x: "${:,.0f}".format(x).replace("$-", "-$") if pd.notnull(x) else x
-    )
-
-    # Replace NaN values with - in Price Difference
-    merged_df["Price Difference"] = merged_df["Price Difference"].fillna("-")
-
-    # Add a column for price comparison
-    merged_df["Price Comparison"] = "Match"
-    merged_df.loc[
-        merged_df["Ford Manufacturer Price"] != merged_df["Ford Dealer Price"],
-        "Price Comparison",
-    ] = "Mismatch"
+# ------------------------------------------
+# "unchanged since <timestamp>" for the pages of a vehicle that
+# matched their fingerprint from an earlier run, else ""
+# ------------------------------------------
+def get_unchanged_note(mfr_price_url: str, dealer_price_url: str) -> str:
+    mfr_since = FingerprintStore.get_unchanged_since(mfr_price_url)
+    dealer_since = FingerprintStore.get_unchanged_since(dealer_price_url)
 
-    return merged_df
+    if mfr_since and dealer_since:
+        # Timestamps sort as text; both pages are unchanged since the later one
+        return f"unchanged since {max(mfr_since, dealer_since)}"
+    if mfr_since:
+        return f"Manufacturer unchanged since {mfr_since}"
+    if dealer_since:
+        return f"Dealer unchanged since {dealer_since}"
+    return ""
 
 
 # ------------------------------------------
-# Create Model-Image data frame
+# Collect the Model-Image record of a vehicle
 # - Compare the image filenames
+# - The record goes to ResultCollector; the report frame is built once
 # ------------------------------------------
-def create_vehicle_image_df(
+def add_vehicle_image_record(
     hero_image_func_mfr: Callable[[str], str],
     hero_image_func_dealer: Callable[[str], str],
     model: str,
     mfr_image_url: str,
     dealer_image_url: str,
-) -> pd.DataFrame:
-
-    # Get Vehicle Images
-    vehicle_mfr_hero_image = hero_image_func_mfr(mfr_image_url)
-    vehicle_dealer_hero_image = hero_image_func_dealer(dealer_image_url)
-
-    # Embed hyperlinks in the image URLs
-
-    # Convert datasets to DataFrames
-    hero_image_df = pd.DataFrame(
-        {
-            "Model Hero Image": [model],
-            "Ford Manufacturer Image URL": [mfr_image_url],
-            "Ford Manufacturer Image Filename": [vehicle_mfr_hero_image],
-            "Ford Dealer Image URL": [dealer_image_url],
-            "Ford Dealer Image Filename": [vehicle_dealer_hero_image],
-        }
+) -> dict:
+
+    # Get Vehicle Images - reuses the page loaded for the prices when the URLs match
+    vehicle_mfr_hero_image = PageCache.extract(
+        "hero_img", mfr_image_url, hero_image_func_mfr
+    )
+    vehicle_dealer_hero_image = PageCache.extract(
+        "hero_img", dealer_image_url, hero_image_func_dealer
     )
 
-    # Add a column for price comparison
-    hero_image_df["Image Comparison"] = "Match"
+    # The extractors return the image URL, or the reason there is none
+    mfr_image_match = parse_img_filename(vehicle_mfr_hero_image)
+    dealer_image_match = parse_img_filename(vehicle_dealer_hero_image)
+    mfr_image_filename = mfr_image_match.group(1) if mfr_image_match else vehicle_mfr_hero_image
+    dealer_image_filename = dealer_image_match.group(1) if dealer_image_match else vehicle_dealer_hero_image
 
     # Compare filenames without extensions
-    hero_image_df.loc[
-        hero_image_df["Ford Manufacturer Image Filename"].apply(
-            lambda x: x.split(".", 1)[0]
-        )
-        != hero_image_df["Ford Dealer Image Filename"].apply(
-            lambda x: x.split(".", 1)[0]
-        ),
-        "Image Comparison",
-    ] = "Mismatch"
-
-    return hero_image_df
+    # - Exactly, not with the model name matching (MODEL_MATCHING): asset
+    #   names like "mustang-gt-2025-hero" and "mustang-gt-2024-hero" are
+    #   near-identical strings of different photos, so a similarity
+    #   threshold would call them a Match
+    # - ImageComparator compares the images themselves at report time
+    same_image = mfr_image_filename.split(".", 1)[0] == dealer_image_filename.split(".", 1)[0]
+
+    hero_image_record = {
+        "Model Hero Image": model,
+        "Ford Manufacturer Image URL": mfr_image_url,
+        "Ford Manufacturer Image Filename": mfr_image_filename,
+        "Ford Dealer Image URL": dealer_image_url,
+        "Ford Dealer Image Filename": dealer_image_filename,
+        "Image Comparison": "Match" if same_image else "Mismatch",
+        "Compared By": "filename",
+        "Ford Manufacturer Image Source": vehicle_mfr_hero_image if mfr_image_match else "",
+        "Ford Dealer Image Source": vehicle_dealer_hero_image if dealer_image_match else "",
+    }
+    ResultCollector.add("hero_images", hero_image_record)
+    return hero_image_record
 
 
 # ------------------------------------------------
@@ -179,8 +140,19 @@ def parse_img_filename(img_src: str) -> Optional[re.Match]:
     return re.search(r"\/([^\/]+\.(jpe?g|png|mp4|tif|webp))", img_src)
 
 
+# ------------------------------------------------
+# Absolute image URL of an img source attribute, or of the url() in a
+# style attribute
+# ------------------------------------------------
+def parse_img_url(img_src: str, page_url: str) -> str:
+    match = re.search(r"url\((['\"]?)(.*?)\1\)", img_src)
+    return urljoin(page_url, match.group(2) if match else img_src.strip())
+
+
 # ------------------------------------------------
 # Send Dealer Email
+# - The report is rendered once by ReportRenderer; the email carries its
+#   plain text and HTML versions
 # ------------------------------------------------
 def send_dealer_email(
     sender_email: str,
@@ -188,156 +160,34 @@ def send_dealer_email(
     bcc_email: str,
     password: str,
     subject: str,
-    vehicles_list_html: List[Tuple[str, pd.DataFrame, str, str]],
-    all_model_images_df: pd.DataFrame,
-    nav_prices_df: pd.DataFrame,
+    report: Report,
 ) -> None:
-    # Check if there's any "Mismatch" value in the "Price Comparison" column for Navigation Menu Prices and Model Images
-    nav_match_status = (
-        "All Match"
-        if "Mismatch" not in nav_prices_df["Price Comparison"].values
-        else "Mismatch"
-    )
-    img_match_status = (
-        "All Match"
-        if all_model_images_df.empty
-        or "Mismatch" not in all_model_images_df["Image Comparison"].values
-        else "Mismatch"
-    )
-
-    # Create the summary List - Navigation
-    summary_data = [
-        ("<a href='#nav_prices'>NAVIGATION MENU PRICES</a>", nav_match_status)
-    ]
-
-    # Appending the summary List - Vehicles
-    for vehicle_name, vehicle_df, _, _ in vehicles_list_html:
-
-        # Create anchor tag for each vehicle_name
-        vehicle_link = f"<a href='#{vehicle_name.replace('™', '').replace('®', '').replace(' ', '_')}'>{vehicle_name}</a>"
-
-        comparison = (
-            "All Match"
-            if vehicle_df["Price Comparison"].eq("Match").all()
-            else "Mismatch"
-        )
-        summary_data.append((vehicle_link, comparison))
-
-    # Appending the summary List - Images
-    if not all_model_images_df.empty:
-        summary_data.append(
-            ("<a href='#hero_images'>MODEL HERO IMAGES</a>", img_match_status)
-        )
-
-    # Create the summary DataFrame
-    summary_df = pd.DataFrame(summary_data, columns=["Section", "Comparison Result"])
-
-    # Determine email subject prepend
-    email_subject_prepend = (
-        "[Mismatch Found] - "
-        if "Mismatch" in summary_df["Comparison Result"].values
-        else ""
-    )
 
     # Split the string into a list using comma as a separator
     receiver_emails_list = receiver_email.split(",")
     bcc_emails_list = bcc_email.split(",")
 
-    # Create the message
-    msg = MIMEMultipart()
+    # Create the message - mail clients show the last part they can display
+    msg = MIMEMultipart("alternative")
     msg["From"] = sender_email
     msg["To"] = (
         ",".join(receiver_emails_list)
         if len(receiver_emails_list) > 1
         else receiver_emails_list[0]
     )
-    msg["Subject"] = f"{email_subject_prepend} {subject}"
-
-    # Customize HTML content for Gmail email
-    html_content = f"""
-    <html>
-      <head>
-        <style>
-          table {{
-            border-collapse: collapse;
-            width: 100%;
-          }}
-          th, td {{
-            text-align: left;
-            padding: 8px;
-            border: 1px solid #dddddd;
-          }}
-          th {{
-            background-color: #f2f2f2;
-          }}
-          td.match {{
-            background-color: green;
-            color: white;
-          }}
-          td.mismatch {{
-            background-color: red;
-            color: white;
-          }}
-        </style>
-      </head>
-      <body>
-        <p>Please review the most recent price {'and image ' if not const["EMAIL_IMG_COMPARISON_SKIP"] else ''}comparisons between Ford.ca and Fordtodealers.ca. This email serves as an informational audit and requires verification by the recipient prior to any pricing updates.</p>
-        <h2><a id='summary' name='summary'>COMPARISON SUMMARY<a></h2>
-        <p>This is a summary of the comparison results for the Navigation Menu Prices{', Model Hero Images,' if not const["EMAIL_IMG_COMPARISON_SKIP"] else ''} and Vehicle Prices. Click on the links to jump to the corresponding section.</p>
-        {summary_df.to_html(classes="table", escape=False, index=False, formatters={"Comparison Result": redden})}
-        <br>
-        <h2><a id="nav_prices" name="nav_prices">NAVIGATION MENU PRICES</a></h2>
-        Data Source URLs:
-        <ul>
-          <li>Manufacturer: <a href="{const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"]}" target="_blank">{const["MAIN_NAVIGATION_MENU_MANUFACTURER_URL"]}</a></li>
-          <li>Dealer: <a href="{const["MAIN_NAVIGATION_MENU_DEALER_URL"]}" target="_blank">{const["MAIN_NAVIGATION_MENU_DEALER_URL"]}</a></li>
-        </ul>
-        {nav_prices_df.to_html(classes='table', escape=False, index=False, formatters={'Price Comparison': redden})}
-        <br>
-        <div style='text-align: right;'><a href='#summary'>Back to Summary</a></div>
-    """
-
-    # Loop through each vehicle and add corresponding HTML sections
-    for vehicle_name, vehicle_df, manufacturer_url, dealer_url in vehicles_list_html:
-
-        vehicle_id = vehicle_name.replace("™", "").replace("®", "").replace(" ", "_")
-
-        html_content += f"""
-        <h2><a id='{vehicle_id}' name='{vehicle_id}'>{vehicle_name} PRICES</a></h2>
-        Data Source URLs:
-        <ul>
-          <li>Manufacturer: <a href="{manufacturer_url}" target="_blank">{manufacturer_url}</a></li>
-          <li>Dealer: <a href="{dealer_url}" target="_blank">{dealer_url}</a></li>
-        </ul>
-        {vehicle_df.to_html(classes='table', escape=False, index=False, formatters={'Price Comparison': redden})}
-        <br>
-        <div style='text-align: right;'><a href='#summary'>Back to Summary</a></div>
-        """
-
-    if not all_model_images_df.empty:
-        # Continue with the remaining HTML content
-        html_content += f"""
-            <br>
-            <hr>
-            <h2><a id="hero_images" name="hero_images">MODEL HERO IMAGES</a></h2>
-            <p>The comparisons are done based on the base filename (ignoring file extensions) and not the actual image presented.</p>
-            {all_model_images_df.to_html(classes='table', escape=False, index=False, formatters={'Image Comparison': redden})}
-            <br>
-            <div style='text-align: right;'><a href='#summary'>Back to Summary</a></div>
-        </body>
-        </html>
-        """
-
-    msg.attach(MIMEText(html_content, "html"))
-
-    # Connect to the SMTP server
-    with smtplib.SMTP("smtp.gmail.com", 587) as server:
-        server.starttls()
-        server.login(sender_email, password)
-        server.sendmail(
-            sender_email, receiver_emails_list + bcc_emails_list, msg.as_string()
-        )
-        server.quit()
+    msg["Subject"] = report.get_subject(subject)
+    msg.attach(MIMEText(report.text, "plain"))
+    msg.attach(MIMEText(report.html, "html"))
+
+    with Tracer.span("smtp"):
+        # Connect to the SMTP server
+        with smtplib.SMTP("smtp.gmail.com", 587) as server:
+            server.starttls()
+            server.login(sender_email, password)
+            server.sendmail(
+                sender_email, receiver_emails_list + bcc_emails_list, msg.as_string()
+            )
+            server.quit()
 
 
 # ------------------------------------------------
@@ -368,9 +218,10 @@ def send_error_email(
     body = f"An error occurred in the Ford Dealer Comparison application at {timestamp}\n\n{error_message}"
     msg.attach(MIMEText(body, "plain"))
 
-    server = smtplib.SMTP("smtp.gmail.com", 587)
-    server.starttls()
-    server.login(sender_email, password)
-    text = msg.as_string()
-    server.sendmail(sender_email, receiver_emails_list, text)
-    server.quit()
+    with Tracer.span("smtp"):
+        server = smtplib.SMTP("smtp.gmail.com", 587)
+        server.starttls()
+        server.login(sender_email, password)
+        text = msg.as_string()
+        server.sendmail(sender_email, receiver_emails_list, text)
+        server.quit()
@@ -0,0 +1,323 @@
+# ----------------------------------------------------------------------
+# Vehicle site specs, run by src/vehicle_extraction.py
+#
+# Each vehicle declares, per site ("manufacturer" = ford.ca, "dealer" =
+# fordtodealers.ca), how its prices and hero image are read:
+#
+# prices
+# - strategy: "static"        one read of the page
+#             "owl_dots"      click every owl-dots carousel button
+#             "bds_carousel"  click every bds-carousel indicator
+#             "next_button"   click the next button until it is disabled
+# - model_xpath / price_xpath: locators of the model names and prices
+# - card_xpath: optional, model and price XPaths are then relative to it
+# - next_xpath / max_pages: "next_button" strategy only
+# - Post-processing rules, applied in this order:
+#   model_first_line   keep the first line of the model text
+#   model_strip_price  remove the price text from the model text
+#   model_replace      {old: new} replacements in the model name
+#   price_replace      {old: new} replacements in the price
+#   Prices are kept as scraped; the comparison parses them once with
+#   utilities/price_parsing.py, which drops labels ("Starting at"),
+#   footnotes and French-Canadian formatting
+#   dedupe             drop repeated (model, price) pairs (default True)
+#
+# hero_image
+# - xpath / attribute: the element holding the image URL (src or style)
+#
+# URL's and skip flags stay in constants.py, under "<key>_..." names.
+# ----------------------------------------------------------------------
+
+# ------------------------------------------
+# Locators shared by several vehicles
+# ------------------------------------------
+MFG_TITLE_ONE_MODEL = "//*[@class='fgx-brand-ds to-fade-in generic-title-one ff-d']"
+MFG_TITLE_THREE_MODEL = "//*[@class='fgx-brand-ds to-fade-in title-three ff-d']"
+MFG_CAROUSEL_PRICE = '//*[@class="price"]'
+MFG_CHECKBOX_MODEL = "//a[@class='to-checkbox fgx-lnc-btm-brdr-hover']"
+MFG_CHECKBOX_PRICE = '//span[@class="make-info price bri-txt body-three ff-b"]//span[contains(@data-pricing-template, "{price}")]'
+MFG_BRI_MODEL = "//*[@class='bri-txt generic-title-one ff-b']"
+MFG_BRI_PRICE = '//*[@class="bri-txt body-one ff-b"]'
+MFG_MODEL_NAME = "//*[@class='modelName']"
+MFG_MODEL_PRICE = '//div[@class="modelDetails matchItem"]//p[@class="modelPrice"]//span[@data-pricing-trimmsrp]//p'
+MFG_NEXT_BUTTON = '//div[@id="component04"]//button[contains(@class,"fgx-btn to-fade-in carousel-btn carousel-arrow carousel-next scrollable")]'
+
+MFG_COMPONENT_IMAGE = '//*[@id="component01"]//picture/img'
+MFG_BILLBOARD_IMAGE = '//div[@class="billboard-img"]//picture/img'
+MFG_DIV_IMAGE = '//div[@class="image "]//picture/img'
+
+DEALER_OWL_MODEL = "//*[contains(@class,'modelChecker')]"
+DEALER_OWL_PRICE = "//*[contains(@class,'priceChecker')]"
+DEALER_LIST_MODEL = "//div[contains(@class,'modelChecker')]/div/ul/li/a/span"
+DEALER_LIST_PRICE = "//div[contains(@class,'modelChecker')]/div/ul/li/a/span/label"
+DEALER_LI_MODEL = "//span[@class='modelCheckerLi']"
+DEALER_LI_PRICE = "//span[@class='modelCheckerLi']/label"
+
+DEALER_ROW_IMAGE = '//div[starts-with(@class,"row-bg") and contains(@class,"using-image")]'
+
+# ------------------------------------------
+# Common site specs
+# ------------------------------------------
+MFG_TITLE_ONE_CAROUSEL = {
+    "strategy": "bds_carousel",
+    "model_xpath": MFG_TITLE_ONE_MODEL,
+    "price_xpath": MFG_CAROUSEL_PRICE,
+}
+MFG_TITLE_THREE_CAROUSEL = {
+    "strategy": "bds_carousel",
+    "model_xpath": MFG_TITLE_THREE_MODEL,
+    "price_xpath": MFG_CAROUSEL_PRICE,
+}
+MFG_TITLE_THREE_STATIC = {
+    "strategy": "static",
+    "model_xpath": MFG_TITLE_THREE_MODEL,
+    "price_xpath": MFG_CAROUSEL_PRICE,
+}
+MFG_CHECKBOX_STATIC = {
+    "strategy": "static",
+    "model_xpath": MFG_CHECKBOX_MODEL,
+    "price_xpath": MFG_CHECKBOX_PRICE,
+}
+MFG_BRI_STATIC = {
+    "strategy": "static",
+    "model_xpath": MFG_BRI_MODEL,
+    "price_xpath": MFG_BRI_PRICE,
+    "dedupe": False,
+}
+MFG_NEXT_BUTTON_PAGES = {
+    "strategy": "next_button",
+    "model_xpath": MFG_TITLE_THREE_MODEL,
+    "price_xpath": MFG_CAROUSEL_PRICE,
+    "next_xpath": MFG_NEXT_BUTTON,
+    "max_pages": 10,
+}
+
+DEALER_OWL_CAROUSEL = {
+    "strategy": "owl_dots",
+    "model_xpath": DEALER_OWL_MODEL,
+    "price_xpath": DEALER_OWL_PRICE,
+}
+DEALER_LIST_STATIC = {
+    "strategy": "static",
+    "model_xpath": DEALER_LIST_MODEL,
+    "price_xpath": DEALER_LIST_PRICE,
+    "model_first_line": True,
+    "dedupe": False,
+}
+DEALER_LI_STATIC = {
+    "strategy": "static",
+    "model_xpath": DEALER_LI_MODEL,
+    "price_xpath": DEALER_LI_PRICE,
+    "model_first_line": True,
+    "dedupe": False,
+}
+
+MFG_COMPONENT_HERO = {"xpath": MFG_COMPONENT_IMAGE, "attribute": "src"}
+MFG_BILLBOARD_HERO = {"xpath": MFG_BILLBOARD_IMAGE, "attribute": "src"}
+MFG_DIV_HERO = {"xpath": MFG_DIV_IMAGE, "attribute": "src"}
+DEALER_ROW_HERO = {"xpath": DEALER_ROW_IMAGE, "attribute": "style"}
+
+
+# ------------------------------------------
+# Vehicles in report order
+# ------------------------------------------
+VEHICLE_SPECS = [
+    {
+        "name": "BRONCO®",
+        "key": "BRONCO",
+        "manufacturer": {
+            "prices": {
+                "strategy": "static",
+                "model_xpath": MFG_MODEL_NAME,
+                "price_xpath": MFG_MODEL_PRICE,
+                "model_replace": {"Bronco® ": ""},
+                "dedupe": False,
+            },
+            "hero_image": MFG_DIV_HERO,
+        },
+        "dealer": {"prices": DEALER_LIST_STATIC, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "BRONCO® SPORT",
+        "key": "BRONCO_SPORT",
+        "manufacturer": {"prices": MFG_CHECKBOX_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "CHASSIS CAB",
+        "key": "CHASSIS_CAB",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "E-SERIES CUTAWAY",
+        "key": "E_SERIES_CUTAWAY",
+        "manufacturer": {"prices": MFG_TITLE_THREE_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "E-SERIES STRIPPED CHASSIS",
+        "key": "E_SERIES_STRIPPED_CHASSIS",
+        "manufacturer": {"prices": MFG_CHECKBOX_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "E-TRANSIT",
+        "key": "E_TRANSIT",
+        "manufacturer": {"prices": MFG_TITLE_THREE_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "EDGE®",
+        "key": "EDGE",
+        "manufacturer": {"prices": MFG_TITLE_ONE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "ESCAPE",
+        "key": "ESCAPE",
+        "manufacturer": {"prices": MFG_BRI_STATIC, "hero_image": MFG_BILLBOARD_HERO},
+        "dealer": {"prices": DEALER_LIST_STATIC, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "EXPLORER®",
+        "key": "EXPLORER",
+        "manufacturer": {"prices": MFG_TITLE_ONE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "EXPEDITION®",
+        "key": "EXPEDITION",
+        "manufacturer": {"prices": MFG_BRI_STATIC, "hero_image": MFG_BILLBOARD_HERO},
+        "dealer": {"prices": DEALER_LI_STATIC, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "F-SERIES STRIPPED CHASSIS",
+        "key": "F_SERIES_STRIPPED_CHASSIS",
+        "manufacturer": {"prices": MFG_CHECKBOX_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "F-150®",
+        "key": "F150",
+        "manufacturer": {
+            "prices": {
+                "strategy": "static",
+                "model_xpath": MFG_MODEL_NAME,
+                "price_xpath": MFG_MODEL_PRICE,
+                "model_replace": {"F-150® ": ""},
+            },
+            "hero_image": MFG_DIV_HERO,
+        },
+        "dealer": {
+            "prices": {**DEALER_LIST_STATIC, "dedupe": True},
+            "hero_image": DEALER_ROW_HERO,
+        },
+    },
+    {
+        "name": "F-150® COMMERICAL",
+        "key": "F150_COMMERCIAL",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "F-150® LIGHTENING®",
+        "key": "F150_LIGHTENING",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {
+            "prices": DEALER_OWL_CAROUSEL,
+            "hero_image": {
+                "xpath": '//video[starts-with(@class,"nectar-video-bg")]/source',
+                "attribute": "src",
+            },
+        },
+    },
+    {
+        "name": "F-650® F-750®",
+        "key": "F650_F750",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "MAVERICK®",
+        "key": "MAVERICK",
+        "manufacturer": {"prices": MFG_BRI_STATIC, "hero_image": MFG_BILLBOARD_HERO},
+        "dealer": {"prices": DEALER_LI_STATIC, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "MUSTANG®",
+        "key": "MUSTANG",
+        "manufacturer": {"prices": MFG_TITLE_ONE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "MUSTANG MACH-E®",
+        "key": "MUSTANG_MACH_E",
+        "manufacturer": {
+            "prices": MFG_BRI_STATIC,
+            "hero_image": {
+                "xpath": '//div[contains(@class,"billboard-img")]//picture/img',
+                "attribute": "src",
+            },
+        },
+        "dealer": {
+            "prices": {
+                "strategy": "static",
+                "card_xpath": DEALER_LIST_MODEL,
+                "model_xpath": ".",
+                "price_xpath": ".//label",
+                "model_strip_price": True,
+                "dedupe": False,
+            },
+            "hero_image": DEALER_ROW_HERO,
+        },
+    },
+    {
+        "name": "RANGER®",
+        "key": "RANGER",
+        "manufacturer": {"prices": MFG_BRI_STATIC, "hero_image": MFG_BILLBOARD_HERO},
+        "dealer": {"prices": DEALER_LI_STATIC, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "SUPER DUTY®",
+        "key": "SUPER_DUTY",
+        "manufacturer": {"prices": MFG_NEXT_BUTTON_PAGES, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "SUPER DUTY® COMMERICAL",
+        "key": "SUPER_DUTY_COMMERCIAL",
+        "manufacturer": {"prices": MFG_NEXT_BUTTON_PAGES, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "TRANSIT®",
+        "key": "TRANSIT",
+        "manufacturer": {"prices": MFG_TITLE_THREE_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "TRANSIT® CC-CA",
+        "key": "TRANSIT_CC_CA",
+        "manufacturer": {"prices": MFG_TITLE_THREE_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "TRANSIT® COMMERCIAL",
+        "key": "TRANSIT_COMMERCIAL",
+        "manufacturer": {"prices": MFG_TITLE_THREE_STATIC, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "TRANSIT® CONNECT",
+        "key": "TRANSIT_CONNECT",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+    {
+        "name": "TRANSIT® CONNECT COMMERCIAL",
+        "key": "TRANSIT_CONNECT_COMMERCIAL",
+        "manufacturer": {"prices": MFG_TITLE_THREE_CAROUSEL, "hero_image": MFG_COMPONENT_HERO},
+        "dealer": {"prices": DEALER_OWL_CAROUSEL, "hero_image": DEALER_ROW_HERO},
+    },
+]
@@ -0,0 +1,242 @@
+# 3rd Party Pacakges
+from dotenv import load_dotenv
+
+# Built-in Packages
+from functools import partial
+import os
+import sys
+from typing import Callable, Dict, List, Tuple
+
+# Get the current script's directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Add the project root directory to sys.path
+sys.path.append(os.path.dirname(script_dir))
+sys.path.append(os.path.join(os.path.dirname(script_dir), "src"))
+
+# Local Packages
+from utilities.constants import constants as const
+from utilities.page_extraction import (
+    get_attribute,
+    get_model_prices,
+    get_paged_model_prices,
+)
+from utilities.retry import call_with_retry
+from utilities.utilities import parse_img_filename, parse_img_url
+from utilities.vehicle_specs import VEHICLE_SPECS
+from classes.http_fetcher import HttpFetcher
+from classes.metrics import Metrics
+from classes.site_health import SiteDownError, SiteHealth
+from classes.web_driver_pool import WebDriverPool
+
+# Load environment variables from the .env file
+load_dotenv(override=True)
+
+# Error rows keep the labels the report has always shown
+SITE_ERROR_LABELS = {
+    "manufacturer": "Ford.ca Error",
+    "dealer": "Fordtodealers.ca Error",
+}
+
+OWL_DOTS_XPATH = "(//div[@class='owl-dots'])[1]/button"  # Stop at the first div instance
+BDS_INDICATORS_XPATH = "(//ol[@class='bds-carousel-indicators global-indicators to-fade-in  scrollable'])/li"  # Stop at the first ol instance
+
+
+# ------------------------------------------
+# Extraction strategies
+# ------------------------------------------
+def read_static(url: str, spec: dict) -> List[Tuple[str, str]]:
+    return get_model_prices(
+        url, spec["model_xpath"], spec["price_xpath"], card_xpath=spec.get("card_xpath")
+    )
+
+
+def read_owl_dots(url: str, spec: dict) -> List[Tuple[str, str]]:
+    # Server-rendered pages hold every carousel slide, the browser only
+    # clicks through the carousel when the page needs JavaScript
+    return get_model_prices(
+        url,
+        spec["model_xpath"],
+        spec["price_xpath"],
+        carousel_xpath=spec.get("carousel_xpath", OWL_DOTS_XPATH),
+    )
+
+
+def read_bds_carousel(url: str, spec: dict) -> List[Tuple[str, str]]:
+    return get_model_prices(
+        url,
+        spec["model_xpath"],
+        spec["price_xpath"],
+        carousel_xpath=spec.get("carousel_xpath", BDS_INDICATORS_XPATH),
+        script_click=True,
+    )
+
+
+def read_next_button(url: str, spec: dict) -> List[Tuple[str, str]]:
+    return get_paged_model_prices(
+        url,
+        spec["model_xpath"],
+        spec["price_xpath"],
+        spec["next_xpath"],
+        spec["max_pages"],
+    )
+
+
+STRATEGIES: Dict[str, Callable[[str, dict], List[Tuple[str, str]]]] = {
+    "static": read_static,
+    "owl_dots": read_owl_dots,
+    "bds_carousel": read_bds_carousel,
+    "next_button": read_next_button,
+}
+
+
+# ------------------------------------------
+# Post-processing rules of a prices spec
+# ------------------------------------------
+def clean_model_prices(
+    model_prices: List[Tuple[str, str]], spec: dict
+) -> List[Tuple[str, str]]:
+    vehicle_prices = []
+
+    for model_name, price_value in model_prices:
+        if spec.get("model_first_line"):
+            model_name = model_name.split("\n")[0]  # Strip everything after '\n'
+        if spec.get("model_strip_price"):
+            model_name = model_name.replace(price_value, "").replace("\n", " ").strip()
+        for old, new in spec.get("model_replace", {}).items():
+            model_name = model_name.replace(old, new)
+        for old, new in spec.get("price_replace", {}).items():
+            price_value = price_value.replace(old, new)
+
+        if model_name == "" or price_value == "":  # Ignore half captured data
+            continue
+        vehicle_prices.append((model_name, price_value))
+
+    # Remove possible duplicates
+    if spec.get("dedupe", True):
+        vehicle_prices = list(dict.fromkeys(vehicle_prices).keys())
+
+    return vehicle_prices
+
+
+# ------------------------------------------
+# Get prices of one site, as declared in its spec
+# - A failed extraction is retried on a freshly loaded page
+# ------------------------------------------
+def get_prices(spec: dict, site: str, url: str) -> List[Tuple[str, str]]:
+    prices_spec = spec[site]["prices"]
+
+    try:
+        # Fails at once, before a browser is started, when the site is down
+        SiteHealth.check(url)
+
+        model_prices = call_with_retry(
+            partial(STRATEGIES[prices_spec["strategy"]], url, prices_spec),
+            const["RETRY"]["vehicle_attempts"],
+            f"{spec['name']} {site} prices",
+            "vehicle",
+            before_retry=WebDriverPool.forget_page,
+        )
+        vehicle_prices = clean_model_prices(model_prices, prices_spec)
+
+    except SiteDownError as e:
+        vehicle_prices = [(SITE_ERROR_LABELS[site], f"Skipped: {e}")]
+        SiteHealth.record_skip(spec["name"], f"{site} prices", str(e))
+
+    except Exception as e:
+        vehicle_prices = [(SITE_ERROR_LABELS[site], str(e))]
+        Metrics.inc("extraction_errors_total", extractor="prices", vehicle=spec["key"], site=site)
+        SiteHealth.record_skip(
+            spec["name"],
+            f"{site} prices",
+            f"Failed after {const['RETRY']['vehicle_attempts']} attempts: {e}",
+        )
+
+    return vehicle_prices
+
+
+# ------------------------------------------
+# Get the hero image filename of one site, or the reason there is none
+# ------------------------------------------
+def get_hero_image(spec: dict, site: str, url: str) -> str:
+    image_url = get_hero_image_url(spec, site, url)
+    match = parse_img_filename(img_src=image_url)
+    return match.group(1) if match else image_url
+
+
+# ------------------------------------------
+# Get the hero image URL of one site, or the reason there is none
+# - The URL is what the image comparison downloads
+# ------------------------------------------
+def get_hero_image_url(spec: dict, site: str, url: str) -> str:
+    image_spec = spec[site]["hero_image"]
+
+    try:
+        SiteHealth.check(url)
+
+        img_src = call_with_retry(
+            partial(get_attribute, url, image_spec["xpath"], image_spec["attribute"]),
+            const["RETRY"]["vehicle_attempts"],
+            f"{spec['name']} {site} hero image",
+            "vehicle",
+            before_retry=WebDriverPool.forget_page,
+        )
+
+        # The image URL, when the source holds an image filename
+        if parse_img_filename(img_src=img_src):
+            vehicle_image = parse_img_url(img_src, url)
+
+        else:
+            vehicle_image = "No image filename found"
+
+    except SiteDownError as e:
+        vehicle_image = f"Skipped: {e}"
+        SiteHealth.record_skip(spec["name"], f"{site} hero image", str(e))
+
+    except Exception as e:
+        vehicle_image = str(e)
+        Metrics.inc("extraction_errors_total", extractor="hero_img", vehicle=spec["key"], site=site)
+
+    return vehicle_image
+
+
+# ------------------------------------------
+# Compile every spec locator once
+# - A malformed XPath fails the run at startup instead of mid-scrape,
+#   and the HTTP extractors reuse the compiled expressions
+# ------------------------------------------
+def compile_locators(specs: List[dict] = VEHICLE_SPECS) -> int:
+    xpaths = set()
+    for spec in specs:
+        for site in SITE_ERROR_LABELS:
+            prices_spec = spec[site]["prices"]
+            if prices_spec["strategy"] not in STRATEGIES:
+                raise ValueError(
+                    f"Unknown strategy '{prices_spec['strategy']}' for {spec['name']}."
+                )
+            for key in ("model_xpath", "price_xpath", "card_xpath", "carousel_xpath", "next_xpath"):
+                if prices_spec.get(key):
+                    xpaths.add(prices_spec[key])
+            xpaths.add(spec[site]["hero_image"]["xpath"])
+
+    for xpath in xpaths:
+        HttpFetcher.xpath(xpath)
+
+    return len(xpaths)
+
+
+def get_spec(key: str) -> dict:
+    return next(spec for spec in VEHICLE_SPECS if spec["key"] == key)
+
+
+# Test Functions - e.g. python src/vehicle_extraction.py EXPLORER
+if __name__ == "__main__":
+    vehicle_spec = get_spec(sys.argv[1] if len(sys.argv) > 1 else "EXPLORER")
+    key = vehicle_spec["key"]
+
+    print(get_prices(vehicle_spec, "manufacturer", const[f"{key}_MANUFACTURER_URL"]))
+    print(get_prices(vehicle_spec, "dealer", const[f"{key}_DEALER_URL"]))
+    print(get_hero_image(vehicle_spec, "manufacturer", const[f"{key}_MANUFACTURER_IMAGE_URL"]))
+    print(get_hero_image(vehicle_spec, "dealer", const[f"{key}_DEALER_IMAGE_URL"]))
+
+    WebDriverPool.close_all()
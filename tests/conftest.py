@@ -0,0 +1,8 @@
+# Built-in Packages
+import os
+import sys
+
+# Add the project root and src directories to sys.path, like main.py does
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root_dir)
+sys.path.append(os.path.join(root_dir, "src"))
@@ -0,0 +1,102 @@
+# 3rd Party Pacakges
+from lxml import html
+
+# Local Packages
+from classes.http_fetcher import HttpFetcher
+
+MODEL_XPATH = "//h3[@class='model']"
+PRICE_XPATH = "//span[@class='price']"
+
+
+def get_pairs(page: str) -> list:
+    pairs, _, _ = HttpFetcher.pair_elements(html.fromstring(page), MODEL_XPATH, PRICE_XPATH)
+    return [HttpFetcher.pair_text(model, price) for model, price in pairs]
+
+
+def test_pairs_cards():
+    page = """
+    <ul>
+      <li><h3 class="model">XL</h3><p><span class="price">$45,995</span></p></li>
+      <li><h3 class="model">XLT</h3><p><span class="price">$52,995</span></p></li>
+    </ul>
+    """
+    assert get_pairs(page) == [("XL", "$45,995"), ("XLT", "$52,995")]
+
+
+def test_card_without_price_keeps_later_pairs():
+    page = """
+    <ul>
+      <li><h3 class="model">XL</h3><p><span class="price">$45,995</span></p></li>
+      <li><h3 class="model">XLT</h3><p>Coming soon</p></li>
+      <li><h3 class="model">Lariat</h3><p><span class="price">$64,995</span></p></li>
+    </ul>
+    """
+    assert get_pairs(page) == [("XL", "$45,995"), ("XLT", ""), ("Lariat", "$64,995")]
+
+
+def test_price_nested_in_model_is_not_in_the_name():
+    page = """
+    <ul>
+      <li><h3 class="model">XL <span class="price">$45,995</span></h3></li>
+    </ul>
+    """
+    assert get_pairs(page) == [("XL", "$45,995")]
+
+
+MENU_LOCATORS = (
+    "//button[@class='category']",
+    "//div[@class='panel']",
+    ".//a[@class='model']",
+    ".//span[@class='price']",
+)
+
+
+def read_menu(page: str) -> list:
+    return HttpFetcher.read_menu(html.fromstring(page), *MENU_LOCATORS)
+
+
+def test_menu_reads_panels_of_their_categories():
+    page = """
+    <nav>
+      <button class="category" aria-controls="trucks">Trucks</button>
+      <div class="panel"><button class="category">Cars</button>
+        <div><a class="model">Mustang<span class="sr-only"> (opens a new tab)</span></a>
+          <span class="price">$45,995 <sup aria-hidden="true">1</sup></span></div>
+      </div>
+      <div class="panel" id="trucks">
+        <div><a class="model">Ranger</a><span class="price">$39,995</span></div>
+      </div>
+    </nav>
+    """
+    assert read_menu(page) == [
+        ["Trucks", [["Ranger", "$39,995"]]],
+        ["Cars", [["Mustang", "$45,995"]]],
+    ]
+
+
+def test_menu_category_without_panel_is_clicked():
+    # As many categories as panels, but nothing ties them together
+    page = """
+    <nav>
+      <button class="category">Cars</button>
+      <button class="category">Trucks</button>
+      <div class="panel"><a class="model">Mustang</a><span class="price">$45,995</span></div>
+      <div class="panel"><a class="model">Ranger</a><span class="price">$39,995</span></div>
+    </nav>
+    """
+    assert read_menu(page) == [["Cars", None], ["Trucks", None]]
+
+
+def test_card_counts_are_the_models_and_prices_found():
+    page = """
+    <ul>
+      <li class="card"><h3 class="model">XL</h3></li>
+      <li class="card"><h3 class="model">XLT</h3></li>
+    </ul>
+    """
+    document = html.fromstring(page)
+    _, model_count, price_count = HttpFetcher.pair_elements(
+        document, ".//h3[@class='model']", ".//span[@class='price']", "//li[@class='card']"
+    )
+    # No price at all is the same "not found" as without cards
+    assert (model_count, price_count) == (2, 0)
@@ -0,0 +1,87 @@
+# 3rd Party Pacakges
+import pytest
+
+# Built-in Packages
+from datetime import datetime, timedelta
+import json
+
+# Local Packages
+from utilities.constants import constants as const
+from utilities.utilities import get_unchanged_note
+from classes.fingerprint_store import TIMESTAMP_FORMAT, FingerprintStore
+from classes.snapshot_store import SnapshotStore
+
+MFR_URL = "https://www.ford.ca/cars/mustang/"
+DEALER_URL = "https://fordtodealers.ca/mustang/"
+KEY = "//h3|//span"
+PRICES = [("GT", "$55,995"), ("EcoBoost", "$39,995")]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Start a run on a fingerprint file written by an earlier run."""
+    path = tmp_path / "fingerprints.json"
+    monkeypatch.setitem(const, "INCREMENTAL_RUNS", True)
+    monkeypatch.setitem(const, "FINGERPRINT_FILE", str(path))
+    monkeypatch.setitem(const, "FINGERPRINT_MAX_AGE_HOURS", 168)
+    monkeypatch.setitem(const, "RUN_MODE", "live")
+    SnapshotStore.start()
+
+    def start(hours_ago: float = 1, changed_at: str = "2026-01-05 08:00") -> None:
+        # The earlier run, extracted hours_ago and unchanged since changed_at
+        FingerprintStore.start()
+        FingerprintStore.save(MFR_URL, KEY, "abc", PRICES)
+        FingerprintStore.finish()
+
+        extracted_at = datetime.now() - timedelta(hours=hours_ago)
+        entries = json.loads(path.read_text(encoding="utf-8"))
+        for entry in entries.values():
+            entry["extracted_at"] = extracted_at.strftime(TIMESTAMP_FORMAT)
+            entry["changed_at"] = changed_at
+        path.write_text(json.dumps(entries), encoding="utf-8")
+        FingerprintStore.start()
+
+    yield start
+    monkeypatch.undo()
+    FingerprintStore.start()
+
+
+def test_matching_fingerprint_reuses_the_stored_prices(store):
+    store()
+
+    assert FingerprintStore.lookup(MFR_URL, KEY, "abc") == PRICES
+    assert FingerprintStore.reuse_count == 1
+    assert FingerprintStore.get_unchanged_since(MFR_URL) == "2026-01-05 08:00"
+
+
+def test_changed_fingerprint_extracts_again(store):
+    store()
+
+    assert FingerprintStore.lookup(MFR_URL, KEY, "def") is None
+    assert FingerprintStore.lookup(MFR_URL, "//h2|//span", "abc") is None
+    assert FingerprintStore.get_unchanged_since(MFR_URL) is None
+
+
+def test_stored_prices_expire_after_max_age(store):
+    store(hours_ago=169)
+
+    assert FingerprintStore.lookup(MFR_URL, KEY, "abc") is None
+
+
+def test_save_keeps_changed_at_of_an_unchanged_page(store):
+    store(hours_ago=169)
+
+    # Expired, so extracted again - the page itself has not changed
+    FingerprintStore.save(MFR_URL, KEY, "abc", PRICES)
+    assert FingerprintStore.get_unchanged_since(MFR_URL) == "2026-01-05 08:00"
+
+    FingerprintStore.save(MFR_URL, KEY, "def", PRICES)
+    FingerprintStore.clear()
+    assert FingerprintStore.get_unchanged_since(MFR_URL) is None
+
+
+def test_unchanged_note(store):
+    store()
+    FingerprintStore.lookup(MFR_URL, KEY, "abc")
+
+    assert get_unchanged_note(MFR_URL, DEALER_URL) == "Manufacturer unchanged since 2026-01-05 08:00"
@@ -0,0 +1,129 @@
+# 3rd Party Pacakges
+import pytest
+
+# Built-in Packages
+from functools import partial
+import threading
+import time
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.host_scheduler import HostScheduler, TokenBucket
+
+FORD = "https://www.ford.ca/"
+DEALER = "https://fordtodealers.ca/"
+
+real_sleep = time.sleep
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setitem(
+        const,
+        "HOST_LIMITS",
+        {
+            "www.ford.ca": {"max_concurrency": 2, "requests_per_second": 1, "burst": 1},
+            "fordtodealers.ca": {"max_concurrency": 1, "requests_per_second": 1, "burst": 1},
+            "default": {"max_concurrency": 1, "requests_per_second": 1, "burst": 1},
+        },
+    )
+    monkeypatch.setitem(const, "MAX_BROWSER_WORKERS", 3)
+    HostScheduler.clear()
+    yield
+    HostScheduler.clear()
+
+
+def test_map_runs_jobs_concurrently_in_job_order():
+    # Both jobs must be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def job(name):
+        barrier.wait()
+        return name
+
+    assert HostScheduler.map([(FORD, lambda: job("Mustang")), (FORD, lambda: job("Bronco"))]) == [
+        "Mustang",
+        "Bronco",
+    ]
+
+
+def test_map_gives_none_for_a_failed_job():
+    def fail():
+        raise RuntimeError("page structure changed")
+
+    assert HostScheduler.map([(FORD, fail), (FORD, lambda: "Bronco")]) == [None, "Bronco"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake_clock)
+    monkeypatch.setattr(time, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def test_token_bucket_allows_a_burst_then_the_rate(clock):
+    bucket = TokenBucket(rate=0.5, burst=2)
+
+    assert [bucket.take() for _ in range(4)] == [0.0, 0.0, 2.0, 4.0]
+
+    # Refills at the rate, up to the burst
+    clock.now += 100
+    assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 2.0]
+
+
+def test_throttle_waits_for_the_host_bucket(clock):
+    for _ in range(3):
+        with HostScheduler.throttle(FORD):
+            pass
+    with HostScheduler.throttle(DEALER):
+        pass
+
+    # ford.ca: burst 1 at 1 request per second; fordtodealers.ca has its own bucket
+    assert clock.sleeps == [1.0, 1.0]
+    assert HostScheduler.throttled_seconds == {"www.ford.ca": 2.0}
+
+
+def test_jobs_stay_within_each_host_concurrency():
+    running = {"www.ford.ca": 0, "fordtodealers.ca": 0}
+    highest = dict(running)
+    lock = threading.Lock()
+
+    def job(host):
+        with lock:
+            running[host] += 1
+            highest[host] = max(highest[host], running[host])
+        real_sleep(0.02)
+        with lock:
+            running[host] -= 1
+
+    HostScheduler.run(
+        [(FORD, partial(job, "www.ford.ca")) for _ in range(6)]
+        + [(DEALER, partial(job, "fordtodealers.ca")) for _ in range(6)]
+    )
+    assert highest["www.ford.ca"] <= 2
+    assert highest["fordtodealers.ca"] <= 1
+
+
+def test_hosts_take_turns(monkeypatch):
+    monkeypatch.setitem(const, "MAX_BROWSER_WORKERS", 1)
+    order = []
+
+    HostScheduler.run(
+        [(FORD, partial(order.append, f"ford {index}")) for index in range(3)]
+        + [(DEALER, partial(order.append, f"dealer {index}")) for index in range(2)]
+    )
+    assert order == ["ford 0", "dealer 0", "ford 1", "dealer 1", "ford 2"]
@@ -0,0 +1,42 @@
+# 3rd Party Pacakges
+from lxml import html
+import pytest
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.http_fetcher import HttpFetcher
+
+URL = "https://www.ford.ca/cars/mustang/"
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """The documents _fetch() returns, in order, with None for a failure."""
+    results = []
+
+    def fetch(url):
+        return results.pop(0)
+
+    monkeypatch.setitem(const, "HTTP_FIRST_HOSTS", ["www.ford.ca"])
+    monkeypatch.setitem(const, "JAVASCRIPT_URLS", [])
+    monkeypatch.setattr(HttpFetcher, "_fetch", fetch)
+    HttpFetcher.clear()
+    yield results
+    HttpFetcher.clear()
+
+
+def test_failed_fetch_is_fetched_again(fetches):
+    document = html.fromstring("<p>Mustang</p>")
+    fetches.extend([None, document])
+
+    assert HttpFetcher.get_document(URL) is None
+    assert HttpFetcher.get_document(URL) is document
+
+
+def test_document_is_fetched_once(fetches):
+    document = html.fromstring("<p>Mustang</p>")
+    fetches.append(document)
+
+    assert HttpFetcher.get_document(URL) is document
+    assert HttpFetcher.get_document(URL) is document
+    assert not fetches
@@ -0,0 +1,103 @@
+# 3rd Party Pacakges
+from PIL import Image
+import pytest
+
+# Built-in Packages
+from io import BytesIO
+import json
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.http_fetcher import HttpFetcher
+from classes.image_comparator import ImageComparator
+
+URL = "https://www.ford.ca/content/dam/mustang-gt.jpg"
+
+
+def get_image(flip: bool = False, image_format: str = "PNG", size=(90, 60)) -> bytes:
+    """A horizontal gradient, reversed when flipped."""
+    image = Image.new("L", size)
+    for x in range(size[0]):
+        shade = 255 - x * 255 // size[0] if flip else x * 255 // size[0]
+        for y in range(size[1]):
+            image.putpixel((x, y), shade)
+    content = BytesIO()
+    image.convert("RGB").save(content, image_format)
+    return content.getvalue()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        const,
+        "IMAGE_COMPARISON",
+        {**const["IMAGE_COMPARISON"], "cache_dir": str(tmp_path), "cache_max_mb": 1},
+    )
+    ImageComparator.load_index()
+    yield tmp_path
+    ImageComparator.load_index()
+
+
+def test_same_photo_in_another_format_and_size_matches():
+    png_hash = ImageComparator.get_hash(get_image())
+    jpeg_hash = ImageComparator.get_hash(get_image(image_format="JPEG", size=(180, 120)))
+    flipped_hash = ImageComparator.get_hash(get_image(flip=True))
+
+    max_distance = const["IMAGE_COMPARISON"]["max_distance"]
+    assert ImageComparator.get_distance(png_hash, jpeg_hash) <= max_distance
+    assert ImageComparator.get_distance(png_hash, flipped_hash) > max_distance
+
+
+def test_hash_of_bytes_that_are_not_an_image():
+    assert ImageComparator.get_hash(b"<html>Not found</html>") is None
+
+
+def test_distance_counts_differing_bits():
+    assert ImageComparator.get_distance("ff00", "0f00") == 4
+    assert ImageComparator.get_distance("ff00", "ff00") == 0
+
+
+def test_least_recently_used_images_are_removed(cache, monkeypatch):
+    monkeypatch.setitem(const["IMAGE_COMPARISON"], "cache_max_mb", 250 / (1024 * 1024))
+    index = {}
+    for key, used_at in (("old", "2026-01-01T00:00:00"), ("new", "2026-03-01T00:00:00"), ("mid", "2026-02-01T00:00:00")):
+        (cache / key).write_bytes(b"x" * 100)
+        index[key] = {"url": key, "etag": None, "last_modified": None, "size": 100, "used_at": used_at}
+    (cache / "index.json").write_text(json.dumps(index), encoding="utf-8")
+
+    ImageComparator.load_index()
+    ImageComparator.save_index()
+
+    assert not (cache / "old").exists()
+    assert (cache / "mid").exists() and (cache / "new").exists()
+    assert set(json.loads((cache / "index.json").read_text(encoding="utf-8"))) == {"mid", "new"}
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_unchanged_image_is_hashed_from_the_cache(cache, monkeypatch):
+    content = get_image()
+    requests = []
+    responses = [FakeResponse(200, content, {"ETag": '"v1"'}), FakeResponse(304)]
+
+    def get(url, headers=None):
+        requests.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(HttpFetcher, "get", get)
+    ImageComparator.reuse_count = 0
+
+    downloaded_hash = ImageComparator.get_image_hash(URL)
+    reused_hash = ImageComparator.get_image_hash(URL)
+
+    assert requests == [{}, {"If-None-Match": '"v1"'}]
+    assert reused_hash == downloaded_hash == ImageComparator.get_hash(content)
+    assert ImageComparator.reuse_count == 1
@@ -0,0 +1,67 @@
+# 3rd Party Pacakges
+import pandas as pd
+import pytest
+
+# Local Packages
+from classes.vehicle import Vehicle
+from utilities.price_parsing import format_prices, parse_prices
+
+
+@pytest.mark.parametrize(
+    "text, cents",
+    [
+        ("$45,995", 4599500),
+        ("$45,995.50", 4599550),
+        ("Starting at $45,995 1", 4599500),
+        ("MSRP $45,995*", 4599500),
+        ("$45,995¹", 4599500),
+        ("À partir de 45 995,00 $", 4599500),
+        ("45 995 $", 4599500),
+        ("$1,045,995", 104599500),
+        ("$45995", 4599500),
+        ("45,995", 4599500),
+        # A footnote digit stuck to the price by innerText
+        ("$45,9951", 4599500),
+        ("$31,2111", 3121100),
+    ],
+)
+def test_parse_prices(text, cents):
+    parsed = parse_prices(pd.Series([text]))
+    assert parsed["cents"].iloc[0] == cents
+    assert parsed["parse_status"].iloc[0] == "ok"
+
+
+@pytest.mark.parametrize(
+    "text, parse_status",
+    [
+        (None, "empty"),
+        ("", "empty"),
+        ("Message: no such element", "invalid"),
+        ("Call for price", "invalid"),
+        # "." before 3 digits is not a decimal point
+        ("$45.995", "invalid"),
+        ("45.995 $", "invalid"),
+    ],
+)
+def test_parse_prices_without_price(text, parse_status):
+    parsed = parse_prices(pd.Series([text], dtype=object))
+    assert pd.isna(parsed["cents"].iloc[0])
+    assert parsed["parse_status"].iloc[0] == parse_status
+
+
+def test_format_prices():
+    cents = pd.Series([4599500, 4599550, 99900], dtype="Int64")
+    assert format_prices(cents).tolist() == ["$45,995", "$45,995.50", "$999"]
+
+
+@pytest.mark.parametrize(
+    "text, price",
+    [
+        ("Starting at $45,995 1", 45995),
+        ("45 995,50 $", 45995.5),
+        ("Call for price", None),
+        (None, None),
+    ],
+)
+def test_vehicle_clean_price(text, price):
+    assert Vehicle(None, None).clean_price(text) == price
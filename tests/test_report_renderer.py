@@ -0,0 +1,61 @@
+# 3rd Party Pacakges
+import pandas as pd
+
+# Local Packages
+from classes.report_renderer import HIDDEN_COLUMNS, ReportRenderer
+
+MANUFACTURER_URL = "https://www.ford.ca/trucks/f150/"
+DEALER_URL = "https://www.fordtodealers.ca/ford-f-150/"
+
+
+def test_render_report():
+    vehicle_df = pd.DataFrame(
+        {
+            "Model": ["XL <script>alert(1)</script>", "Lariat"],
+            "Ford Manufacturer Price": ["$45,995", "$65,995"],
+            "Ford Dealer Price": ["$45,995", "$64,995"],
+            "Price Comparison": ["Match", "Mismatch"],
+            "manufacturer_cents": [4599500, 6599500],
+            "dealer_cents": [4599500, 6499500],
+        }
+    )
+    images_df = pd.DataFrame(
+        {
+            "Model": ["F-150"],
+            "Ford Manufacturer Image": ["f150-xl.jpg"],
+            "Ford Dealer Image": ["f150-xl.jpg"],
+            "Ford Manufacturer Image Source": ["https://www.ford.ca/f150-xl.jpg"],
+            "Ford Dealer Image Source": ["https://www.fordtodealers.ca/f150-xl.jpg"],
+            "Image Comparison": ["Match"],
+        }
+    )
+    skipped = [("Ford Bronco®", "Prices", "Circuit open for www.ford.ca")]
+
+    report = ReportRenderer.render(
+        [("F-150®", vehicle_df, MANUFACTURER_URL, DEALER_URL)], images_df, None, skipped
+    )
+
+    # Scraped text is escaped in the HTML
+    assert "<script>alert(1)</script>" not in report.html
+    assert "XL &lt;script&gt;alert(1)&lt;/script&gt;" in report.html
+
+    for column in HIDDEN_COLUMNS:
+        if column in vehicle_df or column in images_df:
+            assert column not in report.html
+            assert column not in report.text
+    assert "4599500" not in report.html
+
+    assert "SKIPPED VEHICLES" in report.html
+    assert "Circuit open for www.ford.ca" in report.html
+    assert report.has_skipped and report.has_mismatch
+    assert report.get_subject("Price Audit") == "[Mismatch Found] - [Vehicles Skipped] -  Price Audit"
+
+    # The plain text part carries the same data, unescaped
+    assert "SKIPPED VEHICLES" in report.text
+    assert "Ford Bronco® | Prices | Circuit open for www.ford.ca" in report.text
+    assert "F-150® PRICES" in report.text
+    assert f"Manufacturer: {MANUFACTURER_URL}" in report.text
+    assert "Lariat | $65,995 | $64,995 | Mismatch" in report.text
+    assert "XL <script>alert(1)</script> | $45,995 | $45,995 | Match" in report.text
+    assert "F-150 | f150-xl.jpg | f150-xl.jpg | Match" in report.text
+    assert "<td>" not in report.text
@@ -0,0 +1,146 @@
+# 3rd Party Pacakges
+import pytest
+
+# Built-in Packages
+import time
+
+# Local Packages
+from utilities.constants import constants as const
+from utilities.retry import call_with_retry
+from classes.site_health import SiteDownError, SiteHealth
+
+URL = "https://www.ford.ca/trucks/f150/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake_clock)
+    monkeypatch.setitem(const, "CIRCUIT_BREAKER", {"failure_threshold": 3, "reset_seconds": 120})
+    SiteHealth.clear()
+    yield fake_clock
+    SiteHealth.clear()
+
+
+def fail(times: int) -> None:
+    for _ in range(times):
+        SiteHealth.record_failure(URL, TimeoutError("timed out"))
+
+
+def test_circuit_opens_at_the_threshold(clock):
+    fail(2)
+    SiteHealth.check(URL)
+
+    fail(1)
+    with pytest.raises(SiteDownError, match="after 3 failed requests"):
+        SiteHealth.check(URL)
+    assert SiteHealth.is_open("www.ford.ca")
+
+    # Other hosts are not affected
+    SiteHealth.check("https://fordtodealers.ca/")
+
+
+def test_circuit_stays_open_until_reset_seconds(clock):
+    fail(3)
+    clock.advance(119)
+    with pytest.raises(SiteDownError):
+        SiteHealth.check(URL)
+
+
+def test_half_open_lets_one_trial_through(clock):
+    fail(3)
+    clock.advance(120)
+
+    SiteHealth.check(URL)
+    with pytest.raises(SiteDownError):
+        SiteHealth.check(URL)
+
+
+def test_half_open_success_closes_the_circuit(clock):
+    fail(3)
+    clock.advance(120)
+    SiteHealth.check(URL)
+    SiteHealth.record_success(URL)
+
+    assert not SiteHealth.is_open("www.ford.ca")
+    SiteHealth.check(URL)
+
+    # The failure count starts over
+    fail(2)
+    SiteHealth.check(URL)
+
+
+def test_half_open_failure_opens_for_another_period(clock):
+    fail(3)
+    clock.advance(120)
+    SiteHealth.check(URL)
+    fail(1)
+
+    clock.advance(119)
+    with pytest.raises(SiteDownError):
+        SiteHealth.check(URL)
+    clock.advance(1)
+    SiteHealth.check(URL)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    monkeypatch.setitem(const, "RETRY", {**const["RETRY"], "base_delay": 1, "max_delay": 4})
+    return delays
+
+
+def test_retry_until_success(sleeps):
+    calls = []
+    retries = []
+
+    def func():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TimeoutError("timed out")
+        return "ok"
+
+    result = call_with_retry(
+        func, 3, "Mustang prices", "vehicle", before_retry=lambda: retries.append(1)
+    )
+    assert result == "ok"
+    assert len(calls) == 3
+    assert len(retries) == 2
+    assert len(sleeps) == 2 and all(0 <= delay <= 4 for delay in sleeps)
+
+
+def test_retry_raises_after_the_last_attempt(sleeps):
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise TimeoutError("timed out")
+
+    with pytest.raises(TimeoutError):
+        call_with_retry(func, 3, "Mustang prices", "vehicle")
+    assert len(calls) == 3
+
+
+def test_site_down_is_never_retried(sleeps):
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise SiteDownError("www.ford.ca is unavailable")
+
+    with pytest.raises(SiteDownError):
+        call_with_retry(func, 3, "Mustang prices", "vehicle")
+    assert len(calls) == 1
+    assert not sleeps
@@ -0,0 +1,131 @@
+# 3rd Party Pacakges
+import pytest
+
+# Built-in Packages
+import json
+import os
+
+# Local Packages
+from utilities.constants import constants as const
+from navigation_menu import MFG_NAV_LOCATORS, get_nav_prices
+from classes.http_fetcher import HttpFetcher
+from classes.page_cache import PageCache
+from classes.page_readiness import PageReadiness
+from classes.snapshot_store import SnapshotStore
+from classes.web_driver_pool import WebDriverPool
+
+URL = "https://www.ford.ca/"
+
+MENU_BUTTON = '<li class="main-nav-item no-float-md flyout-item-wrap"><button>Vehicles</button></li>'
+PANEL_CLASS = "vehicle-segment-layout fgx-brand-global-container-pad segment-menu-item-container"
+
+
+def get_category(name: str) -> str:
+    return (
+        '<button class="bri-nav__list-link segment-anchor-trigger fgx-btn">'
+        f'<span class="link-text" data-snapshot-text="{name}">{name}</span></button>'
+    )
+
+
+def get_vehicle(model: str, price: str, attributes: str = "") -> str:
+    return (
+        f'<div class="vehicle"><a class="veh-item-inline" {attributes}>{model}</a>'
+        f'<span data-pricing-template="price" {attributes}>{price}</span></div>'
+    )
+
+
+# Menu as recorded before anything is clicked: Cars is read from the DOM,
+# the Trucks prices only load once Trucks is opened
+MENU_PAGE = f"""
+<html><body>
+  {MENU_BUTTON}
+  <div class="{PANEL_CLASS}">
+    {get_category("Cars")}
+    {get_vehicle("Mustang®", "Starting at $45,995 1")}
+    {get_vehicle("Mustang® Mach-E®", "$52,995")}
+  </div>
+  <div class="{PANEL_CLASS}">
+    {get_category("Trucks")}
+    {get_vehicle("Ranger", "")}
+  </div>
+</body></html>
+"""
+
+# Trucks opened, the state the click fallback reads
+OPEN_ATTRIBUTES = 'data-snapshot-displayed="1" data-snapshot-inner-text="{}"'
+OPEN_PAGE = f"""
+<html><body>
+  {MENU_BUTTON}
+  <div class="{PANEL_CLASS}">
+    {get_category("Cars")}
+  </div>
+  <div class="{PANEL_CLASS} open">
+    {get_category("Trucks")}
+    <div class="vehicle">
+      <a class="veh-item-inline" {OPEN_ATTRIBUTES.format("Ranger")}>Ranger</a>
+      <span data-pricing-template="price" {OPEN_ATTRIBUTES.format("$39,995")}>$39,995</span>
+    </div>
+  </div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def replay(tmp_path, monkeypatch):
+    """A recorded run holding the given page states of URL, replayed."""
+
+    def start(states: dict) -> None:
+        run_dir = tmp_path / "run"
+        (run_dir / "pages").mkdir(parents=True)
+        pages = {}
+        for state, page_source in states.items():
+            file_name = f"menu-{state}.html"
+            (run_dir / "pages" / file_name).write_text(page_source, encoding="utf-8")
+            pages[str(state)] = file_name
+        (run_dir / "index.json").write_text(
+            json.dumps({"pages": {URL: pages}, "http": {}}), encoding="utf-8"
+        )
+
+        monkeypatch.setitem(const, "RUN_MODE", "replay")
+        monkeypatch.setitem(const, "SNAPSHOT_DIR", str(tmp_path))
+        monkeypatch.setitem(const, "REPLAY_RUN", "run")
+        SnapshotStore.start()
+
+    yield start
+
+    WebDriverPool.close_all()
+    for cache in (HttpFetcher, PageCache, PageReadiness):
+        cache.clear()
+    monkeypatch.undo()
+    SnapshotStore.start()
+
+
+def test_replays_menu_extraction(replay, monkeypatch):
+    monkeypatch.setitem(const, "NAVIGATION_EXTRACTION", "menu")
+    replay({0: MENU_PAGE, 2: OPEN_PAGE})
+
+    assert get_nav_prices(URL, MFG_NAV_LOCATORS, "Ford.ca Error") == [
+        ("Cars", "Mustang®", "Starting at $45,995 1"),
+        ("Cars", "Mustang® Mach-E®", "$52,995"),
+        ("Trucks", "Ranger", "$39,995"),
+    ]
+
+
+def test_replays_click_extraction(replay, monkeypatch):
+    monkeypatch.setitem(const, "NAVIGATION_EXTRACTION", "click")
+    replay({0: MENU_PAGE, 3: OPEN_PAGE})
+
+    # Cars is clicked first (state 2) and shows no vehicles, then Trucks
+    assert get_nav_prices(URL, MFG_NAV_LOCATORS, "Ford.ca Error") == [
+        ("Trucks", "Ranger", "$39,995"),
+    ]
+
+
+def test_navigation_failure_is_an_error_row(replay, monkeypatch):
+    monkeypatch.setitem(const, "NAVIGATION_EXTRACTION", "menu")
+    replay({})
+
+    # The page was not recorded, so loading it fails
+    [row] = get_nav_prices(URL, MFG_NAV_LOCATORS, "Ford.ca Error")
+    assert row[:2] == ("Ford.ca Error", "Ford.ca Error")
+    assert row[2]
@@ -0,0 +1,109 @@
+# 3rd Party Pacakges
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+# Built-in Packages
+import threading
+
+# Local Packages
+from utilities.constants import constants as const
+from classes.web_driver_pool import WebDriverPool
+
+
+class FakeDriver:
+    """Counts the session checks (current_url) and can die."""
+
+    def __init__(self):
+        self.alive = True
+        self.checks = 0
+        self.quit_count = 0
+
+    @property
+    def current_url(self) -> str:
+        self.checks += 1
+        if not self.alive:
+            raise WebDriverException("invalid session id")
+        return "about:blank"
+
+    def get(self, url: str) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.quit_count += 1
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """The drivers the pool starts, in order."""
+    started = []
+
+    def create_driver():
+        started.append(FakeDriver())
+        return started[-1]
+
+    monkeypatch.setitem(const, "MAX_BROWSER_WORKERS", 2)
+    monkeypatch.setitem(const, "WEBDRIVER_MAX_PAGE_LOADS", 3)
+    monkeypatch.setattr(WebDriverPool, "create_driver", create_driver)
+    yield started
+    WebDriverPool.close_all()
+
+
+def test_checkout_and_return_skip_the_session_check(drivers):
+    for _ in range(3):
+        with WebDriverPool.checkout():
+            WebDriverPool.get_driver().get("https://www.ford.ca/")
+
+    [driver] = drivers
+    assert driver.checks == 0
+
+
+def test_pool_is_bounded(drivers):
+    first = WebDriverPool.acquire()
+    second = WebDriverPool.acquire()
+
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(WebDriverPool.acquire()))
+    waiter.start()
+    waiter.join(0.2)
+    assert not acquired and len(drivers) == 2
+
+    WebDriverPool.release(first)
+    waiter.join(5)
+    assert acquired == [first]
+
+    WebDriverPool.release(second)
+    WebDriverPool.release(acquired[0])
+
+
+def test_driver_is_recycled_after_max_page_loads(drivers):
+    pooled_driver = WebDriverPool.acquire()
+    for _ in range(3):
+        pooled_driver.get("https://www.ford.ca/")
+    WebDriverPool.release(pooled_driver)
+
+    assert drivers[0].quit_count == 1
+    replacement = WebDriverPool.acquire()
+    assert replacement.driver is drivers[1]
+    WebDriverPool.release(replacement)
+
+
+def test_dead_driver_of_a_failed_job_is_discarded(drivers):
+    with pytest.raises(RuntimeError):
+        with WebDriverPool.checkout():
+            WebDriverPool.get_driver()
+            drivers[0].alive = False
+            raise RuntimeError("page structure changed")
+
+    assert drivers[0].quit_count == 1
+    with WebDriverPool.checkout():
+        assert WebDriverPool.get_driver().driver is drivers[1]
+
+
+def test_retry_replaces_a_dead_driver(drivers):
+    with WebDriverPool.checkout():
+        WebDriverPool.get_driver()
+        drivers[0].alive = False
+
+        WebDriverPool.forget_page()
+        assert WebDriverPool.get_driver().driver is drivers[1]
+    assert drivers[0].quit_count == 1